@@ -0,0 +1,347 @@
+"""Benchmark `adjust_video_duration` against the previous multi-pass implementation.
+
+The previous implementation probed the video with ffprobe up to four times, looped
+it through a concat list, then trimmed it with a second ffmpeg run. The current one
+probes once and runs a single ffmpeg command. Both adjust synthetic 1080p60 clips
+(generated with ffmpeg's testsrc2) the way the API does (min 60s, max 180s).
+Requires ffmpeg and ffprobe.
+
+Usage:
+    python benchmarks/duration_adjustment.py [--repeats 3]
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+
+from manim_generator.utils.video import adjust_video_duration, get_video_duration
+
+logger = logging.getLogger(__name__)
+
+# (label, clip seconds, min duration, max duration)
+CASES = [
+    ("extend 12s->60s", 12.0, 60.0, 180.0),
+    ("trim 200s->180s", 200.0, 60.0, 180.0),
+    ("keep 90s", 90.0, 60.0, 180.0),
+]
+
+
+def legacy_get_video_duration(video_path: str) -> float | None:
+    """The ffprobe-based prober used by the previous implementation."""
+    try:
+        command = [
+            "ffprobe",
+            "-v",
+            "error",
+            "-show_entries",
+            "format=duration",
+            "-of",
+            "json",
+            video_path,
+        ]
+        result = subprocess.run(command, capture_output=True, text=True, check=True, timeout=30)
+        return float(json.loads(result.stdout)["format"]["duration"])
+    except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError, ValueError) as e:
+        logger.error(f"Error getting video duration: {e}")
+        return None
+
+
+def legacy_extend_video_to_duration(
+    input_path: str, output_path: str, target_duration: float
+) -> bool:
+    """
+    Extend a video to a target duration by looping it using ffmpeg.
+
+    Args:
+        input_path: Path to input video file
+        output_path: Path to output video file
+        target_duration: Target duration in seconds
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        # Get current duration
+        current_duration = legacy_get_video_duration(input_path)
+        if current_duration is None:
+            logger.error("Could not determine input video duration")
+            return False
+
+        if current_duration >= target_duration:
+            # Video is already long enough, just copy it
+            shutil.copy2(input_path, output_path)
+            logger.info(f"Video already {current_duration:.2f}s, copying as-is")
+            return True
+
+        # Calculate how many times we need to loop
+        loops_needed = int(target_duration / current_duration) + 1
+        logger.info(
+            f"Extending video from {current_duration:.2f}s to {target_duration:.2f}s "
+            f"(looping {loops_needed} times)"
+        )
+
+        # Create a temporary concat file
+        concat_file = output_path + ".concat.txt"
+        with open(concat_file, "w", encoding="utf-8") as f:
+            abs_input = os.path.abspath(input_path)
+            for _ in range(loops_needed):
+                f.write(f"file '{abs_input}'\n")
+
+        # Use ffmpeg to concatenate (loop) the video
+        command = [
+            "ffmpeg",
+            "-f",
+            "concat",
+            "-safe",
+            "0",
+            "-i",
+            concat_file,
+            "-c",
+            "copy",
+            output_path,
+        ]
+
+        result = subprocess.run(
+            command,
+            capture_output=True,
+            text=True,
+            timeout=300,  # 5 minute timeout
+        )
+
+        # Clean up concat file
+        try:
+            os.remove(concat_file)
+        except Exception:
+            pass
+
+        if result.returncode != 0:
+            logger.error(f"Error extending video: {result.stderr}")
+            return False
+
+        # Trim to exact target duration if needed
+        final_duration = legacy_get_video_duration(output_path)
+        if final_duration and final_duration > target_duration:
+            return legacy_trim_video_to_duration(output_path, output_path, target_duration)
+
+        return True
+    except Exception as e:
+        logger.exception(f"Error extending video: {e}")
+        return False
+
+
+def legacy_trim_video_to_duration(
+    input_path: str, output_path: str, target_duration: float
+) -> bool:
+    """
+    Trim a video to a target duration using ffmpeg.
+
+    Args:
+        input_path: Path to input video file
+        output_path: Path to output video file
+        target_duration: Target duration in seconds
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        command = [
+            "ffmpeg",
+            "-i",
+            input_path,
+            "-t",
+            str(target_duration),
+            "-c",
+            "copy",
+            "-y",  # Overwrite output file
+            output_path,
+        ]
+
+        result = subprocess.run(
+            command,
+            capture_output=True,
+            text=True,
+            timeout=300,  # 5 minute timeout
+        )
+
+        if result.returncode != 0:
+            logger.error(f"Error trimming video: {result.stderr}")
+            return False
+
+        logger.info(f"Trimmed video to {target_duration:.2f}s")
+        return True
+    except Exception as e:
+        logger.exception(f"Error trimming video: {e}")
+        return False
+
+
+def legacy_adjust_video_duration(
+    video_path: str, min_duration: float | None = None, max_duration: float | None = None
+) -> str | None:
+    """
+    Adjust video duration to be within min_duration and max_duration.
+
+    Args:
+        video_path: Path to the video file
+        min_duration: Minimum duration in seconds (extend if shorter)
+        max_duration: Maximum duration in seconds (trim if longer)
+
+    Returns:
+        str: Path to adjusted video (may be same as input if no adjustment needed), or None if error
+    """
+    if min_duration is None and max_duration is None:
+        return video_path
+
+    current_duration = legacy_get_video_duration(video_path)
+    if current_duration is None:
+        logger.error("Could not determine video duration")
+        return None
+
+    # Determine target duration (respect max if both are set)
+    target_duration = min_duration
+    if max_duration and min_duration:
+        # If both are set, use min but don't exceed max
+        target_duration = min(min_duration, max_duration)
+    elif max_duration and not min_duration:
+        # Only max is set, use current duration if it's already within limit
+        if current_duration <= max_duration:
+            return video_path
+        target_duration = max_duration  # noqa: F841 (kept verbatim)
+
+    needs_adjustment = False
+    if min_duration and current_duration < min_duration:
+        needs_adjustment = True
+        logger.info(
+            f"Video duration {current_duration:.2f}s is shorter than minimum {min_duration:.2f}s"
+        )
+    if max_duration and current_duration > max_duration:
+        needs_adjustment = True
+        logger.info(
+            f"Video duration {current_duration:.2f}s is longer than maximum {max_duration:.2f}s"
+        )
+
+    if not needs_adjustment:
+        return video_path
+
+    # Create temporary output path
+    base, ext = os.path.splitext(video_path)
+    temp_output = f"{base}_adjusted{ext}"
+
+    # Extend if too short (but don't exceed max_duration if set)
+    if min_duration and current_duration < min_duration:
+        extend_to = min_duration
+        if max_duration:
+            extend_to = min(min_duration, max_duration)
+
+        if not legacy_extend_video_to_duration(video_path, temp_output, extend_to):
+            return None
+
+        # Update paths for potential trimming
+        if os.path.exists(temp_output):
+            if video_path != temp_output:
+                try:
+                    os.remove(video_path)
+                except Exception:
+                    pass
+            video_path = temp_output
+            current_duration = legacy_get_video_duration(video_path)
+            if current_duration is None:
+                return None
+
+    # Trim if too long (after extension, might need trimming)
+    if max_duration and current_duration and current_duration > max_duration:
+        final_output = f"{base}_final{ext}"
+        if not legacy_trim_video_to_duration(video_path, final_output, max_duration):
+            return None
+        # Clean up intermediate file if it exists
+        if video_path != final_output and os.path.exists(video_path):
+            try:
+                os.remove(video_path)
+            except Exception:
+                pass
+        return final_output
+
+    return video_path
+
+
+def write_clip(path: str, seconds: float) -> None:
+    """Encode a 1080p60 test pattern clip with libx264."""
+    subprocess.run(
+        [
+            "ffmpeg",
+            "-y",
+            "-v",
+            "error",
+            "-f",
+            "lavfi",
+            "-i",
+            f"testsrc2=size=1920x1080:rate=60:duration={seconds}",
+            "-c:v",
+            "libx264",
+            "-preset",
+            "ultrafast",
+            "-pix_fmt",
+            "yuv420p",
+            path,
+        ],
+        check=True,
+    )
+
+
+def time_adjustment(adjust, clip: str, work_dir: str, min_duration, max_duration, repeats):
+    """Median wall time of adjusting a fresh copy of the clip, and the output duration."""
+    timings = []
+    duration = None
+    for idx in range(repeats):
+        video_path = os.path.join(work_dir, f"run_{idx}.mp4")
+        shutil.copy2(clip, video_path)
+        start = time.perf_counter()
+        output = adjust(video_path, min_duration, max_duration)
+        timings.append(time.perf_counter() - start)
+        # the legacy extend path trims in place, which ffmpeg refuses, so it can fail
+        duration = get_video_duration(output) if output else None
+        for name in os.listdir(work_dir):
+            os.remove(os.path.join(work_dir, name))
+    return statistics.median(timings), duration
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per measurement")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        work_dir = os.path.join(temp_dir, "work")
+        os.makedirs(work_dir)
+        print(f"{'case':<17} {'legacy':>9} {'current':>9} {'speedup':>8} {'durations':>16}")
+        for label, seconds, min_duration, max_duration in CASES:
+            clip = os.path.join(temp_dir, f"clip_{seconds:g}.mp4")
+            write_clip(clip, seconds)
+            legacy, legacy_duration = time_adjustment(
+                legacy_adjust_video_duration,
+                clip,
+                work_dir,
+                min_duration,
+                max_duration,
+                args.repeats,
+            )
+            current, current_duration = time_adjustment(
+                adjust_video_duration, clip, work_dir, min_duration, max_duration, args.repeats
+            )
+            durations = "/".join(
+                "failed" if duration is None else f"{duration:.2f}s"
+                for duration in (legacy_duration, current_duration)
+            )
+            print(
+                f"{label:<17} {legacy * 1000:>7.0f}ms {current * 1000:>7.0f}ms "
+                f"{legacy / current:>7.2f}x {durations:>16}"
+            )
+
+
+if __name__ == "__main__":
+    main()
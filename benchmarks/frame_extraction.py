@@ -0,0 +1,163 @@
+"""Benchmark `extract_frames_from_video` against the previous seek-based implementation.
+
+Synthetic Manim-like clips (shapes and text drawn on black) are encoded at 480p15
+and 1080p60, then both implementations extract frames from them in each mode.
+
+Usage:
+    python benchmarks/frame_extraction.py [--duration 10] [--repeats 3]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+from manim_generator.utils.rendering import extract_frames_from_video
+
+RESOLUTIONS = {
+    "480p15": (854, 480, 15),
+    "1080p60": (1920, 1080, 60),
+}
+
+
+def legacy_extract_frames_from_video(
+    video_path: str,
+    mode: str = "fixed_count",
+    frame_count: int = 3,
+    max_frames: int = 30,
+) -> list[np.ndarray] | None:
+    """The seek-per-sample implementation this benchmark compares against."""
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        return None
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    if total_frames == 0:
+        return None
+
+    if mode == "highest_density":
+        frame_indices = np.linspace(0, total_frames - 1, min(max_frames, total_frames), dtype=int)
+        best_frame = None
+        best_density = 0
+        for frame_idx in frame_indices:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
+            ret, frame = cap.read()
+            if not ret:
+                continue
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            density = np.sum(gray > 30) / (gray.shape[0] * gray.shape[1])
+            if density > best_density:
+                best_density = density
+                best_frame = frame.copy()
+        cap.release()
+        return [best_frame] if best_frame is not None else None
+
+    frame_indices = np.linspace(0, total_frames - 1, min(frame_count, total_frames), dtype=int)
+    extracted_frames = []
+    for frame_idx in frame_indices:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
+        ret, frame = cap.read()
+        if ret:
+            extracted_frames.append(frame.copy())
+    cap.release()
+    return extracted_frames or None
+
+
+def draw_frame(width: int, height: int, progress: float) -> np.ndarray:
+    """Draw a BGR frame of shapes and text growing on a black background."""
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    cv2.putText(
+        frame,
+        "Benchmark Scene",
+        (width // 10, height // 8),
+        cv2.FONT_HERSHEY_SIMPLEX,
+        height / 400,
+        (255, 255, 255),
+        max(1, height // 240),
+    )
+    radius = int(progress * height / 3) + 1
+    cv2.circle(frame, (width // 3, height // 2), radius, (80, 160, 240), -1)
+    cv2.rectangle(
+        frame,
+        (width // 2, height // 2),
+        (width // 2 + int(progress * width / 3), height // 2 + height // 4),
+        (240, 120, 60),
+        -1,
+    )
+    return frame
+
+
+def write_clip(path: str, width: int, height: int, fps: int, duration: float) -> str:
+    """
+    Encode a synthetic clip, preferring libx264 through PyAV like Manim's file writer
+    (default keyframe interval of 250 frames) and falling back to OpenCV's encoder.
+    """
+    total = int(duration * fps)
+    try:
+        import av
+    except ImportError:
+        av = None
+
+    if av is not None:
+        with av.open(path, mode="w") as container:
+            stream = container.add_stream("libx264", rate=fps)
+            stream.width, stream.height, stream.pix_fmt = width, height, "yuv420p"
+            stream.options = {"crf": "23"}
+            for idx in range(total):
+                image = draw_frame(width, height, idx / max(1, total - 1))
+                frame = av.VideoFrame.from_ndarray(image, format="bgr24")
+                container.mux(stream.encode(frame))
+            container.mux(stream.encode())
+        return "x264"
+
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), fps, (width, height))
+    if not writer.isOpened():
+        raise RuntimeError("no mp4 encoder available")
+    for idx in range(total):
+        writer.write(draw_frame(width, height, idx / max(1, total - 1)))
+    writer.release()
+    return "mp4v"
+
+
+def time_call(func, repeats: int) -> float:
+    """Median wall time of repeated calls in seconds."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=10.0, help="Clip length in seconds")
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per measurement")
+    args = parser.parse_args()
+
+    cases = [
+        ("highest_density", {"mode": "highest_density", "max_frames": 30}),
+        ("fixed_count (3)", {"mode": "fixed_count", "frame_count": 3}),
+    ]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        print(f"{'clip':<10} {'codec':<6} {'mode':<17} {'legacy':>9} {'current':>9} {'speedup':>8}")
+        for label, (width, height, fps) in RESOLUTIONS.items():
+            path = os.path.join(temp_dir, f"{label}.mp4")
+            codec = write_clip(path, width, height, fps, args.duration)
+            for mode_label, kwargs in cases:
+                legacy = time_call(
+                    lambda: legacy_extract_frames_from_video(path, **kwargs), args.repeats
+                )
+                current = time_call(lambda: extract_frames_from_video(path, **kwargs), args.repeats)
+                print(
+                    f"{label:<10} {codec:<6} {mode_label:<17} "
+                    f"{legacy * 1000:>7.0f}ms {current * 1000:>7.0f}ms {legacy / current:>7.2f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Benchmark the final render of a long scene with and without time sharding.
+
+A script with one short scene and one scene of `--animations` animations (shapes
+transforming, moving and fading, like an LLM-written explainer) is rendered by
+`render_and_concat` at 1080p60, once as whole scenes and once with the long scene
+split into animation ranges. Requires manim and ffmpeg.
+
+Usage:
+    python benchmarks/sharded_render.py [--animations 60] [--workers 4] [--repeats 1]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import tempfile
+import time
+
+from manim_generator.utils.sharding import count_scene_animations, plan_shards
+from manim_generator.utils.video import get_video_duration, render_and_concat
+
+SCRIPT_HEADER = """from manim import *
+
+
+class Title(Scene):
+    def construct(self):
+        title = Text("Sharding benchmark")
+        self.play(Write(title))
+        self.wait(0.5)
+
+
+class LongScene(Scene):
+    def construct(self):
+        shapes = [Circle(), Square(), Triangle(), RegularPolygon(6), Star()]
+        colors = [BLUE, GREEN, RED, YELLOW, PURPLE]
+        current = shapes[0].set_color(BLUE)
+        self.play(Create(current), run_time=0.5)
+"""
+
+ANIMATION_STEP = """        nxt = shapes[{next}].copy().set_color(colors[{color}]).shift({shift})
+        self.play(Transform(current, nxt), run_time=0.5)
+"""
+
+
+def build_script(animations: int) -> str:
+    """Script whose LongScene plays `animations` animations in total."""
+    shifts = ["LEFT", "RIGHT", "UP", "DOWN", "ORIGIN"]
+    steps = [
+        ANIMATION_STEP.format(next=(i + 1) % 5, color=i % 5, shift=shifts[i % len(shifts)])
+        for i in range(animations - 1)
+    ]
+    return SCRIPT_HEADER + "".join(steps)
+
+
+def time_render(script_file: str, workers: int, shard_scenes: bool, repeats: int) -> tuple:
+    """Median wall time of the final render and the duration of the produced video."""
+    timings = []
+    duration = None
+    for _ in range(repeats):
+        media_dir = tempfile.mkdtemp(prefix="sharding_media_")
+        try:
+            start = time.perf_counter()
+            output = render_and_concat(
+                script_file,
+                media_dir,
+                "final.mp4",
+                render_workers=workers,
+                shard_scenes=shard_scenes,
+            )
+            timings.append(time.perf_counter() - start)
+            if output is None:
+                raise RuntimeError("render failed")
+            duration = get_video_duration(output)
+        finally:
+            shutil.rmtree(media_dir, ignore_errors=True)
+    return statistics.median(timings), duration
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--animations", type=int, default=60, help="Animations in LongScene")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Render jobs")
+    parser.add_argument("--repeats", type=int, default=1, help="Runs per measurement")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        script_file = os.path.join(temp_dir, "video.py")
+        with open(script_file, "w", encoding="utf-8") as f:
+            f.write(build_script(args.animations))
+
+        start = time.perf_counter()
+        counts = count_scene_animations(script_file, ["Title", "LongScene"], temp_dir)
+        count_time = time.perf_counter() - start
+        shards = plan_shards(counts, args.workers)
+        print(f"animation counts: {counts} (counted in {count_time:.1f}s)")
+        print(f"shards with {args.workers} workers: {shards.get('LongScene')}")
+
+        whole, whole_duration = time_render(script_file, args.workers, False, args.repeats)
+        sharded, sharded_duration = time_render(script_file, args.workers, True, args.repeats)
+
+    print(f"{'mode':<10} {'wall':>9} {'video':>9}")
+    print(f"{'whole':<10} {whole:>8.1f}s {whole_duration or 0:>8.2f}s")
+    print(f"{'sharded':<10} {sharded:>8.1f}s {sharded_duration or 0:>8.2f}s")
+    print(f"speedup: {whole / sharded:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Benchmark `_StreamAccumulator` against the previous string-concatenating implementation.
+
+The previous implementation appended every token to the accumulated response and
+reasoning strings and yielded both in full with each payload, so the strings were
+copied once per token. It also computed the cost of every chunk that carried usage.
+The current one keeps the tokens in lists, yields only the new tokens and builds
+the response, usage and cost once at the end.
+
+Both consume the same synthetic stream of litellm chunks: a reasoning trace
+followed by the answer, with usage on the last chunk (or on every n-th chunk with
+--usage-every, like providers that report running usage).
+
+Usage:
+    python benchmarks/stream_accumulation.py [--tokens 50000 200000] [--repeats 3] [--usage-every 0]
+"""
+
+import argparse
+import statistics
+import time
+from typing import Any
+
+from litellm.cost_calculator import completion_cost
+from litellm.types.utils import Delta, ModelResponseStream, StreamingChoices, Usage
+
+from manim_generator.utils.llm import StreamChunk, _build_usage_info, _StreamAccumulator
+
+MODEL = "gpt-4o"
+# share of the stream that is reasoning
+REASONING_SHARE = 0.6
+
+
+class LegacyStreamAccumulator:
+    """The accumulator this benchmark compares against."""
+
+    def __init__(self, model: str):
+        self.model = model
+        self.start = time.time()
+        self.response = ""
+        self.reasoning = ""
+        self.usage: dict[str, object] = {"model": model, "cost": 0.0, "llm_time": 0.0}
+
+    def add(self, chunk: Any) -> StreamChunk:
+        delta = chunk.choices[0].delta
+        token = getattr(delta, "content", None) or ""
+        reasoning_token = getattr(delta, "reasoning_content", None) or ""
+
+        if token:
+            self.response += token
+        if reasoning_token:
+            self.reasoning += reasoning_token
+
+        if hasattr(chunk, "usage") and chunk.usage:
+            try:
+                cost = completion_cost(chunk)
+            except Exception:
+                cost = 0.0
+            self.usage = _build_usage_info(
+                model=self.model, usage=chunk.usage, cost=cost, llm_time=time.time() - self.start
+            )
+
+        return StreamChunk(
+            token=token,
+            response=self.response,
+            usage=self.usage,
+            reasoning_token=reasoning_token,
+            reasoning_content=self.reasoning,
+        )
+
+    def final(self) -> StreamChunk:
+        return StreamChunk(
+            token="",
+            response=self.response,
+            usage=self.usage,
+            reasoning_token="",
+            reasoning_content=self.reasoning,
+        )
+
+
+def make_stream(tokens: int, usage_every: int) -> list[ModelResponseStream]:
+    """Build a stream of one token per chunk, reasoning first."""
+    words = ["Scene", " with", " a", " MathTex", " formula", "\n", "    self", ".play("]
+    reasoning_tokens = int(tokens * REASONING_SHARE)
+    chunks = []
+    for idx in range(tokens):
+        word = words[idx % len(words)]
+        if idx < reasoning_tokens:
+            delta = Delta(content=None, reasoning_content=word)
+        else:
+            delta = Delta(content=word)
+        last = idx == tokens - 1
+        usage = None
+        if last or (usage_every and (idx + 1) % usage_every == 0):
+            usage = Usage(prompt_tokens=1500, completion_tokens=idx + 1, total_tokens=idx + 1501)
+        chunk = ModelResponseStream(model=MODEL, choices=[StreamingChoices(delta=delta)])
+        if usage is not None:
+            chunk.usage = usage
+        chunks.append(chunk)
+    return chunks
+
+
+def consume(accumulator_class, chunks: list) -> StreamChunk:
+    """Drain a stream the way the console printer does and return the final payload."""
+    stream = accumulator_class(MODEL)
+    for chunk in chunks:
+        stream.add(chunk)
+    return stream.final()
+
+
+def time_call(func, repeats: int) -> float:
+    """Median wall time of func over repeats."""
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--tokens", type=int, nargs="+", default=[50000], help="Tokens in each benchmarked stream"
+    )
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per measurement")
+    parser.add_argument(
+        "--usage-every", type=int, default=0, help="Report usage every n chunks (0: last only)"
+    )
+    args = parser.parse_args()
+
+    print(f"{'tokens':>8} {'chars':>9} {'legacy':>9} {'current':>9} {'speedup':>8}")
+    for tokens in args.tokens:
+        chunks = make_stream(tokens, args.usage_every)
+        legacy_final = consume(LegacyStreamAccumulator, chunks)
+        current_final = consume(_StreamAccumulator, chunks)
+        assert current_final.response == legacy_final.response
+        assert current_final.reasoning_content == legacy_final.reasoning_content
+        assert current_final.usage["cost"] == legacy_final.usage["cost"]
+
+        legacy = time_call(lambda: consume(LegacyStreamAccumulator, chunks), args.repeats)
+        current = time_call(lambda: consume(_StreamAccumulator, chunks), args.repeats)
+        characters = len(current_final.response) + len(current_final.reasoning_content)
+        print(
+            f"{tokens:>8} {characters:>9} "
+            f"{legacy * 1000:>7.0f}ms {current * 1000:>7.0f}ms {legacy / current:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
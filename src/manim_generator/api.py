@@ -1,5 +1,6 @@
 """FastAPI application for generating videos from Manim scripts."""
 
+import asyncio
 import os
 import uuid
 from datetime import datetime
@@ -9,11 +10,19 @@ from fastapi.responses import FileResponse
 from pydantic import BaseModel
 from rich.console import Console
 
+from manim_generator.utils.asset_cache import AssetCache
 from manim_generator.utils.config import DEFAULT_CONFIG
 from manim_generator.utils.file import save_code_to_file
+from manim_generator.utils.profiles import RENDER_PROFILES
+from manim_generator.utils.rate_limit import configure_rate_limits, get_rate_limiter
+from manim_generator.utils.render_worker import (
+    get_render_worker_pool,
+    is_supported,
+    shutdown_render_worker_pool,
+)
 from manim_generator.utils.rendering import extract_scene_class_names
 from manim_generator.utils.video import adjust_video_duration, render_and_concat
-from manim_generator.workflow import ManimWorkflow
+from manim_generator.workflow import AsyncManimWorkflow
 
 app = FastAPI(
     title="Manim Video Generator API",
@@ -21,6 +30,29 @@ app = FastAPI(
     version="0.1.0",
 )
 
+# Render backend for all requests; `manim-api --render-backend warm` sets this so the
+# server keeps one pool of pre-imported Manim workers alive across requests.
+RENDER_BACKEND = os.environ.get("MANIM_GENERATOR_RENDER_BACKEND", DEFAULT_CONFIG["render_backend"])
+
+# LLM request and token budgets per minute of each model/provider, shared by all
+# requests (`manim-api --requests-per-minute/--tokens-per-minute`; unset for none)
+REQUESTS_PER_MINUTE = int(os.environ.get("MANIM_GENERATOR_REQUESTS_PER_MINUTE") or 0) or None
+TOKENS_PER_MINUTE = int(os.environ.get("MANIM_GENERATOR_TOKENS_PER_MINUTE") or 0) or None
+configure_rate_limits(REQUESTS_PER_MINUTE, TOKENS_PER_MINUTE)
+
+
+@app.on_event("startup")
+async def start_render_workers():
+    """Pre-start the warm render workers so the first request does not pay for imports."""
+    if RENDER_BACKEND == "warm" and is_supported():
+        get_render_worker_pool(DEFAULT_CONFIG["render_workers"])
+
+
+@app.on_event("shutdown")
+async def stop_render_workers():
+    """Stop the warm render workers."""
+    shutdown_render_worker_pool()
+
 
 class VideoGenerateRequest(BaseModel):
     """Request model for video generation from description."""
@@ -33,6 +65,10 @@ class VideoGenerateRequest(BaseModel):
     review_model: str | None = None
     review_cycles: int | None = None
     temperature: float | None = None
+    review_profile: str | None = None  # Render profile of review executions (default: review)
+    final_profile: str | None = None  # Render profile of the final video (default: final)
+    speculative_render: bool | None = None  # Render the final video during reviews (default: false)
+    llm_cache: bool | None = None  # Serve repeated LLM requests from the response cache (default: false)
 
 
 class ScriptRequest(BaseModel):
@@ -42,6 +78,7 @@ class ScriptRequest(BaseModel):
     output_dir: str | None = None
     min_duration: float | None = None  # Minimum duration in seconds (default: 60)
     max_duration: float | None = None  # Maximum duration in seconds (default: 180)
+    final_profile: str | None = None  # Render profile of the video (default: final)
 
 
 class VideoResponse(BaseModel):
@@ -54,6 +91,16 @@ class VideoResponse(BaseModel):
     error: str | None = None
 
 
+def _validate_render_profiles(*names: str | None) -> None:
+    """Reject unknown render profile names with a 400 error."""
+    for name in names:
+        if name is not None and name not in RENDER_PROFILES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown render profile {name!r} (choose from {', '.join(RENDER_PROFILES)})",
+            )
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -66,6 +113,12 @@ async def health():
     return {"status": "healthy"}
 
 
+@app.get("/metrics/rate-limits")
+async def rate_limit_metrics():
+    """Requests, retries and time spent waiting on LLM rate limits, per model/provider."""
+    return get_rate_limiter().get_stats()
+
+
 @app.post("/generate", response_model=VideoResponse)
 async def generate_video_from_description(request: VideoGenerateRequest) -> VideoResponse:
     """
@@ -83,6 +136,7 @@ async def generate_video_from_description(request: VideoGenerateRequest) -> Vide
     # Validate video_data is not empty
     if not request.video_data or not request.video_data.strip():
         raise HTTPException(status_code=400, detail="video_data cannot be empty")
+    _validate_render_profiles(request.review_profile, request.final_profile)
 
     # Create output directory
     if request.output_dir:
@@ -107,30 +161,60 @@ async def generate_video_from_description(request: VideoGenerateRequest) -> Vide
         "vision_enabled": False,  # Can be enhanced later
         "reasoning": None,
         "provider": None,
+        "llm_cache_path": DEFAULT_CONFIG["llm_cache_path"] if request.llm_cache else None,
+        "llm_cache_max_mb": DEFAULT_CONFIG["llm_cache_max_mb"],
+        "llm_cache_ttl_hours": DEFAULT_CONFIG["llm_cache_ttl_hours"],
         "success_threshold": DEFAULT_CONFIG["success_threshold"],
         "frame_extraction_mode": DEFAULT_CONFIG["frame_extraction_mode"],
         "frame_count": DEFAULT_CONFIG["frame_count"],
+        "frame_format": DEFAULT_CONFIG["frame_format"],
+        "frame_quality": DEFAULT_CONFIG["frame_quality"],
+        "frame_max_dimension": DEFAULT_CONFIG["frame_max_dimension"],
         "headless": True,  # Always headless for API
         "scene_timeout": DEFAULT_CONFIG["scene_timeout"],
+        "render_workers": DEFAULT_CONFIG["render_workers"],
+        "render_backend": RENDER_BACKEND,
+        "render_cache_dir": DEFAULT_CONFIG["render_cache_dir"],
+        "render_cache_max_mb": DEFAULT_CONFIG["render_cache_max_mb"],
+        "asset_cache_dir": DEFAULT_CONFIG["asset_cache_dir"],
+        "asset_cache_max_mb": DEFAULT_CONFIG["asset_cache_max_mb"],
+        "tex_precompile": DEFAULT_CONFIG["tex_precompile"],
+        "preflight": DEFAULT_CONFIG["preflight"],
+        "execution_mode": DEFAULT_CONFIG["execution_mode"],
+        "sandbox": DEFAULT_CONFIG["sandbox"],
+        "max_memory_mb": DEFAULT_CONFIG["max_memory_mb"],
+        "max_cpu_seconds": DEFAULT_CONFIG["max_cpu_seconds"],
+        "max_open_files": DEFAULT_CONFIG["max_open_files"],
+        "shard_scenes": DEFAULT_CONFIG["shard_scenes"],
+        "review_profile": request.review_profile or DEFAULT_CONFIG["review_profile"],
+        "final_profile": request.final_profile or DEFAULT_CONFIG["final_profile"],
+        "review_time_scale": DEFAULT_CONFIG["review_time_scale"],
+        "promote_review_clips": DEFAULT_CONFIG["promote_review_clips"],
+        "speculative_render": (
+            request.speculative_render
+            if request.speculative_render is not None
+            else DEFAULT_CONFIG["speculative_render"]
+        ),
     }
 
     # Run the workflow
+    workflow = None
     try:
         console = Console()
-        workflow = ManimWorkflow(config, console)
+        workflow = AsyncManimWorkflow(config, console)
 
         # Generate initial code
-        current_code, main_messages = workflow.generate_initial_code(request.video_data)
+        current_code, main_messages = await workflow.generate_initial_code(request.video_data)
         
         # Execute initial code
-        success, last_frames, combined_logs, successful_scenes = workflow.execute_code(
+        success, last_frames, combined_logs, successful_scenes = await workflow.execute_code(
             current_code, "Initial"
         )
         workflow.initial_success = success
         working_code = current_code if success else None
 
         # Review and update code
-        current_code, new_working_code, combined_logs = workflow.review_and_update_code(
+        current_code, new_working_code, combined_logs = await workflow.review_and_update_code(
             current_code, combined_logs, last_frames, request.video_data, successful_scenes
         )
         working_code = new_working_code if new_working_code else working_code
@@ -142,8 +226,24 @@ async def generate_video_from_description(request: VideoGenerateRequest) -> Vide
             )
             workflow.artifact_manager.save_step_artifacts("final", code=working_code)
             
-            # Always render in API mode
-            video_path = render_and_concat(saved_file, output_dir, "final_video.mp4")
+            # Always render in API mode, unless the background render already did;
+            # renders run in worker threads so other requests are served meanwhile
+            video_path = await asyncio.to_thread(workflow.speculative_video, working_code)
+            if not video_path:
+                video_path = await asyncio.to_thread(
+                    render_and_concat,
+                    saved_file,
+                    output_dir,
+                    "final_video.mp4",
+                    render_backend=RENDER_BACKEND,
+                    resource_limits=workflow.resource_limits,
+                    render_workers=config["render_workers"],
+                    shard_scenes=config["shard_scenes"],
+                    render_profile=config["final_profile"],
+                    clips=workflow.promoted_clips(working_code),
+                    asset_cache=workflow.asset_cache,
+                    tex_precompile=config["tex_precompile"],
+                )
         else:
             return VideoResponse(
                 success=False,
@@ -157,7 +257,9 @@ async def generate_video_from_description(request: VideoGenerateRequest) -> Vide
             max_duration = request.max_duration if request.max_duration is not None else 180.0
 
             # Adjust video duration if needed
-            adjusted_path = adjust_video_duration(video_path, min_duration, max_duration)
+            adjusted_path = await asyncio.to_thread(
+                adjust_video_duration, video_path, min_duration, max_duration
+            )
             if adjusted_path and os.path.exists(adjusted_path):
                 if adjusted_path != video_path and os.path.exists(adjusted_path):
                     try:
@@ -190,6 +292,8 @@ async def generate_video_from_description(request: VideoGenerateRequest) -> Vide
             )
 
     except Exception as e:
+        if workflow is not None:
+            workflow.cancel_speculative_render()
         return VideoResponse(
             success=False,
             message="Error during video generation",
@@ -211,6 +315,7 @@ async def generate_video_from_script(request: ScriptRequest) -> VideoResponse:
     # Validate script is not empty
     if not request.script or not request.script.strip():
         raise HTTPException(status_code=400, detail="Script cannot be empty")
+    _validate_render_profiles(request.final_profile)
 
     # Create output directory
     if request.output_dir:
@@ -255,9 +360,20 @@ async def generate_video_from_script(request: ScriptRequest) -> VideoResponse:
             error=str(e),
         )
 
-    # Render the video
+    # Render the video in a worker thread so other requests are served meanwhile
     try:
-        video_path = render_and_concat(saved_file, output_dir, "final_video.mp4")
+        video_path = await asyncio.to_thread(
+            render_and_concat,
+            saved_file,
+            output_dir,
+            "final_video.mp4",
+            render_backend=RENDER_BACKEND,
+            render_profile=request.final_profile or DEFAULT_CONFIG["final_profile"],
+            asset_cache=AssetCache(
+                DEFAULT_CONFIG["asset_cache_dir"],
+                DEFAULT_CONFIG["asset_cache_max_mb"] * 1024 * 1024,
+            ),
+        )
 
         if video_path and os.path.exists(video_path):
             # Set default duration constraints (1-3 minutes)
@@ -265,7 +381,9 @@ async def generate_video_from_script(request: ScriptRequest) -> VideoResponse:
             max_duration = request.max_duration if request.max_duration is not None else 180.0
 
             # Adjust video duration if needed
-            adjusted_path = adjust_video_duration(video_path, min_duration, max_duration)
+            adjusted_path = await asyncio.to_thread(
+                adjust_video_duration, video_path, min_duration, max_duration
+            )
             if adjusted_path and os.path.exists(adjusted_path):
                 # If a new file was created, use it; otherwise use original
                 if adjusted_path != video_path and os.path.exists(adjusted_path):
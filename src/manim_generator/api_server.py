@@ -1,6 +1,8 @@
 """CLI entry point for running the FastAPI server."""
 
 import argparse
+import os
+
 import uvicorn
 
 
@@ -24,8 +26,31 @@ def main():
         action="store_true",
         help="Enable auto-reload for development",
     )
+    parser.add_argument(
+        "--render-backend",
+        type=str,
+        choices=["subprocess", "warm", "batch"],
+        default="subprocess",
+        help="Render with a `manim` process per scene (subprocess), shared pre-imported workers (warm), or one process per script for review renders (batch)",
+    )
+
+    parser.add_argument(
+        "--requests-per-minute",
+        type=int,
+        default=0,
+        help="LLM request budget per minute of each model/provider, shared by all API requests (0 for none)",
+    )
+    parser.add_argument(
+        "--tokens-per-minute",
+        type=int,
+        default=0,
+        help="LLM token budget per minute of each model/provider, shared by all API requests (0 for none)",
+    )
 
     args = parser.parse_args()
+    os.environ["MANIM_GENERATOR_RENDER_BACKEND"] = args.render_backend
+    os.environ["MANIM_GENERATOR_REQUESTS_PER_MINUTE"] = str(args.requests_per_minute)
+    os.environ["MANIM_GENERATOR_TOKENS_PER_MINUTE"] = str(args.tokens_per_minute)
 
     uvicorn.run(
         "manim_generator.api:app",
@@ -84,6 +84,11 @@ class ArtifactManager:
         execution_history: list[dict] | None = None,
         video_path: str | None = None,
         args: dict | None = None,
+        render_cache: dict | None = None,
+        asset_cache: dict | None = None,
+        llm_cache: dict | None = None,
+        rate_limits: dict | None = None,
+        total_cached_prompt_tokens: int = 0,
     ) -> None:
         """Save a comprehensive final summary JSON with all key metrics."""
         normalized_video_path = os.path.abspath(video_path) if video_path else None
@@ -115,6 +120,7 @@ class ArtifactManager:
             },
             "usage": {
                 "total_prompt_tokens": total_prompt_tokens,
+                "total_cached_prompt_tokens": total_cached_prompt_tokens,
                 "total_completion_tokens": total_completion_tokens,
                 "total_reasoning_tokens": total_reasoning_tokens,
                 "total_answer_tokens": total_answer_tokens,
@@ -122,6 +128,10 @@ class ArtifactManager:
                 "total_cost_usd": total_cost,
                 "steps": token_usage_steps,
             },
+            "render_cache": render_cache,
+            "asset_cache": asset_cache,
+            "llm_cache": llm_cache,
+            "rate_limits": rate_limits,
             "output": {
                 "video_path": normalized_video_path,
             },
@@ -5,7 +5,14 @@ from rich.panel import Panel
 from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 from rich.syntax import Syntax
 
-from manim_generator.utils.llm import get_completion_with_retry, get_streaming_completion_with_retry
+from manim_generator.utils.llm import (
+    StreamChunk,
+    get_completion_with_retry,
+    get_completion_with_retry_async,
+    get_streaming_completion_with_retry,
+    get_streaming_completion_with_retry_async,
+)
+from manim_generator.utils.llm_cache import LLMResponseCache
 
 
 class HeadlessProgressManager:
@@ -104,6 +111,7 @@ def get_response_with_status(
     reasoning: dict | None = None,
     provider: str | None = None,
     headless: bool = False,
+    response_cache: LLMResponseCache | None = None,
 ) -> tuple[str, dict[str, object], str | None]:
     """Gets a response from the model, handling streaming if enabled.
 
@@ -121,30 +129,15 @@ def get_response_with_status(
             console=console,
             reasoning=reasoning,
             provider=provider,
+            response_cache=response_cache,
         )
-        usage_info: dict[str, object] = {}
-        full_response = ""
-        full_reasoning = ""
-        reasoning_started = False
-        answer_started = False
-
+        printer = _StreamPrinter(console)
         for chunk in stream_gen:
-            if chunk.reasoning_token:
-                if not reasoning_started:
-                    console.print("\n[dim #C0C0C0]Reasoning:[/dim #C0C0C0] ", end="\n")
-                    reasoning_started = True
-                console.print(chunk.reasoning_token, end="", style="dim #C0C0C0")
-            if chunk.token:
-                if reasoning_started and not answer_started:
-                    console.print("\n[bold green]Answer:\n[/bold green] ", end="")
-                    answer_started = True
-                console.print(chunk.token, end="")
-            full_response = chunk.response
-            usage_info = chunk.usage
-            full_reasoning = chunk.reasoning_content
-
-        response_text = full_response
-        reasoning_content = full_reasoning
+            printer.print(chunk)
+
+        response_text = printer.response
+        usage_info = printer.usage
+        reasoning_content = printer.reasoning
     elif headless:
         result = get_completion_with_retry(
             model=model,
@@ -153,6 +146,7 @@ def get_response_with_status(
             console=console,
             reasoning=reasoning,
             provider=provider,
+            response_cache=response_cache,
         )
         response_text = result.content
         usage_info = result.usage
@@ -176,29 +170,143 @@ def get_response_with_status(
                 console=console,
                 reasoning=reasoning,
                 provider=provider,
+                response_cache=response_cache,
             )
             response_text = result.content
             usage_info = result.usage
             reasoning_content = result.reasoning
             progress.update(task, completed=True)
 
-    elapsed_time = time.time() - start_time
     if not headless:
-        reasoning_tokens = usage_info.get("reasoning_tokens", 0)
-        answer_tokens = usage_info.get("answer_tokens", usage_info.get("completion_tokens", 0))
-        console.print(
-            "[dim italic]"
-            f"Request completed in {elapsed_time:.2f} seconds | "
-            f"Input Tokens: {usage_info.get('prompt_tokens', 0)} | "
-            f"Output Tokens: {usage_info.get('completion_tokens', 0)} "
-            f"(reasoning: {reasoning_tokens}, answer: {answer_tokens}) | "
-            f"Cost: ${usage_info.get('cost', 0):.6f}"
-            "[/dim italic]"
-        )
+        _print_request_summary(console, time.time() - start_time, usage_info)
+
+    return response_text, usage_info, reasoning_content
+
+
+async def get_response_with_status_async(
+    model: str,
+    messages: list,
+    temperature: float | None,
+    streaming: bool,
+    status: str | None,
+    console: Console,
+    reasoning: dict | None = None,
+    provider: str | None = None,
+    headless: bool = False,
+    response_cache: LLMResponseCache | None = None,
+) -> tuple[str, dict[str, object], str | None]:
+    """Async variant of `get_response_with_status` that does not block the event loop.
+
+    Returns:
+        tuple[str, dict[str, object], str | None]: Response text, usage information, and optional reasoning content
+    """
+    start_time = time.time()
+
+    if streaming and not headless:
+        printer = _StreamPrinter(console)
+        async for chunk in get_streaming_completion_with_retry_async(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            console=console,
+            reasoning=reasoning,
+            provider=provider,
+            response_cache=response_cache,
+        ):
+            printer.print(chunk)
+
+        response_text = printer.response
+        usage_info = printer.usage
+        reasoning_content = printer.reasoning
+    else:
+        progress = None
+        if not headless:
+            progress = Progress(
+                SpinnerColumn(),
+                TextColumn("[bold green]{task.description}"),
+                TimeElapsedColumn(),
+                transient=True,
+            )
+            progress.start()
+            progress.add_task(
+                f"[bold green]Generating response [{model}]..." if not status else status,
+                total=None,
+            )
+        try:
+            result = await get_completion_with_retry_async(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                console=console,
+                reasoning=reasoning,
+                provider=provider,
+                response_cache=response_cache,
+            )
+        finally:
+            if progress is not None:
+                progress.stop()
+        response_text = result.content
+        usage_info = result.usage
+        reasoning_content = result.reasoning
+
+    if not headless:
+        _print_request_summary(console, time.time() - start_time, usage_info)
 
     return response_text, usage_info, reasoning_content
 
 
+class _StreamPrinter:
+    """Prints streamed reasoning and answer tokens and keeps the totals of the final payload."""
+
+    def __init__(self, console: Console):
+        self.console = console
+        self.response = ""
+        self.reasoning = ""
+        self.usage: dict[str, object] = {}
+        self.reasoning_started = False
+        self.answer_started = False
+
+    def print(self, chunk: StreamChunk) -> None:
+        """Print the tokens of one streamed chunk."""
+        if chunk.reasoning_token:
+            if not self.reasoning_started:
+                self.console.print("\n[dim #C0C0C0]Reasoning:[/dim #C0C0C0] ", end="\n")
+                self.reasoning_started = True
+            self.console.print(chunk.reasoning_token, end="", style="dim #C0C0C0")
+        if chunk.token:
+            if self.reasoning_started and not self.answer_started:
+                self.console.print("\n[bold green]Answer:\n[/bold green] ", end="")
+                self.answer_started = True
+            self.console.print(chunk.token, end="")
+        if chunk.final:
+            self.response = chunk.response
+            self.usage = chunk.usage
+            self.reasoning = chunk.reasoning_content
+
+
+def _print_request_summary(console: Console, elapsed_time: float, usage_info: dict) -> None:
+    """Print the duration, token counts and cost of a completed request."""
+    if usage_info.get("cached"):
+        console.print(
+            f"[dim italic]Served from the LLM response cache in {elapsed_time:.2f} seconds[/dim italic]"
+        )
+        return
+    reasoning_tokens = usage_info.get("reasoning_tokens", 0)
+    answer_tokens = usage_info.get("answer_tokens", usage_info.get("completion_tokens", 0))
+    first_token = usage_info.get("time_to_first_token")
+    first_token_note = f" (first token after {first_token:.2f}s)" if first_token is not None else ""
+    console.print(
+        "[dim italic]"
+        f"Request completed in {elapsed_time:.2f} seconds{first_token_note} | "
+        f"Input Tokens: {usage_info.get('prompt_tokens', 0)} "
+        f"(cached: {usage_info.get('cached_prompt_tokens', 0)}) | "
+        f"Output Tokens: {usage_info.get('completion_tokens', 0)} "
+        f"(reasoning: {reasoning_tokens}, answer: {answer_tokens}) | "
+        f"Cost: ${usage_info.get('cost', 0):.6f}"
+        "[/dim italic]"
+    )
+
+
 def print_code_with_syntax(code: str, console: Console, title: str = "Code") -> None:
     """Prints code with syntax highlighting in a panel."""
     syntax = Syntax(code, "python", theme="monokai", line_numbers=True)
@@ -5,6 +5,7 @@ from rich.panel import Panel
 
 from manim_generator.utils.config import Config
 from manim_generator.utils.file import load_video_data
+from manim_generator.utils.rate_limit import configure_rate_limits, get_rate_limiter
 from manim_generator.utils.usage import (
     display_usage_summary,
     format_duration,
@@ -21,6 +22,7 @@ def main():
     config, video_data_arg, video_data_file = config_manager.parse_arguments()
 
     headless = config.get("headless", False)
+    configure_rate_limits(config["requests_per_minute"], config["tokens_per_minute"])
 
     if video_data_arg:
         video_data = video_data_arg
@@ -108,6 +110,11 @@ def main():
         execution_history=workflow.execution_history,
         video_path=video_path,
         args=config,
+        render_cache=workflow.render_cache.get_stats() if workflow.render_cache else None,
+        asset_cache=workflow.asset_cache.get_stats() if workflow.asset_cache else None,
+        llm_cache=workflow.response_cache.get_stats() if workflow.response_cache else None,
+        rate_limits=get_rate_limiter().get_stats(),
+        total_cached_prompt_tokens=token_usage_tracking["total_cached_prompt_tokens"],
     )
 
 
@@ -7,6 +7,9 @@ from pathlib import Path
 
 from rich.console import Console
 
+from manim_generator.utils.asset_cache import AssetCache
+from manim_generator.utils.config import DEFAULT_CONFIG
+from manim_generator.utils.profiles import RENDER_PROFILES
 from manim_generator.utils.video import render_and_concat
 
 
@@ -66,6 +69,30 @@ def manual_render():
         default="output.mp4",
         help="Filename for the concatenated manual render (stored inside --media-dir)",
     )
+    parser.add_argument(
+        "--render-workers",
+        "-w",
+        type=int,
+        default=None,
+        help="Maximum number of scenes rendered in parallel (defaults to the CPU count)",
+    )
+    parser.add_argument(
+        "--shard-scenes",
+        action="store_true",
+        help="Split long scenes into animation ranges rendered in parallel",
+    )
+    parser.add_argument(
+        "--profile",
+        "-p",
+        default="final",
+        choices=list(RENDER_PROFILES),
+        help="Render quality profile: draft (240p10), review (480p15), final (1080p60) or 4k",
+    )
+    parser.add_argument(
+        "--asset-cache-dir",
+        default=DEFAULT_CONFIG["asset_cache_dir"],
+        help="Tex/Text SVG cache shared with workflow renders (empty string disables it)",
+    )
     args = parser.parse_args()
 
     console = Console()
@@ -88,7 +115,19 @@ def manual_render():
         f"[bold green]Rendering script:[/bold green] {script_path} "
         f"[bold green]| media dir:[/bold green] {args.media_dir}"
     )
-    render_and_concat(str(script_path), args.media_dir, args.final_output)
+    render_and_concat(
+        str(script_path),
+        args.media_dir,
+        args.final_output,
+        render_workers=args.render_workers,
+        shard_scenes=args.shard_scenes,
+        render_profile=args.profile,
+        asset_cache=(
+            AssetCache(args.asset_cache_dir, DEFAULT_CONFIG["asset_cache_max_mb"] * 1024 * 1024)
+            if args.asset_cache_dir
+            else None
+        ),
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,315 @@
+"""Shared cache of the SVGs Manim builds for Tex/MathTex and Text mobjects.
+
+Manim caches compiled LaTeX (`<media_dir>/Tex`) and rendered text
+(`<media_dir>/texts`) under the media directory, and every run gets a fresh
+output directory, so each run and each final-render shard would otherwise
+compile every formula again. Renders started with an `AssetCacheRun` share one
+cache directory across runs and jobs instead:
+
+- `Tex/<hash>.svg`: compiled Tex/MathTex strings, keyed by Manim's hash of the
+  full LaTeX document (expression, environment and template)
+- `texts/<hash>.svg`: Text renders, keyed by Manim's hash of the text and its
+  font settings (MarkupText renders are not shared)
+
+Inside each manim process, `install` wraps `tex_to_svg_file` and manimpango's
+`text2svg`: a cached SVG is hard-linked (or copied) into the job's own media
+directory, and a newly built one is published to the cache through a temporary
+file and an atomic rename, so concurrent jobs never read a partially written
+SVG. LaTeX still compiles in the job's own Tex directory. SVGs already present in
+the job's media directory are served by Manim itself and are not counted as
+lookups.
+
+Each process reports its hits and misses to the run's stats directory, which the
+parent sums up in `AssetCache.finish_run`. The cache is bounded in size and
+evicts the least recently used SVGs first.
+"""
+
+import atexit
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+TEX_DIR = "Tex"
+TEXT_DIR = "texts"
+STATS_DIR = ".stats"
+COUNTERS = ("tex_hits", "tex_misses", "text_hits", "text_misses")
+
+# lookups of this process, reported by write_stats
+_counts = dict.fromkeys(COUNTERS, 0)
+_cache_dir: str | None = None
+_stats_dir: str | None = None
+_installed = False
+
+
+@dataclass(frozen=True)
+class AssetCacheRun:
+    """
+    The asset cache as seen by the manim processes of one render run.
+
+    Attributes:
+        cache_dir: Shared cache directory.
+        stats_dir: Directory the run's processes write their lookup counts to.
+    """
+
+    cache_dir: str
+    stats_dir: str
+
+    def driver_args(self) -> list[str]:
+        """Arguments passing the cache to the batch driver (see `utils/scene_driver.py`)."""
+        return ["--asset-cache-dir", self.cache_dir, "--asset-stats-dir", self.stats_dir]
+
+
+def manim_command(run: AssetCacheRun | None) -> list[str]:
+    """Command starting the Manim CLI, using the run's asset cache if there is one."""
+    if run is None:
+        return ["manim"]
+    return [sys.executable, "-m", __name__, run.cache_dir, run.stats_dir]
+
+
+def hit_rate(stats: dict[str, int]) -> float:
+    """Share of lookups served from the cache."""
+    hits = stats["tex_hits"] + stats["text_hits"]
+    lookups = hits + stats["tex_misses"] + stats["text_misses"]
+    return hits / lookups if lookups else 0.0
+
+
+def describe_stats(stats: dict[str, int]) -> str:
+    """One-line summary of lookup counts, e.g. for the console."""
+    return (
+        f"Tex/Text cache: {stats['tex_hits']}/{stats['tex_hits'] + stats['tex_misses']} Tex, "
+        f"{stats['text_hits']}/{stats['text_hits'] + stats['text_misses']} Text hits "
+        f"({hit_rate(stats):.0%})"
+    )
+
+
+class AssetCache:
+    """Size-bounded LRU cache of Tex and Text SVGs shared by all renders."""
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_bytes = max_bytes
+        self.counts = dict.fromkeys(COUNTERS, 0)
+        self.evictions = 0
+        # Tex mobjects this process already compiled ahead of renders (see utils/tex_precompile.py)
+        self.precompiled: set = set()
+        self._lock = threading.Lock()
+        for name in (TEX_DIR, TEXT_DIR, STATS_DIR):
+            os.makedirs(os.path.join(self.cache_dir, name), exist_ok=True)
+
+    def start_run(self) -> AssetCacheRun:
+        """Create the stats directory of a new render run."""
+        stats_dir = tempfile.mkdtemp(prefix="run_", dir=os.path.join(self.cache_dir, STATS_DIR))
+        return AssetCacheRun(self.cache_dir, stats_dir)
+
+    def finish_run(self, run: AssetCacheRun) -> dict[str, int]:
+        """
+        Collect the lookup counts of a finished run and evict if over budget.
+
+        Returns:
+            dict with the run's tex_hits, tex_misses, text_hits and text_misses
+        """
+        stats = dict.fromkeys(COUNTERS, 0)
+        for entry in os.scandir(run.stats_dir):
+            try:
+                with open(entry.path, encoding="utf-8") as f:
+                    reported = json.load(f)
+            except (OSError, ValueError):
+                continue
+            for counter in COUNTERS:
+                stats[counter] += reported.get(counter, 0)
+        shutil.rmtree(run.stats_dir, ignore_errors=True)
+
+        with self._lock:
+            for counter in COUNTERS:
+                self.counts[counter] += stats[counter]
+        self.evict()
+        return stats
+
+    def evict(self) -> None:
+        """Delete least recently used SVGs until the cache fits its size budget."""
+        files = []
+        total = 0
+        for name in (TEX_DIR, TEXT_DIR):
+            for entry in os.scandir(os.path.join(self.cache_dir, name)):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        files.sort()
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            with self._lock:
+                self.evictions += 1
+
+    def get_stats(self) -> dict:
+        """Return hit/miss statistics for the workflow summary."""
+        return {
+            "cache_dir": self.cache_dir,
+            **self.counts,
+            "hit_rate": hit_rate(self.counts),
+            "evictions": self.evictions,
+        }
+
+
+def _fetch(cached: str, destination: str) -> bool:
+    """Link a cached SVG into a job's media directory; False if it is not cached."""
+    temp_path = f"{destination}.{uuid.uuid4().hex}.tmp"
+    try:
+        os.link(cached, temp_path)
+    except FileNotFoundError:
+        return False
+    except OSError:
+        try:
+            shutil.copyfile(cached, temp_path)
+        except FileNotFoundError:
+            return False
+    os.replace(temp_path, destination)
+    try:
+        # the mtime doubles as the LRU timestamp
+        os.utime(cached)
+    except OSError:
+        pass
+    return True
+
+
+def _publish(source: str, cached: str) -> None:
+    """Add a newly built SVG to the cache with an atomic rename."""
+    if os.path.exists(cached):
+        return
+    temp_path = f"{cached}.{uuid.uuid4().hex}.tmp"
+    try:
+        try:
+            os.link(source, temp_path)
+        except OSError:
+            shutil.copyfile(source, temp_path)
+        os.replace(temp_path, cached)
+    except OSError as e:
+        logger.debug("Could not add %s to the asset cache: %s", source, e)
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def _cached_text_renderer(render, file_arg: int):
+    """Wrap a manimpango renderer whose SVG path is its positional argument file_arg."""
+
+    def text2svg(*args, **kwargs):
+        destination = str(args[file_arg])
+        cached = os.path.join(_cache_dir, TEXT_DIR, os.path.basename(destination))
+        if _fetch(cached, destination):
+            _counts["text_hits"] += 1
+            return destination
+        _counts["text_misses"] += 1
+        svg_file = render(*args, **kwargs)
+        _publish(destination, cached)
+        return svg_file
+
+    return text2svg
+
+
+def install(cache_dir: str, stats_dir: str | None = None) -> None:
+    """
+    Serve the Tex and Text SVGs of Manim scenes in this process from the cache.
+
+    Installing again only changes the directories.
+
+    Args:
+        cache_dir: Shared cache directory
+        stats_dir: Directory `write_stats` reports this process's lookups to
+    """
+    global _cache_dir, _stats_dir, _installed
+    _cache_dir, _stats_dir = cache_dir, stats_dir
+    if _installed:
+        return
+
+    import manimpango
+    from manim import config
+    from manim.mobject.text import tex_mobject
+    from manim.utils import tex_file_writing
+
+    original_tex_to_svg_file = tex_file_writing.tex_to_svg_file
+
+    def tex_to_svg_file(expression, environment=None, tex_template=None):
+        if tex_template is None:
+            tex_template = config.tex_template
+        tex_file = tex_file_writing.generate_tex_file(expression, environment, tex_template)
+        svg_file = Path(tex_file).with_suffix(".svg")
+        if not svg_file.exists():
+            cached = os.path.join(_cache_dir, TEX_DIR, svg_file.name)
+            if _fetch(cached, str(svg_file)):
+                _counts["tex_hits"] += 1
+                return svg_file
+            _counts["tex_misses"] += 1
+            svg_file = original_tex_to_svg_file(expression, environment, tex_template)
+            _publish(str(svg_file), cached)
+        return svg_file
+
+    tex_file_writing.tex_to_svg_file = tex_to_svg_file
+    # Tex mobjects call the name imported into their own module
+    if hasattr(tex_mobject, "tex_to_svg_file"):
+        tex_mobject.tex_to_svg_file = tex_to_svg_file
+    # Text calls manimpango.text2svg(settings, size, line_spacing, disable_liga, file_name, ...)
+    manimpango.text2svg = _cached_text_renderer(manimpango.text2svg, 4)
+    _installed = True
+
+
+def lookup_counts() -> dict[str, int]:
+    """Lookups of this process since its stats were last written."""
+    return dict(_counts)
+
+
+def write_stats() -> None:
+    """Report this process's lookups to the stats directory given to `install`."""
+    if _stats_dir is None or not any(_counts.values()):
+        return
+    path = os.path.join(_stats_dir, f"{os.getpid()}_{uuid.uuid4().hex}.json")
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(_counts, f)
+    except OSError as e:
+        logger.debug("Could not write asset cache stats: %s", e)
+    for counter in COUNTERS:
+        _counts[counter] = 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point: run the Manim CLI with the asset cache installed.
+
+    Usage: `python -m manim_generator.utils.asset_cache CACHE_DIR STATS_DIR <manim args>`
+    """
+    cache_dir, stats_dir, *manim_args = sys.argv[1:] if argv is None else argv
+    install(cache_dir, stats_dir)
+    atexit.register(write_stats)
+
+    from manim.__main__ import main as manim_main
+
+    try:
+        manim_main.main(args=manim_args, prog_name="manim", standalone_mode=True)
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        return e.code if isinstance(e.code, int) else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
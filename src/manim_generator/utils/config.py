@@ -7,6 +7,8 @@ from rich.console import Console
 from rich.prompt import Prompt
 from rich.table import Table
 
+from manim_generator.utils.profiles import RENDER_PROFILES
+
 # Default configuration
 DEFAULT_CONFIG = {
     "manim_model": "openrouter/x-ai/grok-code-fast-1",
@@ -19,7 +21,35 @@ DEFAULT_CONFIG = {
     "output_dir": None,
     "frame_extraction_mode": "highest_density",
     "frame_count": 3,
+    "frame_format": "png",
+    "frame_quality": 85,
+    "frame_max_dimension": None,
     "scene_timeout": 120,
+    "render_workers": os.cpu_count() or 1,
+    "render_backend": "subprocess",
+    "requests_per_minute": None,
+    "tokens_per_minute": None,
+    "llm_cache": False,
+    "llm_cache_path": os.path.join("output", ".llm_cache.sqlite3"),
+    "llm_cache_max_mb": 256,
+    "llm_cache_ttl_hours": 168,
+    "render_cache_dir": os.path.join("output", ".render_cache"),
+    "render_cache_max_mb": 2048,
+    "asset_cache_dir": os.path.join("output", ".asset_cache"),
+    "asset_cache_max_mb": 512,
+    "tex_precompile": True,
+    "preflight": True,
+    "execution_mode": "full",
+    "sandbox": False,
+    "max_memory_mb": None,
+    "max_cpu_seconds": None,
+    "max_open_files": None,
+    "shard_scenes": False,
+    "review_profile": "review",
+    "final_profile": "final",
+    "review_time_scale": 1.0,
+    "promote_review_clips": False,
+    "speculative_render": False,
 }
 
 
@@ -139,6 +169,42 @@ class Config:
             default=False,
             help="Exclude reasoning tokens from response (model still uses reasoning internally)",
         )
+        parser.add_argument(
+            "--requests-per-minute",
+            type=int,
+            default=0,
+            help="Request budget per minute of each model/provider, shared by all requests of the process (0 for none)",
+        )
+        parser.add_argument(
+            "--tokens-per-minute",
+            type=int,
+            default=0,
+            help="Token budget per minute of each model/provider, shared by all requests of the process (0 for none)",
+        )
+        parser.add_argument(
+            "--llm-cache",
+            action="store_true",
+            default=DEFAULT_CONFIG["llm_cache"],
+            help="Serve repeated LLM requests (same model, messages and parameters) from a persistent response cache",
+        )
+        parser.add_argument(
+            "--llm-cache-path",
+            type=str,
+            default=DEFAULT_CONFIG["llm_cache_path"],
+            help="SQLite database of the LLM response cache",
+        )
+        parser.add_argument(
+            "--llm-cache-max-mb",
+            type=int,
+            default=DEFAULT_CONFIG["llm_cache_max_mb"],
+            help="Size budget of the LLM response cache in MB (least recently used responses are evicted)",
+        )
+        parser.add_argument(
+            "--llm-cache-ttl-hours",
+            type=float,
+            default=DEFAULT_CONFIG["llm_cache_ttl_hours"],
+            help="Hours after which cached LLM responses expire (0 keeps them until evicted)",
+        )
         parser.add_argument(
             "--success-threshold",
             type=float,
@@ -158,12 +224,161 @@ class Config:
             default=DEFAULT_CONFIG["frame_count"],
             help="Number of frames to extract when using fixed_count mode",
         )
+        parser.add_argument(
+            "--frame-format",
+            type=str,
+            default=DEFAULT_CONFIG["frame_format"],
+            choices=["png", "jpeg", "webp"],
+            help="Image format of extracted frames sent to the review model",
+        )
+        parser.add_argument(
+            "--frame-quality",
+            type=int,
+            default=DEFAULT_CONFIG["frame_quality"],
+            help="Encoding quality (1-100) of jpeg and webp frames",
+        )
+        parser.add_argument(
+            "--frame-max-dimension",
+            type=int,
+            default=0,
+            help="Downscale frames so their longest side is at most this many pixels (0 keeps the rendered size)",
+        )
         parser.add_argument(
             "--scene-timeout",
             type=int,
             default=DEFAULT_CONFIG["scene_timeout"],
             help="Maximum seconds allowed for a single scene render (set to 0 to disable)",
         )
+        parser.add_argument(
+            "--render-workers",
+            type=int,
+            default=DEFAULT_CONFIG["render_workers"],
+            help="Maximum number of scenes rendered in parallel (defaults to the CPU count)",
+        )
+        parser.add_argument(
+            "--render-backend",
+            type=str,
+            default=DEFAULT_CONFIG["render_backend"],
+            choices=["subprocess", "warm", "batch"],
+            help="How review scenes are rendered: a fresh `manim` process per scene (subprocess), long-lived workers with manim pre-imported (warm), or all scenes in a single process (batch)",
+        )
+        parser.add_argument(
+            "--render-cache-dir",
+            type=str,
+            default=DEFAULT_CONFIG["render_cache_dir"],
+            help="Directory of the persistent scene render cache shared across review cycles and runs",
+        )
+        parser.add_argument(
+            "--render-cache-max-mb",
+            type=int,
+            default=DEFAULT_CONFIG["render_cache_max_mb"],
+            help="Size budget of the scene render cache in MB (least recently used entries are evicted)",
+        )
+        parser.add_argument(
+            "--no-render-cache",
+            action="store_true",
+            default=False,
+            help="Disable the scene render cache and always re-render every scene",
+        )
+        parser.add_argument(
+            "--asset-cache-dir",
+            type=str,
+            default=DEFAULT_CONFIG["asset_cache_dir"],
+            help="Directory of the Tex/MathTex and Text SVG cache shared by all renders and runs",
+        )
+        parser.add_argument(
+            "--asset-cache-max-mb",
+            type=int,
+            default=DEFAULT_CONFIG["asset_cache_max_mb"],
+            help="Size budget of the Tex/Text SVG cache in MB (least recently used SVGs are evicted)",
+        )
+        parser.add_argument(
+            "--no-asset-cache",
+            action="store_true",
+            default=False,
+            help="Disable the shared Tex/Text SVG cache (each run compiles its own LaTeX)",
+        )
+        parser.add_argument(
+            "--no-tex-precompile",
+            action="store_true",
+            default=False,
+            help="Do not compile the script's literal Tex/MathTex strings in parallel before rendering",
+        )
+        parser.add_argument(
+            "--no-preflight",
+            action="store_true",
+            default=False,
+            help="Skip static validation of generated code before launching Manim",
+        )
+        parser.add_argument(
+            "--execution-mode",
+            type=str,
+            default=DEFAULT_CONFIG["execution_mode"],
+            choices=["full", "validate", "auto"],
+            help="How review executions run scenes: render full videos (full), only run construct() and save last frames (validate), or validate until the enhanced visual review applies (auto)",
+        )
+        parser.add_argument(
+            "--review-profile",
+            type=str,
+            default=DEFAULT_CONFIG["review_profile"],
+            choices=list(RENDER_PROFILES),
+            help="Render quality of review executions: draft (240p10), review (480p15), final (1080p60) or 4k; draft is enough when vision is disabled",
+        )
+        parser.add_argument(
+            "--final-profile",
+            type=str,
+            default=DEFAULT_CONFIG["final_profile"],
+            choices=list(RENDER_PROFILES),
+            help="Render quality of the final video: draft (240p10), review (480p15), final (1080p60) or 4k",
+        )
+        parser.add_argument(
+            "--review-time-scale",
+            type=float,
+            default=DEFAULT_CONFIG["review_time_scale"],
+            help="Scale every run_time and wait of review renders by this factor, e.g. 0.25 (1 disables; final renders are never compressed)",
+        )
+        parser.add_argument(
+            "--promote-review-clips",
+            action="store_true",
+            default=False,
+            help="Build the final video from the last successful review render's clips even when the review profile is below the final one (automatic when both profiles match)",
+        )
+        parser.add_argument(
+            "--speculative-render",
+            action="store_true",
+            default=False,
+            help="Start the final render of each fully successful revision in the background while the reviews continue",
+        )
+        parser.add_argument(
+            "--shard-scenes",
+            action="store_true",
+            default=False,
+            help="Split long scenes into animation ranges rendered in parallel for the final video",
+        )
+        parser.add_argument(
+            "--sandbox",
+            action="store_true",
+            default=False,
+            help="Run renders under resource limits and record their peak memory and CPU time (POSIX only)",
+        )
+        parser.add_argument(
+            "--max-memory-mb",
+            type=int,
+            default=0,
+            help="Address space limit of a sandboxed render in MB (0 for no limit, implies --sandbox)",
+        )
+        parser.add_argument(
+            "--max-cpu-seconds",
+            type=int,
+            default=0,
+            help="CPU time limit of a sandboxed scene render in seconds (0 for no limit, implies --sandbox)",
+        )
+        parser.add_argument(
+            "--max-open-files",
+            type=int,
+            default=0,
+            help="Open file limit of a sandboxed render (0 for no limit, implies --sandbox)",
+        )
         parser.add_argument(
             "--headless",
             action="store_true",
@@ -256,11 +471,38 @@ class Config:
             "vision_enabled": vision_enabled,
             "reasoning": reasoning_config if reasoning_config else None,
             "provider": args.provider,
+            "requests_per_minute": args.requests_per_minute or None,
+            "tokens_per_minute": args.tokens_per_minute or None,
+            "llm_cache_path": args.llm_cache_path if args.llm_cache else None,
+            "llm_cache_max_mb": args.llm_cache_max_mb,
+            "llm_cache_ttl_hours": args.llm_cache_ttl_hours or None,
             "success_threshold": args.success_threshold,
             "frame_extraction_mode": args.frame_extraction_mode,
             "frame_count": args.frame_count,
+            "frame_format": args.frame_format,
+            "frame_quality": min(100, max(1, args.frame_quality)),
+            "frame_max_dimension": args.frame_max_dimension or None,
             "headless": args.headless,
             "scene_timeout": None if args.scene_timeout == 0 else args.scene_timeout,
+            "render_workers": max(1, args.render_workers),
+            "render_backend": args.render_backend,
+            "render_cache_dir": None if args.no_render_cache else args.render_cache_dir,
+            "render_cache_max_mb": args.render_cache_max_mb,
+            "asset_cache_dir": None if args.no_asset_cache else args.asset_cache_dir,
+            "asset_cache_max_mb": args.asset_cache_max_mb,
+            "tex_precompile": not args.no_tex_precompile,
+            "preflight": not args.no_preflight,
+            "execution_mode": args.execution_mode,
+            "shard_scenes": args.shard_scenes,
+            "review_profile": args.review_profile,
+            "final_profile": args.final_profile,
+            "review_time_scale": self._review_time_scale(args),
+            "promote_review_clips": args.promote_review_clips,
+            "speculative_render": args.speculative_render,
+            "sandbox": self._sandbox_enabled(args),
+            "max_memory_mb": args.max_memory_mb or None,
+            "max_cpu_seconds": args.max_cpu_seconds or None,
+            "max_open_files": args.max_open_files or None,
         }
 
     def _build_settings_table(
@@ -308,9 +550,63 @@ class Config:
             "Frame Count",
             str(args.frame_count) if args.frame_extraction_mode == "fixed_count" else "1",
         )
+        frame_encoding = args.frame_format
+        if args.frame_format != "png":
+            frame_encoding += f" (quality {args.frame_quality})"
+        if args.frame_max_dimension:
+            frame_encoding += f", max {args.frame_max_dimension}px"
+        table.add_row("Frame Encoding", frame_encoding)
         table.add_row("Scene Rendering Timeout", scene_timeout)
+        table.add_row("Render Workers", str(args.render_workers))
+        table.add_row("Render Backend", args.render_backend)
+        table.add_row(
+            "Render Cache",
+            "[yellow]Disabled[/yellow]"
+            if args.no_render_cache
+            else f"{args.render_cache_dir} ({args.render_cache_max_mb} MB)",
+        )
+        table.add_row(
+            "Tex/Text Cache",
+            "[yellow]Disabled[/yellow]"
+            if args.no_asset_cache
+            else f"{args.asset_cache_dir} ({args.asset_cache_max_mb} MB)",
+        )
+        table.add_row(
+            "Tex Pre-compilation",
+            "[yellow]Disabled (no Tex/Text cache)[/yellow]"
+            if args.no_asset_cache
+            else self._format_bool(not args.no_tex_precompile),
+        )
+        table.add_row("Pre-flight Validation", self._format_bool(not args.no_preflight))
+        table.add_row("Execution Mode", args.execution_mode)
+        table.add_row("Shard Long Scenes", self._format_bool(args.shard_scenes))
+        table.add_row(
+            "Render Profiles",
+            f"review: {self._format_profile(args.review_profile)}, "
+            f"final: {self._format_profile(args.final_profile)}",
+        )
+        review_time_scale = self._review_time_scale(args)
+        table.add_row(
+            "Review Time Scale",
+            f"{review_time_scale:g}x" if review_time_scale != 1 else "[yellow]Disabled[/yellow]",
+        )
+        table.add_row("Promote Review Clips", self._format_promotion(args))
+        table.add_row("Speculative Final Render", self._format_bool(args.speculative_render))
+        table.add_row("Render Sandbox", self._format_sandbox(args))
         table.add_row("Reasoning", reasoning_summary)
         table.add_row("Provider", args.provider or "Auto")
+        table.add_row(
+            "LLM Rate Limits",
+            f"{args.requests_per_minute or 'unlimited'} requests/min, "
+            f"{args.tokens_per_minute or 'unlimited'} tokens/min",
+        )
+        table.add_row(
+            "LLM Response Cache",
+            f"{args.llm_cache_path} ({args.llm_cache_max_mb} MB, "
+            + (f"{args.llm_cache_ttl_hours:g}h TTL)" if args.llm_cache_ttl_hours else "no TTL)")
+            if args.llm_cache
+            else "[yellow]Disabled[/yellow]",
+        )
         table.add_row("Force Vision", self._format_bool(args.force_vision))
         table.add_row(
             "Vision (Main Model)",
@@ -372,3 +668,40 @@ class Config:
             summary_parts.append(f"max_tokens={max_tokens}")
 
         return ", ".join(summary_parts)
+
+    def _sandbox_enabled(self, args) -> bool:
+        """Setting any resource limit turns the render sandbox on."""
+        return bool(
+            args.sandbox or args.max_memory_mb or args.max_cpu_seconds or args.max_open_files
+        )
+
+    def _format_sandbox(self, args) -> str:
+        """Create a concise summary of the render sandbox limits."""
+        if not self._sandbox_enabled(args):
+            return self._format_bool(False, false_label="Disabled", false_color="yellow")
+
+        limits: list[str] = []
+        if args.max_memory_mb:
+            limits.append(f"memory={args.max_memory_mb} MB")
+        if args.max_cpu_seconds:
+            limits.append(f"cpu={args.max_cpu_seconds}s")
+        if args.max_open_files:
+            limits.append(f"files={args.max_open_files}")
+        return ", ".join(limits) or "Accounting only"
+
+    def _review_time_scale(self, args) -> float:
+        """Time scale of review renders; values outside (0, 1) disable compression."""
+        return args.review_time_scale if 0 < args.review_time_scale < 1 else 1.0
+
+    def _format_promotion(self, args) -> str:
+        """Summarize whether review clips become the final video."""
+        if self._review_time_scale(args) != 1:
+            return "[yellow]Disabled (time-compressed reviews)[/yellow]"
+        if args.review_profile == args.final_profile:
+            return "[green]Yes (matching profiles)[/green]"
+        return self._format_bool(args.promote_review_clips)
+
+    def _format_profile(self, name: str) -> str:
+        """Render profile name with its resolution and frame rate."""
+        profile = RENDER_PROFILES[name]
+        return f"{name} ({profile.folder})"
@@ -0,0 +1,92 @@
+"""Encoding of extracted video frames for artifacts and vision model payloads."""
+
+import base64
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+# image format -> (file extension, MIME type)
+FRAME_FORMATS = {
+    "png": (".png", "image/png"),
+    "jpeg": (".jpg", "image/jpeg"),
+    "webp": (".webp", "image/webp"),
+}
+
+
+@dataclass
+class EncodedFrame:
+    """
+    A frame encoded once; the data URL sent to vision models is only built on demand.
+
+    Attributes:
+        name: Frame name, derived from the scene name.
+        data: Encoded image bytes.
+        mime_type: MIME type of the encoded image.
+    """
+
+    name: str
+    data: bytes
+    mime_type: str = "image/png"
+
+    @property
+    def extension(self) -> str:
+        """File extension matching the image format."""
+        for extension, mime_type in FRAME_FORMATS.values():
+            if mime_type == self.mime_type:
+                return extension
+        return ".img"
+
+    def to_data_url(self) -> str:
+        """Base64 encode the frame as a data URL."""
+        return f"data:{self.mime_type};base64,{base64.b64encode(self.data).decode('utf-8')}"
+
+
+def encode_frame(
+    frame: np.ndarray,
+    image_format: str = "png",
+    quality: int = 85,
+    max_dimension: int | None = None,
+) -> bytes | None:
+    """
+    Encode a BGR frame, optionally downscaling it so its longest side fits max_dimension.
+
+    Args:
+        frame: The frame to encode
+        image_format: "png", "jpeg" or "webp"
+        quality: Quality from 1 to 100 for jpeg and webp (ignored for png)
+        max_dimension: Maximum width or height in pixels (None keeps the original size)
+
+    Returns:
+        The encoded image bytes, or None if encoding failed
+    """
+    height, width = frame.shape[:2]
+    if max_dimension and max(height, width) > max_dimension:
+        scale = max_dimension / max(height, width)
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+
+    extension, _ = FRAME_FORMATS[image_format]
+    if image_format == "jpeg":
+        params = [cv2.IMWRITE_JPEG_QUALITY, quality]
+    elif image_format == "webp":
+        params = [cv2.IMWRITE_WEBP_QUALITY, quality]
+    else:
+        params = []
+    success, buffer = cv2.imencode(extension, frame, params)
+    return buffer.tobytes() if success else None
+
+
+def reencode_image(
+    data: bytes,
+    image_format: str = "png",
+    quality: int = 85,
+    max_dimension: int | None = None,
+) -> bytes | None:
+    """Re-encode an image file's bytes (e.g. a PNG still), skipping work when it already fits."""
+    if image_format == "png" and not max_dimension:
+        return data
+    frame = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if frame is None:
+        return None
+    return encode_frame(frame, image_format, quality, max_dimension)
@@ -1,17 +1,26 @@
 """Utility functions for LLM interaction"""
 
+import asyncio
 import time
-from collections.abc import Generator
-from dataclasses import dataclass
+from collections.abc import AsyncGenerator, Generator
+from dataclasses import dataclass, field
 from typing import Any
 
 import litellm
-from litellm import RateLimitError, completion, model_cost
+from litellm import RateLimitError, acompletion, completion, model_cost
 from litellm.cost_calculator import completion_cost  # type: ignore
 from litellm.utils import register_model  # type: ignore
 from rich.console import Console
 from rich.prompt import Prompt
 
+from manim_generator.utils.llm_cache import LLMResponseCache, make_key
+from manim_generator.utils.rate_limit import (
+    estimate_tokens,
+    get_rate_limiter,
+    is_transient,
+    limit_key,
+)
+
 
 @dataclass
 class LiteLLMParams:
@@ -60,19 +69,24 @@ class StreamChunk:
     """
     Structured streaming response payload.
 
+    A stream yields one payload with the new tokens per received chunk, then a
+    final payload with the accumulated response, reasoning and usage.
+
     Attributes:
-        token: Latest text token emitted.
-        response: Accumulated response text so far.
-        usage: Usage and timing info, populated when available.
-        reasoning_token: Latest reasoning token emitted.
-        reasoning_content: Accumulated reasoning content so far.
+        token: Latest text token emitted ("" on the final payload).
+        response: Full response text, set on the final payload only.
+        usage: Usage and timing info, set on the final payload only.
+        reasoning_token: Latest reasoning token emitted ("" on the final payload).
+        reasoning_content: Full reasoning content, set on the final payload only.
+        final: Whether this is the final payload of the stream.
     """
 
     token: str
-    response: str
-    usage: dict[str, object]
-    reasoning_token: str
-    reasoning_content: str
+    response: str = ""
+    usage: dict[str, object] = field(default_factory=dict)
+    reasoning_token: str = ""
+    reasoning_content: str = ""
+    final: bool = False
 
 
 @dataclass
@@ -119,6 +133,28 @@ def _extract_completion_details(raw_details: Any) -> dict[str, int]:
     return completion_details
 
 
+def _extract_prompt_cache_tokens(usage: Any) -> tuple[int, int]:
+    """
+    Prompt tokens read from and written to the provider's prompt cache.
+
+    LiteLLM reports cache reads as `prompt_tokens_details.cached_tokens` (OpenAI
+    style) and, for Anthropic, also as `cache_read_input_tokens`; cache writes
+    only appear as Anthropic's `cache_creation_input_tokens`.
+    """
+    if usage is None:
+        return 0, 0
+
+    details = getattr(usage, "prompt_tokens_details", None)
+    if isinstance(details, dict):
+        cached_tokens = details.get("cached_tokens")
+    else:
+        cached_tokens = getattr(details, "cached_tokens", None)
+    if not cached_tokens:
+        cached_tokens = getattr(usage, "cache_read_input_tokens", None)
+    cache_write_tokens = getattr(usage, "cache_creation_input_tokens", None)
+    return int(cached_tokens or 0), int(cache_write_tokens or 0)
+
+
 def _build_usage_info(model: str, usage: Any, cost: float, llm_time: float) -> dict[str, object]:
     """Normalize usage payload with reasoning token details."""
     prompt_tokens = int((getattr(usage, "prompt_tokens", None) if usage else None) or 0)
@@ -129,6 +165,7 @@ def _build_usage_info(model: str, usage: Any, cost: float, llm_time: float) -> d
     completion_details = _extract_completion_details(completion_details_raw)
 
     reasoning_tokens = int(completion_details.get("reasoning_tokens", 0) or 0)
+    cached_prompt_tokens, cache_write_tokens = _extract_prompt_cache_tokens(usage)
     text_tokens = completion_details.get("text_tokens")
 
     if text_tokens is not None:
@@ -145,6 +182,8 @@ def _build_usage_info(model: str, usage: Any, cost: float, llm_time: float) -> d
         "total_tokens": total_tokens,
         "reasoning_tokens": reasoning_tokens,
         "answer_tokens": answer_tokens,
+        "cached_prompt_tokens": cached_prompt_tokens,
+        "cache_write_tokens": cache_write_tokens,
         "cost": cost,
         "llm_time": llm_time,
     }
@@ -155,6 +194,220 @@ def _build_usage_info(model: str, usage: Any, cost: float, llm_time: float) -> d
     return usage_info
 
 
+def _completion_result(model: str, response: Any, llm_time: float) -> CompletionResult:
+    """Build the CompletionResult of a non-streaming completion response."""
+    response_content = response["choices"][0]["message"]["content"]  # type: ignore
+
+    try:
+        # calculates cost for models - only fails if model not registered and user skipped manual registration
+        cost = completion_cost(response)
+    except Exception:
+        cost = 0.0
+
+    # Extract usage information
+    usage_info = _build_usage_info(
+        model=model,
+        usage=response.usage if hasattr(response, "usage") else None,
+        cost=cost,
+        llm_time=llm_time,
+    )
+
+    # extract reasoning content if available
+    reasoning_content = None
+    message = response["choices"][0]["message"]  # type: ignore
+    if hasattr(message, "reasoning_content") and message.reasoning_content:
+        reasoning_content = message.reasoning_content
+
+    return CompletionResult(
+        content=response_content,
+        usage=usage_info,
+        reasoning=reasoning_content,
+    )
+
+
+def _failed_completion(model: str, error: Exception, console: Console) -> CompletionResult:
+    """Report a failed completion and return the placeholder result the workflow continues with."""
+    console.print(f"[bold red]Error: {error}[/bold red]")
+    empty_usage = {
+        "model": model,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "total_tokens": 0,
+        "cost": 0.0,
+        "llm_time": 0.0,
+    }
+    return CompletionResult(
+        content="Review model failed to generate response.",
+        usage=empty_usage,
+        reasoning=None,
+    )
+
+
+class _Retries:
+    """Rate limiting and retries of one LLM request (see `utils/rate_limit.py`)."""
+
+    def __init__(
+        self,
+        model: str,
+        provider: str | None,
+        messages: list[dict],
+        max_retries: int,
+        console: Console,
+    ):
+        self.limiter = get_rate_limiter()
+        self.key = limit_key(model, provider)
+        self.tokens = estimate_tokens(messages)
+        self.max_retries = max_retries
+        self.console = console
+        self.retries = 0
+        self.waited = 0.0
+
+    def throttle(self) -> float:
+        """Seconds to wait for the request and token budgets before sending the request."""
+        delay = self.limiter.acquire(self.key, self.tokens)
+        self.waited += delay
+        return delay
+
+    def backoff(self, error: Exception) -> float:
+        """Seconds to wait before retrying after a transient error.
+
+        Raises:
+            Exception: If max retries are exceeded.
+        """
+        self.retries += 1
+        if self.retries >= self.max_retries:
+            raise Exception("[bold red]Max retries exceeded.[/bold red]") from error
+        delay = self.limiter.backoff(self.key, self.retries, error)
+        reason = (
+            "Rate limited"
+            if isinstance(error, RateLimitError)
+            else f"Request failed ({type(error).__name__})"
+        )
+        self.console.log(f"[bold yellow]{reason}. Waiting for {delay:.1f} seconds...[/bold yellow]")
+        self.waited += delay
+        return delay
+
+    def finish(self, usage: dict[str, object]) -> None:
+        """Correct the token budget with the real usage and record the time spent waiting."""
+        used_tokens = usage.get("total_tokens", 0)
+        self.limiter.record_usage(
+            self.key, self.tokens, used_tokens if isinstance(used_tokens, int) else 0
+        )
+        usage["rate_limit_wait"] = self.waited
+
+
+def _cache_lookup(
+    response_cache: LLMResponseCache | None, completion_args: dict[str, Any]
+) -> tuple[str | None, CompletionResult | None]:
+    """
+    Look up the response to a request in the cache.
+
+    Returns:
+        tuple: (cache key or None without a cache, result on a cache hit). A hit costs
+        nothing and its usage is flagged as cached.
+    """
+    if response_cache is None:
+        return None, None
+    lookup_start = time.time()
+    cache_key = make_key(completion_args)
+    cached = response_cache.get(cache_key)
+    if cached is None:
+        return cache_key, None
+    usage = {**cached.usage, "cost": 0.0, "llm_time": time.time() - lookup_start, "cached": True}
+    return cache_key, CompletionResult(
+        content=cached.content, usage=usage, reasoning=cached.reasoning
+    )
+
+
+def _cached_stream(cached: CompletionResult) -> list[StreamChunk]:
+    """Stream payloads of a cached response: the whole response, then the final payload."""
+    reasoning = cached.reasoning or ""
+    return [
+        StreamChunk(token=cached.content, reasoning_token=reasoning),
+        StreamChunk(
+            token="",
+            response=cached.content,
+            usage=cached.usage,
+            reasoning_content=reasoning,
+            final=True,
+        ),
+    ]
+
+
+class _StreamAccumulator:
+    """
+    Collects streamed completion chunks.
+
+    Tokens are kept in lists and joined once at the end, and the cost is computed
+    once from the last usage chunk, so a stream costs linear time in its length.
+    """
+
+    def __init__(self, model: str):
+        self.model = model
+        self.start = time.time()
+        self.response: list[str] = []
+        self.reasoning: list[str] = []
+        self.first_token_time: float | None = None
+        self.usage_chunk: Any = None
+
+    def add(self, chunk: Any) -> StreamChunk:
+        """Add a streamed chunk and return the payload with its new tokens."""
+        delta = chunk.choices[0].delta  # type: ignore
+        token = getattr(delta, "content", None) or ""
+        reasoning_token = getattr(delta, "reasoning_content", None) or ""
+
+        if token:
+            self.response.append(token)
+        if reasoning_token:
+            self.reasoning.append(reasoning_token)
+        if (token or reasoning_token) and self.first_token_time is None:
+            self.first_token_time = time.time() - self.start
+
+        if getattr(chunk, "usage", None):
+            self.usage_chunk = chunk
+
+        return StreamChunk(token=token, reasoning_token=reasoning_token)
+
+    def final(self) -> StreamChunk:
+        """Payload yielded once the stream has ended."""
+        return StreamChunk(
+            token="",
+            response="".join(self.response),
+            usage=self._usage(),
+            reasoning_content="".join(self.reasoning),
+            final=True,
+        )
+
+    def _usage(self) -> dict[str, object]:
+        """Usage info of the stream, from its last usage chunk."""
+        llm_time = time.time() - self.start
+        if self.usage_chunk is None:
+            usage: dict[str, object] = {
+                "model": self.model,
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+                "total_tokens": 0,
+                "reasoning_tokens": 0,
+                "answer_tokens": 0,
+                "cost": 0.0,
+                "llm_time": llm_time,
+            }
+        else:
+            try:
+                cost = completion_cost(self.usage_chunk)
+            except Exception:
+                cost = 0.0
+            usage = _build_usage_info(
+                model=self.model,
+                usage=self.usage_chunk.usage,
+                cost=cost,
+                llm_time=llm_time,
+            )
+        if self.first_token_time is not None:
+            usage["time_to_first_token"] = self.first_token_time
+        return usage
+
+
 def check_and_register_models(models: list[str], console: Console, headless: bool = False) -> None:
     """
     Checks if models are registered in the LiteLLM cost map.
@@ -233,9 +486,15 @@ def get_completion_with_retry(
     max_retries: int = 5,
     reasoning: dict | None = None,
     provider: str | None = None,
+    response_cache: LLMResponseCache | None = None,
 ) -> CompletionResult:
     """
-    Makes a non-streaming LLM completion request with automatic retry on rate limit errors.
+    Makes a non-streaming LLM completion request with automatic retry on transient errors.
+
+    Requests wait for the process-wide rate limits and retry rate limits, 5xx
+    responses, timeouts and connection errors with jittered exponential backoff
+    or after the provider's Retry-After. The time spent waiting is reported as
+    `rate_limit_wait` in the usage.
 
     Args:
         model (str): The name of the model to use for completion.
@@ -245,84 +504,97 @@ def get_completion_with_retry(
         max_retries (int, optional): Maximum number of retry attempts. Defaults to 5.
         reasoning (dict | None, optional): Reasoning parameters. Defaults to None.
         provider (str | None, optional): Provider to use. Defaults to None.
+        response_cache (LLMResponseCache | None, optional): Cache to serve and store
+            the response. Defaults to None.
 
     Returns:
         CompletionResult: Structured response containing content, usage, and reasoning (if any).
 
     Raises:
-        Exception: If max retries are exceeded and still getting rate limited.
+        Exception: If max retries are exceeded and the request still fails.
     """
-    retries = 0
-
-    while retries < max_retries:
+    params = LiteLLMParams(
+        model=model,
+        messages=messages,
+        temperature=temperature,
+        stream=False,
+        reasoning=reasoning,
+        provider=provider,
+    )
+    completion_args = params.to_kwargs()
+    cache_key, cached = _cache_lookup(response_cache, completion_args)
+    if cached is not None:
+        return cached
+
+    retries = _Retries(model, provider, messages, max_retries, console)
+
+    while True:
+        delay = retries.throttle()
+        if delay:
+            time.sleep(delay)
         try:
-            params = LiteLLMParams(
-                model=model,
-                messages=messages,
-                temperature=temperature,
-                stream=False,
-                reasoning=reasoning,
-                provider=provider,
-            )
-            completion_args = params.to_kwargs()
-
             request_start = time.time()
             response = completion(**completion_args)  # type: ignore
-            request_end = time.time()
-            llm_time = request_end - request_start
+            result = _completion_result(model, response, time.time() - request_start)
+            retries.finish(result.usage)
+            if cache_key is not None:
+                response_cache.put(cache_key, result.content, result.reasoning, result.usage)
+            return result
 
-            response_content = response["choices"][0]["message"]["content"]  # type: ignore
+        except Exception as e:
+            if not is_transient(e):
+                return _failed_completion(model, e, console)
+            time.sleep(retries.backoff(e))
 
-            try:
-                # calculates cost for models - only fails if model not registered and user skipped manual registration
-                cost = completion_cost(response)
-            except Exception:
-                cost = 0.0
 
-            # Extract usage information
-            usage_info = _build_usage_info(
-                model=model,
-                usage=response.usage if hasattr(response, "usage") else None,
-                cost=cost,
-                llm_time=llm_time,
-            )
-
-            # extract reasoning content if available
-            reasoning_content = None
-            message = response["choices"][0]["message"]  # type: ignore
-            if hasattr(message, "reasoning_content") and message.reasoning_content:
-                reasoning_content = message.reasoning_content
+async def get_completion_with_retry_async(
+    model: str,
+    messages: list[dict],
+    temperature: float | None,
+    console: Console,
+    max_retries: int = 5,
+    reasoning: dict | None = None,
+    provider: str | None = None,
+    response_cache: LLMResponseCache | None = None,
+) -> CompletionResult:
+    """
+    Async variant of `get_completion_with_retry` built on `litellm.acompletion`.
 
-            return CompletionResult(
-                content=response_content,
-                usage=usage_info,
-                reasoning=reasoning_content,
-            )
+    Waits between retries without blocking the event loop; takes the same
+    arguments and returns the same result.
+    """
+    params = LiteLLMParams(
+        model=model,
+        messages=messages,
+        temperature=temperature,
+        stream=False,
+        reasoning=reasoning,
+        provider=provider,
+    )
+    completion_args = params.to_kwargs()
+    cache_key, cached = _cache_lookup(response_cache, completion_args)
+    if cached is not None:
+        return cached
+
+    retries = _Retries(model, provider, messages, max_retries, console)
+
+    while True:
+        delay = retries.throttle()
+        if delay:
+            await asyncio.sleep(delay)
+        try:
+            request_start = time.time()
+            response = await acompletion(**completion_args)  # type: ignore
+            result = _completion_result(model, response, time.time() - request_start)
+            retries.finish(result.usage)
+            if cache_key is not None:
+                response_cache.put(cache_key, result.content, result.reasoning, result.usage)
+            return result
 
-        except RateLimitError:
-            retries += 1
-            wait_time = min(2 * retries, 30)
-            console.log(
-                f"[bold yellow]Rate limited. Waiting for {wait_time} seconds...[/bold yellow]"
-            )
-            time.sleep(wait_time)
         except Exception as e:
-            console.print(f"[bold red]Error: {e}[/bold red]")
-            empty_usage = {
-                "model": model,
-                "prompt_tokens": 0,
-                "completion_tokens": 0,
-                "total_tokens": 0,
-                "cost": 0.0,
-                "llm_time": 0.0,
-            }
-            return CompletionResult(
-                content="Review model failed to generate response.",
-                usage=empty_usage,
-                reasoning=None,
-            )
-
-    raise Exception("[bold red]Max retries exceeded.[/bold red]")
+            if not is_transient(e):
+                return _failed_completion(model, e, console)
+            await asyncio.sleep(retries.backoff(e))
 
 
 def get_streaming_completion_with_retry(
@@ -333,9 +605,12 @@ def get_streaming_completion_with_retry(
     max_retries: int = 5,
     reasoning: dict | None = None,
     provider: str | None = None,
+    response_cache: LLMResponseCache | None = None,
 ) -> Generator[StreamChunk, None, None]:
     """
-    Makes a streaming LLM completion request with automatic retry on rate limit errors.
+    Makes a streaming LLM completion request with automatic retry on transient errors.
+
+    Rate limits and retries work as in `get_completion_with_retry`.
 
     Args:
         model (str): The name of the model to use for completion.
@@ -345,95 +620,120 @@ def get_streaming_completion_with_retry(
         max_retries (int, optional): Maximum number of retry attempts. Defaults to 5.
         reasoning (dict, optional): Reasoning parameters. Defaults to None.
         provider (str, optional): Provider to use. Defaults to None.
+        response_cache (LLMResponseCache | None, optional): Cache to serve and store
+            the response; a cached response is yielded as a single chunk. Defaults to None.
 
     Yields:
-        StreamChunk: Structured streaming payload containing the latest token,
-            accumulated response, usage data, current reasoning token, and full
-            reasoning content seen so far.
+        StreamChunk: The new response and reasoning tokens of each received chunk,
+            then a final payload with the full response, reasoning and usage.
 
     Raises:
-        Exception: If max retries are exceeded and still getting rate limited.
+        Exception: If max retries are exceeded and the request still fails.
     """
-    retries = 0
-
-    while retries < max_retries:
+    params = LiteLLMParams(
+        model=model,
+        messages=messages,
+        temperature=temperature,
+        stream=True,
+        reasoning=reasoning,
+        provider=provider,
+    )
+    completion_args = params.to_kwargs()
+    completion_args["stream_options"] = {"include_usage": True}
+    cache_key, cached = _cache_lookup(response_cache, completion_args)
+    if cached is not None:
+        yield from _cached_stream(cached)
+        return
+
+    retries = _Retries(model, provider, messages, max_retries, console)
+
+    while True:
+        delay = retries.throttle()
+        if delay:
+            time.sleep(delay)
         try:
-            params = LiteLLMParams(
-                model=model,
-                messages=messages,
-                temperature=temperature,
-                stream=True,
-                reasoning=reasoning,
-                provider=provider,
-            )
-            completion_args = params.to_kwargs()
-            completion_args["stream_options"] = {"include_usage": True}
-
-            stream_start = time.time()
+            stream = _StreamAccumulator(model)
             response = completion(**completion_args)  # type: ignore
-            full_response = ""
-            full_reasoning = ""
-            final_usage = {
-                "model": model,
-                "prompt_tokens": 0,
-                "completion_tokens": 0,
-                "total_tokens": 0,
-                "reasoning_tokens": 0,
-                "answer_tokens": 0,
-                "cost": 0.0,
-                "llm_time": 0.0,
-            }
 
             for chunk in response:
                 try:
-                    delta = chunk.choices[0].delta  # type: ignore
-                    token = getattr(delta, "content", None) or ""
-                    reasoning_token = getattr(delta, "reasoning_content", None) or ""
-
-                    if token:
-                        full_response += token
-                    if reasoning_token:
-                        full_reasoning += reasoning_token
-
-                    if hasattr(chunk, "usage") and chunk.usage:  # type: ignore
-                        try:
-                            cost = completion_cost(chunk)
-                        except Exception:
-                            cost = 0.0
-
-                        stream_end = time.time()
-                        final_usage = _build_usage_info(
-                            model=model,
-                            usage=chunk.usage,  # type: ignore
-                            cost=cost,
-                            llm_time=stream_end - stream_start,
-                        )
-
-                    yield StreamChunk(
-                        token=token,
-                        response=full_response,
-                        usage=final_usage,
-                        reasoning_token=reasoning_token,
-                        reasoning_content=full_reasoning,
-                    )
+                    yield stream.add(chunk)
                 except Exception as e:
                     console.print(f"[bold red]Error processing stream chunk: {e}[/bold red]")
                     raise e
 
-            yield StreamChunk(
-                token="",
-                response=full_response,
-                usage=final_usage,
-                reasoning_token="",
-                reasoning_content=full_reasoning,
-            )
+            final = stream.final()
+            retries.finish(final.usage)
+            if cache_key is not None:
+                response_cache.put(
+                    cache_key, final.response, final.reasoning_content or None, final.usage
+                )
+            yield final
             return
-        except RateLimitError:
-            retries += 1
-            wait_time = min(2 * retries, 30)
-            console.log(
-                f"[bold yellow]Rate limited. Waiting for {wait_time} seconds...[/bold yellow]"
-            )
-            time.sleep(wait_time)
+        except Exception as e:
+            if not is_transient(e):
+                raise
+            time.sleep(retries.backoff(e))
+
 
-    raise Exception("[bold red]Max retries exceeded.[/bold red]")
+async def get_streaming_completion_with_retry_async(
+    model: str,
+    messages: list[dict],
+    temperature: float | None,
+    console: Console,
+    max_retries: int = 5,
+    reasoning: dict | None = None,
+    provider: str | None = None,
+    response_cache: LLMResponseCache | None = None,
+) -> AsyncGenerator[StreamChunk, None]:
+    """
+    Async variant of `get_streaming_completion_with_retry` built on `litellm.acompletion`.
+
+    Chunks are read from the async stream and retries wait without blocking the
+    event loop; takes the same arguments and yields the same payloads.
+    """
+    params = LiteLLMParams(
+        model=model,
+        messages=messages,
+        temperature=temperature,
+        stream=True,
+        reasoning=reasoning,
+        provider=provider,
+    )
+    completion_args = params.to_kwargs()
+    completion_args["stream_options"] = {"include_usage": True}
+    cache_key, cached = _cache_lookup(response_cache, completion_args)
+    if cached is not None:
+        for chunk in _cached_stream(cached):
+            yield chunk
+        return
+
+    retries = _Retries(model, provider, messages, max_retries, console)
+
+    while True:
+        delay = retries.throttle()
+        if delay:
+            await asyncio.sleep(delay)
+        try:
+            stream = _StreamAccumulator(model)
+            response = await acompletion(**completion_args)  # type: ignore
+
+            async for chunk in response:  # type: ignore
+                try:
+                    yield stream.add(chunk)
+                except Exception as e:
+                    console.print(f"[bold red]Error processing stream chunk: {e}[/bold red]")
+                    raise e
+
+            final = stream.final()
+            retries.finish(final.usage)
+            if cache_key is not None:
+                response_cache.put(
+                    cache_key, final.response, final.reasoning_content or None, final.usage
+                )
+            yield final
+            return
+        except Exception as e:
+            if not is_transient(e):
+                raise
+            await asyncio.sleep(retries.backoff(e))
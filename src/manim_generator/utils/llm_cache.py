@@ -0,0 +1,214 @@
+"""Persistent cache of LLM responses.
+
+Entries are keyed by a stable hash of the completion arguments (model, messages,
+temperature, reasoning and provider, see `LiteLLMParams.to_kwargs`). Images in
+the messages enter the key as hashes of their data, and whether the response was
+streamed does not matter. Each entry stores the response content, the reasoning
+and the usage of the original request.
+
+The cache is a single SQLite database that any number of threads and processes
+can share, e.g. concurrent API requests or benchmark runs. Entries expire after a
+time to live, and the least recently used entries are evicted once the stored
+responses exceed the size budget.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# arguments that do not change the response
+IGNORED_KWARGS = ("stream", "stream_options")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    content TEXT NOT NULL,
+    reasoning TEXT,
+    usage TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL
+)
+"""
+
+
+@dataclass
+class CachedResponse:
+    """
+    A cache hit for one LLM request.
+
+    Attributes:
+        content: Model response text.
+        reasoning: Reasoning content of the response, if any.
+        usage: Usage information of the original request.
+        created: Time the response was stored, in seconds since the epoch.
+    """
+
+    content: str
+    reasoning: str | None
+    usage: dict[str, object]
+    created: float
+
+
+def _hash_images(value: Any) -> Any:
+    """Replace inline image data in message content by a hash of the data."""
+    if isinstance(value, dict):
+        if value.get("type") == "image_url":
+            image_url = value.get("image_url")
+            url = image_url.get("url", "") if isinstance(image_url, dict) else str(image_url)
+            return {
+                "type": "image_url",
+                "sha256": hashlib.sha256(url.encode("utf-8")).hexdigest(),
+            }
+        return {key: _hash_images(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_hash_images(item) for item in value]
+    return value
+
+
+def make_key(completion_kwargs: dict[str, Any]) -> str:
+    """Stable key of the response to these completion arguments."""
+    payload = {
+        name: _hash_images(value) if name == "messages" else value
+        for name, value in completion_kwargs.items()
+        if name not in IGNORED_KWARGS
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Size-bounded LRU cache of LLM responses with a time to live, backed by SQLite."""
+
+    def __init__(self, path: str, max_bytes: int, ttl_seconds: float | None):
+        """
+        Args:
+            path: SQLite database file, created if missing
+            max_bytes: Size budget of the stored responses
+            ttl_seconds: Seconds after which a response expires (None keeps responses until evicted)
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.saved_cost = 0.0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for one transaction; a connection per operation keeps
+        the cache usable from any thread."""
+        db = sqlite3.connect(self.path, timeout=30)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def _expired_before(self) -> float:
+        return time.time() - self.ttl_seconds if self.ttl_seconds is not None else float("-inf")
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the cached response for a key, or None on a miss."""
+        try:
+            with self._connect() as db:
+                row = db.execute(
+                    "SELECT content, reasoning, usage, created FROM responses "
+                    "WHERE key = ? AND created >= ?",
+                    (key, self._expired_before()),
+                ).fetchone()
+                if row is not None:
+                    db.execute(
+                        "UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key)
+                    )
+            usage = json.loads(row[2]) if row is not None else None
+        except (sqlite3.Error, ValueError) as e:
+            logger.debug("Could not read LLM cache entry %s: %s", key, e)
+            row = None
+
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.saved_cost += float(usage.get("cost", 0.0) or 0.0)
+        return CachedResponse(content=row[0], reasoning=row[1], usage=usage, created=row[3])
+
+    def put(self, key: str, content: str, reasoning: str | None, usage: dict[str, object]) -> None:
+        """Store a response, then drop expired entries and evict if over budget."""
+        encoded_usage = json.dumps(usage, default=str)
+        size = len(content.encode("utf-8")) + len((reasoning or "").encode("utf-8"))
+        size += len(encoded_usage)
+        now = time.time()
+        try:
+            with self._connect() as db:
+                db.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, content, reasoning, encoded_usage, size, now, now),
+                )
+        except sqlite3.Error as e:
+            logger.debug("Could not store LLM cache entry %s: %s", key, e)
+            return
+
+        with self._lock:
+            self.stores += 1
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete expired responses, then the least recently used until the cache fits its budget."""
+        try:
+            with self._connect() as db:
+                expired = db.execute(
+                    "DELETE FROM responses WHERE created < ?", (self._expired_before(),)
+                ).rowcount
+                total = db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+                evicted = 0
+                if total > self.max_bytes:
+                    stale = []
+                    for key, size in db.execute(
+                        "SELECT key, size FROM responses ORDER BY last_used"
+                    ):
+                        if total <= self.max_bytes:
+                            break
+                        stale.append((key,))
+                        total -= size
+                    db.executemany("DELETE FROM responses WHERE key = ?", stale)
+                    evicted = len(stale)
+        except sqlite3.Error as e:
+            logger.debug("Could not evict LLM cache entries: %s", e)
+            return
+
+        with self._lock:
+            self.evictions += expired + evicted
+
+    def get_stats(self) -> dict:
+        """Return hit/miss statistics for the workflow summary."""
+        lookups = self.hits + self.misses
+        return {
+            "path": self.path,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "saved_cost": self.saved_cost,
+        }
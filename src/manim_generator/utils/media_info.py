@@ -0,0 +1,272 @@
+"""Duration and video stream info read from MP4 headers, with an ffprobe fallback.
+
+MP4/MOV files keep their metadata in the `moov` box: `mvhd` holds the movie
+duration, and each `trak` describes one stream (`tkhd` for the display size, `mdhd`
+for the stream's timescale and duration, `hdlr` for its kind and `stts` for the
+number of samples, i.e. frames for a video track). Only box headers are read to
+find `moov`, so probing costs a few small reads wherever `moov` sits in the file.
+Other containers, and files whose headers don't give a duration (e.g. fragmented
+MP4), are probed with ffprobe.
+
+Results are memoized by (path, mtime, size), so a file rewritten in place is
+probed again.
+"""
+
+import json
+import logging
+import os
+import struct
+import subprocess
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+# a moov box larger than this is not parsed in process (ffprobe handles it)
+MAX_MOOV_BYTES = 64 * 1024 * 1024
+
+# number of (path, mtime, size) probe results kept in memory
+PROBE_CACHE_SIZE = 256
+
+_CONTAINER_BOXES = {b"trak", b"mdia", b"minf", b"stbl"}
+
+
+@dataclass(frozen=True)
+class VideoInfo:
+    """
+    Duration and video stream properties of a media file.
+
+    Attributes:
+        duration: Duration of the file in seconds.
+        width: Width of the video stream in pixels (None without a video stream).
+        height: Height of the video stream in pixels (None without a video stream).
+        fps: Average frame rate of the video stream (None if unknown).
+        frame_count: Number of frames of the video stream (None if unknown).
+    """
+
+    duration: float
+    width: int | None = None
+    height: int | None = None
+    fps: float | None = None
+    frame_count: int | None = None
+
+    @property
+    def stream_format(self) -> tuple:
+        """(width, height, fps) of the video stream, which must match to concat by copy."""
+        return self.width, self.height, round(self.fps, 2) if self.fps else None
+
+
+def _iter_boxes(data: bytes, start: int = 0, end: int | None = None) -> Iterator[tuple]:
+    """Yield (type, payload start, box end) for the boxes in data[start:end]."""
+    end = len(data) if end is None else end
+    offset = start
+    while offset + 8 <= end:
+        size, box_type = struct.unpack_from(">I4s", data, offset)
+        header_size = 8
+        if size == 1:
+            if offset + 16 > end:
+                return
+            size = struct.unpack_from(">Q", data, offset + 8)[0]
+            header_size = 16
+        elif size == 0:
+            size = end - offset
+        if size < header_size or offset + size > end:
+            return
+        yield box_type, offset + header_size, offset + size
+        offset += size
+
+
+def _find_moov(f, file_size: int) -> bytes | None:
+    """Read the moov box of an open MP4 file by skipping over the top-level boxes."""
+    offset = 0
+    while offset + 8 <= file_size:
+        f.seek(offset)
+        header = f.read(16)
+        if len(header) < 8:
+            return None
+        size, box_type = struct.unpack_from(">I4s", header)
+        header_size = 8
+        if size == 1:
+            if len(header) < 16:
+                return None
+            size = struct.unpack_from(">Q", header, 8)[0]
+            header_size = 16
+        elif size == 0:
+            size = file_size - offset
+        if offset == 0 and box_type != b"ftyp":
+            return None
+        if size < header_size:
+            return None
+        if box_type == b"moov":
+            if size > MAX_MOOV_BYTES:
+                return None
+            f.seek(offset + header_size)
+            payload = f.read(size - header_size)
+            return payload if len(payload) == size - header_size else None
+        offset += size
+    return None
+
+
+def _timescale_and_duration(data: bytes, start: int) -> tuple[int, int]:
+    """(timescale, duration) of an mvhd or mdhd box payload."""
+    if data[start] == 1:
+        return struct.unpack_from(">IQ", data, start + 20)
+    return struct.unpack_from(">II", data, start + 12)
+
+
+def _parse_track(data: bytes, start: int, end: int, track: dict | None = None) -> dict:
+    """Collect the stream kind, size, timescale and sample count of a trak box."""
+    track = {} if track is None else track
+    for box_type, payload, box_end in _iter_boxes(data, start, end):
+        if box_type in _CONTAINER_BOXES:
+            _parse_track(data, payload, box_end, track)
+        elif box_type == b"tkhd":
+            size_offset = payload + (88 if data[payload] == 1 else 76)
+            width, height = struct.unpack_from(">II", data, size_offset)
+            track["width"], track["height"] = width >> 16, height >> 16
+        elif box_type == b"mdhd":
+            track["timescale"], track["duration"] = _timescale_and_duration(data, payload)
+        elif box_type == b"hdlr":
+            # QuickTime files add a data handler hdlr in minf after the media one in mdia
+            track.setdefault("handler", data[payload + 8 : payload + 12])
+        elif box_type == b"stts":
+            (entry_count,) = struct.unpack_from(">I", data, payload + 4)
+            track["samples"] = sum(
+                struct.unpack_from(">I", data, payload + 8 + 8 * i)[0] for i in range(entry_count)
+            )
+    return track
+
+
+def read_mp4_info(video_path: str) -> VideoInfo | None:
+    """
+    Read the duration and video stream info of an MP4/MOV file from its moov box.
+
+    Args:
+        video_path: Path to the video file
+
+    Returns:
+        VideoInfo, or None if the file is not an MP4 whose headers give a duration
+    """
+    try:
+        with open(video_path, "rb") as f:
+            moov = _find_moov(f, os.fstat(f.fileno()).st_size)
+        if moov is None:
+            return None
+
+        duration = None
+        video_track = None
+        for box_type, payload, box_end in _iter_boxes(moov):
+            if box_type == b"mvhd":
+                timescale, units = _timescale_and_duration(moov, payload)
+                duration = units / timescale if timescale else None
+            elif box_type == b"trak" and video_track is None:
+                track = _parse_track(moov, payload, box_end)
+                if track.get("handler") == b"vide":
+                    video_track = track
+        if not duration:
+            return None
+        if video_track is None:
+            return VideoInfo(duration)
+
+        frame_count = video_track.get("samples")
+        fps = None
+        if frame_count and video_track.get("timescale") and video_track.get("duration"):
+            fps = round(frame_count * video_track["timescale"] / video_track["duration"], 3)
+        return VideoInfo(
+            duration,
+            video_track.get("width"),
+            video_track.get("height"),
+            fps,
+            frame_count,
+        )
+    except (OSError, struct.error, IndexError) as e:
+        logger.debug("Could not read MP4 headers of %s: %s", video_path, e)
+        return None
+
+
+def _parse_frame_rate(rate: str | None) -> float | None:
+    """Convert an ffprobe frame rate such as "60/1" to a float."""
+    try:
+        numerator, _, denominator = (rate or "").partition("/")
+        value = float(numerator) / float(denominator or 1)
+    except (ValueError, ZeroDivisionError):
+        return None
+    return round(value, 3) if value > 0 else None
+
+
+def ffprobe_info(video_path: str) -> VideoInfo | None:
+    """
+    Probe the duration and first video stream of a media file with ffprobe.
+
+    Args:
+        video_path: Path to the video file
+
+    Returns:
+        VideoInfo, or None if ffprobe failed
+    """
+    command = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-select_streams",
+        "v:0",
+        "-show_entries",
+        "format=duration:stream=width,height,avg_frame_rate,nb_frames",
+        "-of",
+        "json",
+        video_path,
+    ]
+    try:
+        result = subprocess.run(command, capture_output=True, text=True, check=True, timeout=30)
+        data = json.loads(result.stdout)
+        duration = float(data["format"]["duration"])
+    except (
+        OSError,
+        subprocess.CalledProcessError,
+        subprocess.TimeoutExpired,
+        json.JSONDecodeError,
+        KeyError,
+        ValueError,
+    ) as e:
+        logger.error(f"Error probing video {video_path}: {e}")
+        return None
+
+    streams = data.get("streams") or [{}]
+    stream = streams[0]
+    nb_frames = stream.get("nb_frames")
+    return VideoInfo(
+        duration,
+        stream.get("width"),
+        stream.get("height"),
+        _parse_frame_rate(stream.get("avg_frame_rate")),
+        int(nb_frames) if str(nb_frames).isdigit() else None,
+    )
+
+
+@lru_cache(maxsize=PROBE_CACHE_SIZE)
+def _probe_file(video_path: str, mtime_ns: int, size: int, use_ffprobe: bool) -> VideoInfo | None:
+    """Probe one version of a file; mtime_ns and size only key the cache."""
+    info = read_mp4_info(video_path)
+    if info is None and use_ffprobe:
+        info = ffprobe_info(video_path)
+    return info
+
+
+def probe_video(video_path: str, use_ffprobe: bool = True) -> VideoInfo | None:
+    """
+    Get the duration and video stream info of a file, memoized by (path, mtime, size).
+
+    Args:
+        video_path: Path to the video file
+        use_ffprobe: Fall back to ffprobe when the MP4 headers can't be used
+
+    Returns:
+        VideoInfo, or None if the file is missing or could not be probed
+    """
+    try:
+        stat = os.stat(video_path)
+    except OSError as e:
+        logger.debug("Cannot probe %s: %s", video_path, e)
+        return None
+    return _probe_file(os.path.abspath(video_path), stat.st_mtime_ns, stat.st_size, use_ffprobe)
@@ -0,0 +1,250 @@
+"""Static pre-flight validation of generated Manim code.
+
+Catches errors that would make a scene fail immediately (syntax errors, missing
+modules, names that do not exist in the `manim` namespace, forbidden `config`
+changes) without launching a Manim process. Problems are attributed to the scenes
+they affect, so only scenes that cannot possibly run are skipped.
+"""
+
+import ast
+import builtins
+import importlib
+import importlib.util
+import logging
+import sys
+from types import ModuleType
+
+from manim_generator.utils.parsing import extract_scene_class_names
+from manim_generator.utils.scene_analysis import bound_names, get_scene_dependencies
+
+logger = logging.getLogger(__name__)
+
+# `config` methods that change the Manim configuration in place
+CONFIG_MUTATORS = {"update", "digest_args", "digest_file", "digest_parser"}
+
+
+def _import_manim() -> ModuleType | None:
+    """Import manim if it is available in this interpreter."""
+    try:
+        return importlib.import_module("manim")
+    except Exception as e:
+        logger.debug("Skipping manim namespace checks, manim is not importable: %s", e)
+        return None
+
+
+def _public_names(module: ModuleType) -> set[str]:
+    """Names bound by `from module import *`."""
+    exported = getattr(module, "__all__", None)
+    if exported is not None:
+        return set(exported)
+    return {name for name in dir(module) if not name.startswith("_")}
+
+
+def _module_exists(name: str) -> bool:
+    top_level = name.split(".")[0]
+    if top_level in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(top_level) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def _all_bound_names(tree: ast.Module) -> set[str]:
+    """Every name bound anywhere in the module, regardless of scope."""
+    names: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and not isinstance(node.ctx, ast.Load):
+            names.add(node.id)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.add(node.name)
+        elif isinstance(node, ast.arg):
+            names.add(node.arg)
+        elif isinstance(node, ast.alias) and node.name != "*":
+            names.add((node.asname or node.name).split(".")[0])
+        elif isinstance(node, ast.ExceptHandler) and node.name:
+            names.add(node.name)
+        elif isinstance(node, (ast.Global, ast.Nonlocal)):
+            names.update(node.names)
+        elif isinstance(node, (ast.MatchAs, ast.MatchStar)) and node.name:
+            names.add(node.name)
+        elif isinstance(node, ast.MatchMapping) and node.rest:
+            names.add(node.rest)
+    return names
+
+
+def _config_root(node: ast.expr) -> bool:
+    """Whether an attribute/subscript chain starts at the bare name `config`."""
+    while isinstance(node, (ast.Attribute, ast.Subscript)):
+        node = node.value
+    return isinstance(node, ast.Name) and node.id == "config"
+
+
+def _check_imports(tree: ast.Module, manim: ModuleType | None) -> list[tuple[ast.AST, str]]:
+    issues: list[tuple[ast.AST, str]] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if manim is not None and not _module_exists(alias.name):
+                    issues.append(
+                        (node, f"ModuleNotFoundError: No module named '{alias.name.split('.')[0]}'")
+                    )
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                issues.append(
+                    (node, "ImportError: attempted relative import with no known parent package")
+                )
+                continue
+            module = node.module or ""
+            if manim is None:
+                continue
+            if not _module_exists(module):
+                issues.append(
+                    (node, f"ModuleNotFoundError: No module named '{module.split('.')[0]}'")
+                )
+            elif module == "manim":
+                for alias in node.names:
+                    if alias.name != "*" and not hasattr(manim, alias.name):
+                        issues.append(
+                            (
+                                node,
+                                f"ImportError: cannot import name '{alias.name}' from 'manim'",
+                            )
+                        )
+    return issues
+
+
+def _check_names(tree: ast.Module, manim: ModuleType | None) -> list[tuple[ast.AST, str]]:
+    """Report loaded names that are bound nowhere in the module or its star imports."""
+    known = _all_bound_names(tree) | set(dir(builtins)) | {"__file__"}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and any(a.name == "*" for a in node.names):
+            if node.module != "manim" or manim is None:
+                # names of other star imports are unknown, so nothing can be flagged
+                return []
+            known |= _public_names(manim)
+
+    issues: list[tuple[ast.AST, str]] = []
+    reported: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
+            if node.id not in known and node.id not in reported:
+                reported.add(node.id)
+                issues.append((node, f"NameError: name '{node.id}' is not defined"))
+    return issues
+
+
+def _check_config_changes(tree: ast.Module) -> list[tuple[ast.AST, str]]:
+    """Report changes to Manim's global `config`, which `init_prompt` forbids."""
+    module_bindings = {
+        name
+        for node in tree.body
+        if not isinstance(node, ast.ImportFrom)
+        for name in bound_names(node) or []
+    }
+    if "config" in module_bindings:
+        # the script defines its own `config`
+        return []
+
+    issues: list[tuple[ast.AST, str]] = []
+    for node in ast.walk(tree):
+        targets: list[ast.expr] = []
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                targets.extend(
+                    target.elts if isinstance(target, (ast.Tuple, ast.List)) else [target]
+                )
+        elif isinstance(node, (ast.AugAssign, ast.AnnAssign)):
+            targets.append(node.target)
+        elif (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr in CONFIG_MUTATORS
+            and _config_root(node.func.value)
+        ):
+            targets.append(node.func)
+
+        for target in targets:
+            if isinstance(target, (ast.Attribute, ast.Subscript)) and _config_root(target):
+                issues.append(
+                    (
+                        node,
+                        f"Forbidden configuration change: `{ast.unparse(target)}`. "
+                        "Manim's config must not be adjusted inside the code.",
+                    )
+                )
+    return issues
+
+
+def _statement_index(tree: ast.Module) -> dict[int, int]:
+    """Map every node id to the index of the top-level statement containing it."""
+    index: dict[int, int] = {}
+    for position, statement in enumerate(tree.body):
+        for node in ast.walk(statement):
+            index[id(node)] = position
+    return index
+
+
+def preflight_check(code: str) -> dict[str, list[str]]:
+    """
+    Statically validate Manim code and attribute every problem to the scenes it breaks.
+
+    Checks that the module compiles, that imported modules exist, that names imported
+    from or used via `from manim import *` exist in the installed `manim` namespace,
+    and that the code does not change Manim's `config`. Namespace and module checks
+    are skipped when manim cannot be imported in this interpreter.
+
+    Problems in a scene class affect that scene, problems in a helper affect every
+    scene depending on it, and module-level problems affect all scenes.
+
+    Args:
+        code: String containing the Manim Python code
+
+    Returns:
+        dict mapping names of scenes that cannot run to their error messages.
+        Empty when every scene passed (or the code cannot be parsed at all).
+    """
+    scene_names = extract_scene_class_names(code)
+    if isinstance(scene_names, Exception) or not scene_names:
+        return {}
+
+    tree = ast.parse(code)
+    try:
+        compile(code, "video.py", "exec")
+    except (SyntaxError, ValueError) as e:
+        line = f" (line {e.lineno})" if getattr(e, "lineno", None) else ""
+        message = f"{type(e).__name__}: {getattr(e, 'msg', e)}{line}"
+        return {scene: [message] for scene in scene_names}
+
+    manim = _import_manim()
+    issues = _check_imports(tree, manim) + _check_names(tree, manim) + _check_config_changes(tree)
+    if not issues:
+        return {}
+
+    dependencies = get_scene_dependencies(code)
+    if isinstance(dependencies, Exception):
+        return {}
+    statement_index = _statement_index(tree)
+
+    failures: dict[str, list[str]] = {}
+    for node, message in sorted(issues, key=lambda issue: getattr(issue[0], "lineno", 0)):
+        message = f"line {node.lineno}: {message}"
+        statement = tree.body[statement_index[id(node)]]
+        names = bound_names(statement)
+        if names is None:
+            affected = scene_names
+        else:
+            affected = [
+                scene
+                for scene in scene_names
+                if scene in names or dependencies.get(scene, set()) & set(names)
+            ]
+        for scene in affected:
+            failures.setdefault(scene, []).append(message)
+    return failures
+
+
+def format_preflight_error(messages: list[str]) -> str:
+    """Format pre-flight errors as the STDERR of a scene that was not rendered."""
+    details = "\n\t\t".join(messages)
+    return f"Pre-flight validation failed, scene was not rendered:\n\t\t{details}"
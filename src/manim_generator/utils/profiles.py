@@ -0,0 +1,92 @@
+"""Named render quality profiles for review and final renders.
+
+A profile starts from one of Manim's quality presets and may override its
+resolution and frame rate (`-r W,H --fps N`), which allows tiers below `-ql`.
+Manim names the output folder of a render after the resulting pixel height and
+frame rate (e.g. `videos/<script>/480p15/`), so output paths are derived from the
+profile as well.
+"""
+
+import os
+from dataclasses import dataclass
+
+# Manim quality flag -> (width, height, fps) of the preset
+QUALITY_PRESETS = {
+    "-ql": (854, 480, 15),
+    "-qm": (1280, 720, 30),
+    "-qh": (1920, 1080, 60),
+    "-qp": (2560, 1440, 60),
+    "-qk": (3840, 2160, 60),
+}
+
+
+@dataclass(frozen=True)
+class RenderProfile:
+    """
+    A render quality tier.
+
+    Attributes:
+        name: Profile name used on the CLI and in API requests.
+        quality_flag: Manim quality preset the profile starts from, e.g. "-ql".
+        width: Frame width in pixels.
+        height: Frame height in pixels.
+        fps: Frame rate.
+    """
+
+    name: str
+    quality_flag: str
+    width: int
+    height: int
+    fps: int
+
+    @property
+    def folder(self) -> str:
+        """Name of the quality folder Manim writes this profile's videos to."""
+        return f"{self.height}p{self.fps}"
+
+    def override_args(self) -> list[str]:
+        """Manim CLI arguments overriding the preset's resolution and frame rate, if needed."""
+        if QUALITY_PRESETS[self.quality_flag] == (self.width, self.height, self.fps):
+            return []
+        return ["-r", f"{self.width},{self.height}", "--fps", str(self.fps)]
+
+    def manim_args(self) -> list[str]:
+        """Manim CLI arguments rendering at this profile."""
+        return [self.quality_flag, *self.override_args()]
+
+    def videos_dir(self, media_dir: str, script_file: str) -> str:
+        """Directory Manim writes the script's scene videos to for this profile."""
+        script_basename = os.path.splitext(os.path.basename(script_file))[0]
+        return os.path.join(media_dir, "videos", script_basename, self.folder)
+
+
+RENDER_PROFILES = {
+    profile.name: profile
+    for profile in (
+        RenderProfile("draft", "-ql", 426, 240, 10),
+        RenderProfile("review", "-ql", 854, 480, 15),
+        RenderProfile("final", "-qh", 1920, 1080, 60),
+        RenderProfile("4k", "-qk", 3840, 2160, 60),
+    )
+}
+
+
+def get_render_profile(name: str) -> RenderProfile:
+    """
+    Look up a render profile by name.
+
+    Args:
+        name: One of the RENDER_PROFILES names
+
+    Returns:
+        RenderProfile: The profile
+
+    Raises:
+        ValueError: If no profile has this name
+    """
+    try:
+        return RENDER_PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown render profile {name!r} (choose from {', '.join(RENDER_PROFILES)})"
+        ) from None
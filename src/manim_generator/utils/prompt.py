@@ -1,5 +1,7 @@
 """Text utility functions for prompt formatting and message handling."""
 
+from manim_generator.utils.frames import EncodedFrame
+
 
 def format_prompt(prompt_name: str, replacements: dict) -> str:
     """
@@ -20,6 +22,28 @@ def format_prompt(prompt_name: str, replacements: dict) -> str:
     return prompt_template
 
 
+def cached_prefix_message(role: str, text: str) -> dict:
+    """
+    Build a message that ends the stable prefix of a conversation.
+
+    The text block carries a cache-control breakpoint, so Anthropic (and other
+    providers with explicit prompt caching) cache everything up to and including
+    it. LiteLLM drops the hint for providers that cache prefixes automatically,
+    like OpenAI, which only need the stable part to come first.
+
+    Args:
+        role: Message role, usually "system"
+        text: Message text that repeats unchanged across requests
+
+    Returns:
+        A LiteLLM message with a single cache-control-marked text block
+    """
+    return {
+        "role": role,
+        "content": [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}],
+    }
+
+
 def format_previous_reviews(previous_reviews: list[str]) -> str:
     """
     Format a list of review feedback strings into XML-style tagged format.
@@ -39,19 +63,25 @@ def format_previous_reviews(previous_reviews: list[str]) -> str:
     return "\n".join(xml_formatted)
 
 
-def convert_frames_to_message_format(frames: list[str]) -> list[dict]:
+def convert_frames_to_message_format(frames: list[EncodedFrame] | list[str]) -> list[dict]:
     """
-    Convert base64-encoded frame data URLs into LiteLLM vision message objects.
+    Convert encoded frames into LiteLLM vision message objects.
+
+    Data URLs are built here, only when frames are actually sent to a model.
 
     Args:
-        frames: A list of data URLs (e.g., "data:image/png;base64,...") extracted from
-            scene videos.
+        frames: Encoded frames extracted from scene videos, or ready-made PNG data URLs
+            (e.g., "data:image/png;base64,...").
 
     Returns:
         A list of dicts in the format expected by LiteLLM for vision inputs:
-        [{"type": "image_url", "image_url": {"url": <data_url>, "format": "image/png"}}, ...]
+        [{"type": "image_url", "image_url": {"url": <data_url>, "format": <mime_type>}}, ...]
     """
-    return [
-        {"type": "image_url", "image_url": {"url": frame, "format": "image/png"}}
-        for frame in frames
-    ]
+    messages = []
+    for frame in frames:
+        if isinstance(frame, EncodedFrame):
+            url, mime_type = frame.to_data_url(), frame.mime_type
+        else:
+            url, mime_type = frame, "image/png"
+        messages.append({"type": "image_url", "image_url": {"url": url, "format": mime_type}})
+    return messages
@@ -0,0 +1,265 @@
+"""Process-wide rate limiting and retry backoff for LLM requests.
+
+Every LLM request of the process, from any thread or event loop, goes through one
+`RateLimiter`. It keeps a request budget and a token budget per minute for each
+model/provider pair as token buckets. Prompt tokens are estimated up front and
+corrected with the reported usage once the response arrives.
+
+Transient failures (rate limits, 5xx responses, timeouts and connection errors)
+are retried with full-jitter exponential backoff, or after the provider's
+`Retry-After`. A rate limit also pauses every other request to the same
+model/provider until the backoff has passed, so concurrent jobs do not keep
+hitting a provider that already refused them.
+
+The time requests spent waiting, whether throttled by the budgets or backing off,
+is recorded per model/provider (see `RateLimiter.get_stats`). That shows how much
+quota concurrent jobs need.
+"""
+
+import email.utils
+import random
+import threading
+import time
+from dataclasses import dataclass
+
+import litellm
+
+# errors worth retrying: the same request may succeed a little later
+TRANSIENT_ERRORS = (
+    litellm.RateLimitError,
+    litellm.Timeout,
+    litellm.APIConnectionError,
+    litellm.InternalServerError,
+    litellm.ServiceUnavailableError,
+    litellm.BadGatewayError,
+)
+# rough prompt size of an image, corrected by the reported usage
+IMAGE_TOKENS = 765
+
+
+def is_transient(error: BaseException) -> bool:
+    """Whether a failed request may succeed when retried."""
+    if isinstance(error, TRANSIENT_ERRORS):
+        return True
+    status_code = getattr(error, "status_code", None)
+    return isinstance(status_code, int) and status_code >= 500
+
+
+def retry_after(error: BaseException) -> float | None:
+    """Seconds the provider asked to wait before retrying, from the Retry-After headers."""
+    headers = getattr(error, "litellm_response_headers", None)
+    if not headers:
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    value = headers.get("retry-after-ms")
+    if value is not None:
+        try:
+            return max(0.0, float(value) / 1000)
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def estimate_tokens(messages: list[dict]) -> int:
+    """Rough prompt token count of a conversation (about four characters per token)."""
+    characters = 0
+    images = 0
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, str):
+            characters += len(content)
+            continue
+        for part in content or []:
+            if part.get("type") == "image_url":
+                images += 1
+            else:
+                characters += len(part.get("text", ""))
+    return characters // 4 + images * IMAGE_TOKENS
+
+
+class TokenBucket:
+    """A budget per minute that refills continuously and can go into debt."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.tokens = per_minute
+        self.updated = time.monotonic()
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take `amount` from the budget; returns the seconds until it is covered."""
+        rate = self.capacity / 60
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+        self.tokens -= amount
+        return max(0.0, -self.tokens / rate)
+
+    def adjust(self, amount: float) -> None:
+        """Take more (or give back) budget once the real usage is known."""
+        self.tokens = min(self.capacity, self.tokens - amount)
+
+
+@dataclass
+class LimitStats:
+    """
+    Waiting done by the requests to one model/provider.
+
+    Attributes:
+        requests: Requests started, including retries.
+        retries: Requests retried after a transient failure.
+        throttled_seconds: Time spent waiting for the request and token budgets.
+        backoff_seconds: Time spent backing off after failures.
+    """
+
+    requests: int = 0
+    retries: int = 0
+    throttled_seconds: float = 0.0
+    backoff_seconds: float = 0.0
+
+
+class RateLimiter:
+    """Request and token budgets per model/provider, shared by all requests of the process."""
+
+    def __init__(
+        self,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+    ):
+        """
+        Args:
+            requests_per_minute: Request budget of each model/provider (None for no limit)
+            tokens_per_minute: Token budget of each model/provider (None for no limit)
+            base_delay: Backoff before the first retry, doubled with every further retry
+            max_delay: Longest backoff between retries
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._lock = threading.Lock()
+        self._request_buckets: dict[str, TokenBucket] = {}
+        self._token_buckets: dict[str, TokenBucket] = {}
+        self._paused_until: dict[str, float] = {}
+        self._stats: dict[str, LimitStats] = {}
+
+    def configure(self, requests_per_minute: float | None, tokens_per_minute: float | None) -> None:
+        """Change the budgets; budgets already in use start over."""
+        with self._lock:
+            self.requests_per_minute = requests_per_minute
+            self.tokens_per_minute = tokens_per_minute
+            self._request_buckets.clear()
+            self._token_buckets.clear()
+
+    def acquire(self, key: str, tokens: int) -> float:
+        """
+        Reserve budget for one request.
+
+        Args:
+            key: Model/provider the request goes to (see `limit_key`)
+            tokens: Estimated tokens of the request
+
+        Returns:
+            float: Seconds the caller has to wait before sending the request
+        """
+        now = time.monotonic()
+        with self._lock:
+            stats = self._stats.setdefault(key, LimitStats())
+            stats.requests += 1
+            delay = 0.0
+            paused_until = self._paused_until.get(key, 0.0)
+            if paused_until > now:
+                # spread the requests that were waiting for the pause to end
+                delay = paused_until - now + random.uniform(0, self.base_delay)
+            if self.requests_per_minute:
+                bucket = self._request_buckets.setdefault(
+                    key, TokenBucket(self.requests_per_minute)
+                )
+                delay = max(delay, bucket.reserve(1, now))
+            if self.tokens_per_minute:
+                bucket = self._token_buckets.setdefault(key, TokenBucket(self.tokens_per_minute))
+                delay = max(delay, bucket.reserve(tokens, now))
+            stats.throttled_seconds += delay
+        return delay
+
+    def record_usage(self, key: str, estimated_tokens: int, used_tokens: int) -> None:
+        """Correct the token budget with the tokens a request really used."""
+        with self._lock:
+            bucket = self._token_buckets.get(key)
+            if bucket is not None and used_tokens:
+                bucket.adjust(used_tokens - estimated_tokens)
+
+    def backoff(self, key: str, attempt: int, error: BaseException) -> float:
+        """
+        Seconds to wait before retrying a request that failed transiently.
+
+        Uses the provider's Retry-After if given, and otherwise full-jitter
+        exponential backoff. After a rate limit, other requests to the same
+        model/provider wait as well.
+
+        Args:
+            key: Model/provider the request went to
+            attempt: Number of the retry about to happen, from 1
+            error: The transient error
+
+        Returns:
+            float: Seconds to wait
+        """
+        delay = retry_after(error)
+        if delay is None:
+            delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+        with self._lock:
+            stats = self._stats.setdefault(key, LimitStats())
+            stats.retries += 1
+            stats.backoff_seconds += delay
+            if isinstance(error, litellm.RateLimitError):
+                paused_until = time.monotonic() + delay
+                self._paused_until[key] = max(self._paused_until.get(key, 0.0), paused_until)
+        return delay
+
+    def get_stats(self) -> dict:
+        """Return the waiting done per model/provider and in total."""
+        with self._lock:
+            per_key = {key: vars(stats).copy() for key, stats in self._stats.items()}
+        return {
+            "requests_per_minute": self.requests_per_minute,
+            "tokens_per_minute": self.tokens_per_minute,
+            "wait_seconds": sum(
+                stats["throttled_seconds"] + stats["backoff_seconds"] for stats in per_key.values()
+            ),
+            "limits": per_key,
+        }
+
+
+def limit_key(model: str, provider: str | None) -> str:
+    """Budget key of requests to a model through a provider."""
+    return f"{model}@{provider}" if provider else model
+
+
+_rate_limiter = RateLimiter()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the process-wide rate limiter."""
+    return _rate_limiter
+
+
+def configure_rate_limits(
+    requests_per_minute: float | None, tokens_per_minute: float | None
+) -> None:
+    """Set the request and token budgets per model/provider of the process-wide limiter."""
+    _rate_limiter.configure(requests_per_minute, tokens_per_minute)
@@ -0,0 +1,194 @@
+"""Persistent, content-addressed cache of rendered scenes.
+
+Entries are keyed by a scene's normalized fingerprint (see `scene_analysis`), the
+installed manim version and the render/frame settings. Each entry stores the
+rendered clip, the extracted frames and the render logs, so a hit skips the
+Manim subprocess entirely. The cache is bounded in size and evicts the least
+recently used entries first.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from importlib import metadata
+
+logger = logging.getLogger(__name__)
+
+META_FILE = "meta.json"
+CLIP_FILE = "scene.mp4"
+
+
+def _manim_version() -> str:
+    try:
+        return metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+@dataclass
+class CachedScene:
+    """
+    A cache hit for one scene.
+
+    Attributes:
+        clip_path: Path to the cached rendered clip, if one was stored.
+        frames: Extracted frames as (frame_name, PNG bytes) pairs in order.
+        stdout: Standard output captured when the scene was rendered.
+        stderr: Standard error captured when the scene was rendered.
+        elapsed: Render time of the original render in seconds.
+    """
+
+    clip_path: str | None
+    frames: list[tuple[str, bytes]]
+    stdout: str
+    stderr: str
+    elapsed: float
+
+
+class SceneRenderCache:
+    """Size-bounded LRU cache of rendered scenes on disk."""
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.manim_version = _manim_version()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def make_key(self, fingerprint: str, settings: dict) -> str:
+        """Combine a scene fingerprint with the manim version and render settings."""
+        payload = json.dumps(
+            {
+                "fingerprint": fingerprint,
+                "manim_version": self.manim_version,
+                "settings": settings,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _entry_dir(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def get(self, key: str) -> CachedScene | None:
+        """Return the cached scene for a key, or None on a miss."""
+        entry_dir = self._entry_dir(key)
+        meta_path = os.path.join(entry_dir, META_FILE)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            frames = []
+            for frame_name, frame_file in meta["frames"]:
+                with open(os.path.join(entry_dir, frame_file), "rb") as f:
+                    frames.append((frame_name, f.read()))
+        except (OSError, ValueError, KeyError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        # the metadata mtime doubles as the LRU timestamp
+        os.utime(meta_path)
+        clip_path = os.path.join(entry_dir, CLIP_FILE)
+        with self._lock:
+            self.hits += 1
+        return CachedScene(
+            clip_path=clip_path if os.path.exists(clip_path) else None,
+            frames=frames,
+            stdout=meta.get("stdout", ""),
+            stderr=meta.get("stderr", ""),
+            elapsed=meta.get("elapsed", 0.0),
+        )
+
+    def put(
+        self,
+        key: str,
+        clip_path: str | None,
+        frames: list[tuple[str, bytes]],
+        stdout: str,
+        stderr: str,
+        elapsed: float,
+    ) -> None:
+        """Store a successfully rendered scene. Writes are atomic per entry."""
+        entry_dir = self._entry_dir(key)
+        if os.path.exists(entry_dir):
+            return
+
+        os.makedirs(os.path.dirname(entry_dir), exist_ok=True)
+        staging_dir = tempfile.mkdtemp(prefix=".staging_", dir=self.cache_dir)
+        try:
+            if clip_path and os.path.exists(clip_path):
+                shutil.copy2(clip_path, os.path.join(staging_dir, CLIP_FILE))
+            frame_entries = []
+            for idx, (frame_name, data) in enumerate(frames, start=1):
+                frame_file = f"frame_{idx:02d}.png"
+                with open(os.path.join(staging_dir, frame_file), "wb") as f:
+                    f.write(data)
+                frame_entries.append([frame_name, frame_file])
+            with open(os.path.join(staging_dir, META_FILE), "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "frames": frame_entries,
+                        "stdout": stdout,
+                        "stderr": stderr,
+                        "elapsed": elapsed,
+                        "created": time.time(),
+                    },
+                    f,
+                )
+            os.rename(staging_dir, entry_dir)
+        except OSError as e:
+            # another process may have stored the same entry concurrently
+            logger.debug("Could not store render cache entry %s: %s", key, e)
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            return
+
+        with self._lock:
+            self.stores += 1
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the cache fits its size budget."""
+        entries = []
+        total = 0
+        for prefix in os.scandir(self.cache_dir):
+            if not prefix.is_dir() or prefix.name.startswith(".staging_"):
+                continue
+            for entry in os.scandir(prefix.path):
+                try:
+                    size = sum(f.stat().st_size for f in os.scandir(entry.path))
+                    last_used = os.stat(os.path.join(entry.path, META_FILE)).st_mtime
+                except OSError:
+                    continue
+                entries.append((last_used, size, entry.path))
+                total += size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+            with self._lock:
+                self.evictions += 1
+
+    def get_stats(self) -> dict:
+        """Return hit/miss statistics for the workflow summary."""
+        lookups = self.hits + self.misses
+        return {
+            "cache_dir": self.cache_dir,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,320 @@
+"""Long-lived Manim render workers.
+
+Each worker is a separate Python process that imports manim (and with it cairo,
+numpy and scipy) once at startup and then serves render jobs over a local pipe.
+Every job is rendered in a freshly forked child of the worker, so a crash, hang
+or leaked global state in one scene never affects the worker or later jobs, and
+a job exceeding its timeout is killed exactly like a `manim` subprocess would be.
+"""
+
+import atexit
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection
+
+from manim_generator.utils import asset_cache
+from manim_generator.utils.asset_cache import AssetCacheRun
+from manim_generator.utils.rendering import SceneRenderResult
+from manim_generator.utils.sandbox import ResourceLimits, usage_from_rusage
+
+logger = logging.getLogger(__name__)
+
+# extra seconds the pool waits on a worker beyond the job timeout before
+# declaring the worker itself unresponsive and replacing it
+WORKER_GRACE_SECONDS = 30
+
+
+@dataclass
+class RenderJob:
+    """
+    A single render request handled by a warm worker.
+
+    Attributes:
+        script_file: Path to the Manim script.
+        scene: Scene class to render, or None to render every scene (`--write_all`).
+        quality: Manim quality flag, e.g. "-ql" or "-qh".
+        media_dir: Media directory passed to `--media_dir`.
+        timeout: Max seconds for the render (None disables the timeout).
+        extra_args: Additional Manim CLI arguments.
+        limits: Resource limits applied to the forked render child (None for none).
+        asset_cache: Shared Tex/Text SVG cache installed in the render child (None for none).
+    """
+
+    script_file: str
+    scene: str | None
+    quality: str
+    media_dir: str
+    timeout: int | float | None = None
+    extra_args: list[str] = field(default_factory=list)
+    limits: ResourceLimits | None = None
+    asset_cache: AssetCacheRun | None = None
+
+    def to_cli_args(self) -> list[str]:
+        """Build the Manim CLI arguments equivalent to this job."""
+        args = [self.quality, "--media_dir", self.media_dir, *self.extra_args, self.script_file]
+        if self.scene is None:
+            args.append("--write_all")
+        else:
+            args.append(self.scene)
+        return args
+
+
+def is_supported() -> bool:
+    """Warm workers rely on fork() to isolate jobs, which is POSIX-only."""
+    return hasattr(os, "fork")
+
+
+def _invoke_manim_cli(args: list[str]) -> int:
+    """Run the Manim CLI in the current process and return its exit code."""
+    from manim.__main__ import main as manim_main
+
+    try:
+        manim_main.main(args=args, prog_name="manim", standalone_mode=True)
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        return e.code if isinstance(e.code, int) else 1
+    except Exception:
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+def _run_job_in_child(job: RenderJob) -> tuple[str, str, int, bool, float, dict]:
+    """
+    Fork a child that renders the job with stdout/stderr captured to temp files.
+
+    The child applies the job's resource limits before rendering; its resource usage
+    is collected with wait4() and returned alongside the logs.
+    """
+    with (
+        tempfile.TemporaryFile(mode="w+b") as out_file,
+        tempfile.TemporaryFile(mode="w+b") as err_file,
+    ):
+        start = time.perf_counter()
+        pid = os.fork()
+        if pid == 0:  # child
+            code = 1
+            try:
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                os.dup2(out_file.fileno(), 1)
+                os.dup2(err_file.fileno(), 2)
+                if job.limits is not None:
+                    job.limits.apply()
+                # rebind the Python streams too, in case they were replaced in the parent
+                sys.stdout = open(1, "w", encoding="utf-8", errors="replace", closefd=False)
+                sys.stderr = open(2, "w", encoding="utf-8", errors="replace", closefd=False)
+                if job.asset_cache is not None:
+                    asset_cache.install(job.asset_cache.cache_dir, job.asset_cache.stats_dir)
+                code = _invoke_manim_cli(job.to_cli_args())
+                asset_cache.write_stats()
+            except BaseException:
+                traceback.print_exc()
+            finally:
+                try:
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+                finally:
+                    os._exit(code)
+
+        timed_out = False
+        deadline = None if job.timeout is None else start + job.timeout
+        while True:
+            waited_pid, status, rusage = os.wait4(pid, os.WNOHANG)
+            if waited_pid == pid:
+                break
+            if deadline is not None and time.perf_counter() > deadline:
+                timed_out = True
+                os.kill(pid, signal.SIGKILL)
+                _, status, rusage = os.wait4(pid, 0)
+                break
+            time.sleep(0.05)
+        elapsed = time.perf_counter() - start
+
+        returncode = os.waitstatus_to_exitcode(status)
+        out_file.seek(0)
+        err_file.seek(0)
+        stdout = out_file.read().decode("utf-8", errors="replace")
+        stderr = err_file.read().decode("utf-8", errors="replace")
+        return stdout, stderr, returncode, timed_out, elapsed, usage_from_rusage(rusage, elapsed)
+
+
+def _worker_main(conn: Connection) -> None:
+    """Worker process loop: pre-import manim, then serve jobs until told to stop."""
+    try:
+        import manim  # noqa: F401
+        from manim.__main__ import main  # noqa: F401
+    except Exception as e:
+        conn.send(("error", f"Failed to import manim: {e}"))
+        return
+    conn.send(("ready", None))
+
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            return
+        if job is None:
+            return
+        try:
+            conn.send(("result", _run_job_in_child(job)))
+        except Exception:
+            conn.send(("result", ("", traceback.format_exc(), 1, False, 0.0, None)))
+
+
+class _Worker:
+    """Handle to a single warm worker process."""
+
+    def __init__(self, context: multiprocessing.context.BaseContext):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.ready = False
+
+    def wait_ready(self, timeout: float) -> None:
+        """Block until the worker finished its imports."""
+        if self.ready:
+            return
+        if not self.conn.poll(timeout):
+            raise RuntimeError("Render worker did not start in time")
+        status, message = self.conn.recv()
+        if status != "ready":
+            raise RuntimeError(message)
+        self.ready = True
+
+    def stop(self) -> None:
+        """Ask the worker to exit, terminating it if it does not comply."""
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class RenderWorkerPool:
+    """A pool of warm Manim render workers that grows on demand."""
+
+    def __init__(self, size: int, startup_timeout: float = 120.0):
+        self.size = 0
+        self.startup_timeout = startup_timeout
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: queue.Queue[_Worker] = queue.Queue()
+        self._lock = threading.Lock()
+        self._workers: list[_Worker] = []
+        self._closed = False
+        self.grow(size)
+
+    def grow(self, size: int) -> None:
+        """Start more workers until the pool has at least `size` of them."""
+        with self._lock:
+            while self.size < max(1, size):
+                worker = _Worker(self._context)
+                self._workers.append(worker)
+                self._idle.put(worker)
+                self.size += 1
+
+    def render(self, job: RenderJob) -> SceneRenderResult:
+        """Render a job on the next idle worker, blocking until it finishes."""
+        if self._closed:
+            raise RuntimeError("Render worker pool is closed")
+
+        scene = job.scene or "<all>"
+        worker = self._idle.get()
+        try:
+            worker.wait_ready(self.startup_timeout)
+            worker.conn.send(job)
+            wait = None if job.timeout is None else job.timeout + WORKER_GRACE_SECONDS
+            if not worker.conn.poll(wait):
+                raise TimeoutError(f"Render worker unresponsive after {wait} seconds")
+            _, (stdout, stderr, returncode, timed_out, elapsed, usage) = worker.conn.recv()
+        except Exception as e:
+            logger.error("Render worker failed while rendering %s: %s", scene, e)
+            worker = self._replace(worker)
+            return SceneRenderResult(
+                scene=scene,
+                stdout="",
+                stderr=f"Render worker failed: {e}",
+                returncode=1,
+                timed_out=isinstance(e, TimeoutError),
+                elapsed=0.0,
+            )
+        finally:
+            self._idle.put(worker)
+
+        return SceneRenderResult(
+            scene=scene,
+            stdout=stdout,
+            stderr=stderr,
+            returncode=returncode,
+            timed_out=timed_out,
+            elapsed=elapsed,
+            usage=usage,
+        )
+
+    def _replace(self, worker: _Worker) -> _Worker:
+        """Kill a broken worker and start a fresh one in its place."""
+        with self._lock:
+            worker.process.kill()
+            worker.process.join()
+            worker.conn.close()
+            replacement = _Worker(self._context)
+            self._workers[self._workers.index(worker)] = replacement
+            return replacement
+
+    def close(self) -> None:
+        """Stop all workers."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            for worker in self._workers:
+                worker.stop()
+
+
+_shared_pool: RenderWorkerPool | None = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_render_worker_pool(size: int) -> RenderWorkerPool:
+    """
+    Return the process-wide warm worker pool, creating it on first use.
+
+    The CLI workflow and the API server share this pool so manim is imported
+    once per worker for the lifetime of the process rather than once per render.
+    A caller asking for more workers than are running grows the pool, so a small
+    first render does not cap the renders after it.
+    """
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = RenderWorkerPool(size)
+        else:
+            _shared_pool.grow(size)
+        return _shared_pool
+
+
+def shutdown_render_worker_pool() -> None:
+    """Stop the shared pool if it was started."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is not None:
+            _shared_pool.close()
+            _shared_pool = None
+
+
+atexit.register(shutdown_render_worker_pool)
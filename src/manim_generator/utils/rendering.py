@@ -5,21 +5,313 @@ representative frame from each rendered scene video for potential use with
 vision-capable review models.
 """
 
-import base64
+import glob
+import json
 import logging
 import os
 import re
+import signal
 import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 import cv2
 import numpy as np
 from rich.console import Console
 
+from manim_generator.utils.asset_cache import (
+    AssetCache,
+    AssetCacheRun,
+    describe_stats,
+    manim_command,
+)
 from manim_generator.utils.file import save_code_to_file
+from manim_generator.utils.frames import FRAME_FORMATS, EncodedFrame, encode_frame, reencode_image
+from manim_generator.utils.media_info import probe_video
 from manim_generator.utils.parsing import extract_scene_class_names
+from manim_generator.utils.preflight import format_preflight_error, preflight_check
+from manim_generator.utils.profiles import RENDER_PROFILES, RenderProfile, get_render_profile
+from manim_generator.utils.render_cache import CachedScene, SceneRenderCache
+from manim_generator.utils.review_clips import clip_set_key, store_clips
+from manim_generator.utils.sandbox import ResourceLimits, read_usage, sandbox_command
+from manim_generator.utils.scene_analysis import scene_fingerprints
+from manim_generator.utils.scene_driver import quality_args
+from manim_generator.utils.tex_precompile import precompile_scenes
+from manim_generator.utils.time_compression import compress_code
 
 logger = logging.getLogger(__name__)
 
+# extra seconds allowed for the batch driver to import manim and the script
+BATCH_STARTUP_GRACE_SECONDS = 60
+
+# samples further apart than this are reached by seeking instead of decoding forward;
+# matches the default keyframe interval of libx264, which Manim encodes with
+MAX_SEQUENTIAL_GAP = 250
+# frames are scored for highest_density on thumbnails of this width
+DENSITY_THUMBNAIL_WIDTH = 160
+# grayscale level above which a pixel counts as non-black
+DENSITY_BLACK_THRESHOLD = 30
+
+# sandboxed renders run in sessions of their own, outside the group of this process
+_sandboxed_renders: set[subprocess.Popen] = set()
+_sandboxed_renders_lock = threading.Lock()
+
+
+@dataclass
+class SceneRenderResult:
+    """
+    Outcome of rendering a single scene.
+
+    Attributes:
+        scene: Name of the rendered scene class.
+        stdout: Captured standard output of the render.
+        stderr: Captured standard error of the render.
+        returncode: Exit code of the render process.
+        timed_out: Whether the render was killed after exceeding the scene timeout.
+        elapsed: Wall time spent rendering the scene in seconds.
+        usage: Resource usage of the render (peak_rss_mb, user_cpu_seconds,
+            system_cpu_seconds, wall_seconds) when it was measured, else None.
+        animations: Number of animations the scene played, when the renderer reported it.
+    """
+
+    scene: str
+    stdout: str
+    stderr: str
+    returncode: int
+    timed_out: bool
+    elapsed: float
+    usage: dict | None = None
+    animations: int | None = None
+
+
+@dataclass
+class SceneOutcome:
+    """
+    Render result and extracted frames of a single scene from one execution.
+
+    Attributes:
+        result: The scene's render result (logs, exit status, timing).
+        frames: Extracted frames as (frame_name, PNG bytes) pairs in order.
+        clip_path: The scene's clip when it was kept for promotion (see `utils/review_clips.py`).
+    """
+
+    result: SceneRenderResult
+    frames: list[tuple[str, bytes]]
+    clip_path: str | None = None
+
+
+def _run_scene_command(
+    scene: str,
+    command: list[str],
+    scene_timeout: int | float | None,
+    resource_limits: ResourceLimits | None = None,
+) -> SceneRenderResult:
+    """
+    Run a single scene render command, killing it if it exceeds the timeout.
+
+    With resource_limits, the command runs under the sandbox wrapper (see
+    `utils/sandbox.py`) in its own process group, so a timeout kills the render
+    along with the wrapper, and the render's resource usage is recorded.
+    """
+    usage_file = None
+    if resource_limits is not None:
+        fd, usage_file = tempfile.mkstemp(prefix="manim_usage_", suffix=".json")
+        os.close(fd)
+        command = sandbox_command(command, resource_limits, usage_file)
+
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        command,
+        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=os.environ.copy(),
+        start_new_session=usage_file is not None,
+    )
+    if usage_file is not None:
+        with _sandboxed_renders_lock:
+            _sandboxed_renders.add(process)
+    timed_out = False
+    try:
+        stdout, stderr = process.communicate(timeout=scene_timeout)
+    except subprocess.TimeoutExpired:
+        timed_out = True
+        if usage_file is not None:
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+        stdout, stderr = process.communicate()
+    finally:
+        if usage_file is not None:
+            with _sandboxed_renders_lock:
+                _sandboxed_renders.discard(process)
+    return SceneRenderResult(
+        scene=scene,
+        stdout=stdout,
+        stderr=stderr,
+        returncode=process.returncode,
+        timed_out=timed_out,
+        elapsed=time.perf_counter() - start,
+        usage=read_usage(usage_file) if usage_file is not None else None,
+    )
+
+
+def kill_sandboxed_renders() -> None:
+    """
+    Kill the sandboxed scene renders this process is running.
+
+    They run in sessions of their own, so killing this process's group misses
+    them; a process that is stopped from outside calls this first.
+    """
+    with _sandboxed_renders_lock:
+        processes = list(_sandboxed_renders)
+    for process in processes:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except OSError:
+            pass
+
+
+def _get_scene_renderer(
+    render_backend: str,
+    workers: int,
+    filename: str,
+    output_media_dir: str,
+    commands: dict[str, list[str]],
+    scene_timeout: int | float | None,
+    extra_args: list[str],
+    resource_limits: ResourceLimits | None = None,
+    profile: RenderProfile = RENDER_PROFILES["review"],
+    asset_cache: AssetCacheRun | None = None,
+) -> Callable[[str], SceneRenderResult]:
+    """Return a callable rendering one scene with the selected backend."""
+    if render_backend == "warm":
+        from manim_generator.utils import render_worker
+
+        if render_worker.is_supported():
+            pool = render_worker.get_render_worker_pool(workers)
+            return lambda scene: pool.render(
+                render_worker.RenderJob(
+                    script_file=filename,
+                    scene=scene,
+                    quality=profile.quality_flag,
+                    media_dir=output_media_dir,
+                    timeout=scene_timeout,
+                    extra_args=[*profile.override_args(), *extra_args],
+                    limits=resource_limits,
+                    asset_cache=asset_cache,
+                )
+            )
+        logger.warning("Warm render workers are not supported here; using subprocesses")
+
+    return lambda scene: _run_scene_command(
+        scene, commands[scene], scene_timeout, resource_limits=resource_limits
+    )
+
+
+def _render_batch(
+    filename: str,
+    scene_names: list[str],
+    output_media_dir: str,
+    commands: dict[str, list[str]],
+    scene_timeout: int | float | None,
+    workers: int,
+    extra_args: list[str],
+    resource_limits: ResourceLimits | None = None,
+    profile: RenderProfile = RENDER_PROFILES["review"],
+    asset_cache: AssetCacheRun | None = None,
+) -> list[SceneRenderResult]:
+    """
+    Render all scenes in a single driver process, importing manim and the script once.
+
+    Results are attributed per scene from the driver's JSON lines output. If the
+    driver dies part-way (segfault, hard hang), the scene it was rendering is
+    reported as failed and the scenes it never reached are rendered individually.
+    Resource limits apply to the driver as a whole, with the CPU budget scaled by
+    the number of scenes it renders.
+    """
+    results_path = os.path.join(output_media_dir, "batch_results.jsonl")
+    if os.path.exists(results_path):
+        os.remove(results_path)
+
+    command = [
+        sys.executable,
+        "-m",
+        "manim_generator.utils.scene_driver",
+        filename,
+        *scene_names,
+        *quality_args(profile.quality_flag),
+        *profile.override_args(),
+        "--media_dir",
+        output_media_dir,
+        "--results",
+        results_path,
+        *extra_args,
+    ]
+    if asset_cache is not None:
+        command += asset_cache.driver_args()
+    overall_timeout = None
+    if scene_timeout:
+        command += ["--timeout", str(scene_timeout)]
+        overall_timeout = scene_timeout * len(scene_names) + BATCH_STARTUP_GRACE_SECONDS
+    driver_limits = resource_limits.scaled_cpu(len(scene_names)) if resource_limits else None
+    driver = _run_scene_command("<batch>", command, overall_timeout, resource_limits=driver_limits)
+
+    results: dict[str, SceneRenderResult] = {}
+    if os.path.exists(results_path):
+        with open(results_path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    result = SceneRenderResult(**json.loads(line))
+                    results[result.scene] = result
+        os.remove(results_path)
+
+    missing = [scene for scene in scene_names if scene not in results]
+    if missing:
+        crashed = missing[0]
+        results[crashed] = SceneRenderResult(
+            scene=crashed,
+            stdout=driver.stdout,
+            stderr=f"{driver.stderr}\nBatch render process exited while rendering {crashed}",
+            returncode=driver.returncode or 1,
+            timed_out=driver.timed_out,
+            elapsed=driver.elapsed,
+            usage=driver.usage,
+        )
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for result in executor.map(
+                lambda scene: _run_scene_command(
+                    scene, commands[scene], scene_timeout, resource_limits=resource_limits
+                ),
+                missing[1:],
+            ):
+                results[result.scene] = result
+
+    return [results[scene] for scene in scene_names]
+
+
+def _format_scene_log(result: SceneRenderResult, scene_timeout: int | float | None) -> str:
+    """Format the per-scene log block consumed by the review prompts."""
+    scene = result.scene
+    log_entry = (
+        f"<{scene}>\n"
+        f"\t<STDOUT>\n"
+        f"\t\t{result.stdout}\n"
+        f"\t</STDOUT>\n"
+        f"\t<STDERR>\n"
+        f"\t\t{result.stderr}\n"
+        f"\t</STDERR>\n"
+        f"</{scene}>\n\n"
+    )
+    if result.timed_out:
+        log_entry += f"<!> Scene {scene} timed out after {scene_timeout} seconds\n\n"
+    return log_entry
+
 
 def run_manim_multiscene(
     code: str,
@@ -31,12 +323,31 @@ def run_manim_multiscene(
     frame_count: int = 3,
     headless: bool = False,
     scene_timeout: int | float | None = None,
-) -> tuple[bool, list[str], str, list[str]]:
+    render_workers: int | None = None,
+    render_backend: str = "subprocess",
+    render_cache: SceneRenderCache | None = None,
+    reuse: dict[str, SceneOutcome] | None = None,
+    outcomes: dict[str, SceneOutcome] | None = None,
+    preflight: bool = True,
+    execution_mode: str = "full",
+    frame_format: str = "png",
+    frame_quality: int = 85,
+    frame_max_dimension: int | None = None,
+    resource_limits: ResourceLimits | None = None,
+    render_profile: str = "review",
+    time_scale: float = 1.0,
+    keep_clips: bool = False,
+    asset_cache: AssetCache | None = None,
+    tex_precompile: bool = True,
+) -> tuple[bool, list[EncodedFrame], str, list[str]]:
     """
     Saves the code to a file, extracts scene names, and runs each scene individually.
+    Scenes are rendered concurrently by a bounded pool of worker threads, each driving
+    its own Manim subprocess; logs and results are still reported in scene order.
     After rendering, extracts representative frames from each scene's video using
-    the specified extraction mode and encodes them as Base64 data URLs for use
-    with vision-capable models.
+    the specified extraction mode and encodes each of them once. The encoded bytes
+    are written to the step artifacts as-is; data URLs for vision-capable models
+    are only built when a review sends them (see `EncodedFrame.to_data_url`).
 
     Args:
         code: String containing the Manim Python code to execute
@@ -47,15 +358,48 @@ def run_manim_multiscene(
         frame_extraction_mode: "highest_density" for single best frame, "fixed_count" for multiple frames
         frame_count: Number of frames to extract in fixed_count mode
         scene_timeout: Max seconds to allow a single scene render (None disables timeout)
+        render_workers: Max scenes rendered concurrently (None uses the CPU count)
+        render_backend: "subprocess" to spawn a `manim` process per scene, "warm" to
+            reuse pre-imported render workers (see `utils/render_worker.py`), or "batch"
+            to render all scenes in one process (see `utils/scene_driver.py`)
+        render_cache: Optional persistent scene cache; unchanged scenes are served from it
+        reuse: Outcomes of scenes known to be unchanged since a previous execution; these
+            scenes are not rendered and their logs and frames are carried forward
+        outcomes: Optional dict filled with the outcome of every scene of this execution
+        preflight: Statically validate the code first (see `utils/preflight.py`); scenes
+            that cannot run are reported with a synthetic log instead of being rendered
+        execution_mode: "full" renders each scene to video and extracts frames from it;
+            "validate" runs each scene's construct() with animations skipped (`manim -s`)
+            and returns the scene's last frame as a still instead of encoding a video
+        frame_format: Image format of the extracted frames: "png", "jpeg" or "webp"
+        frame_quality: Encoding quality (1-100) for jpeg and webp frames
+        frame_max_dimension: Downscale frames so their longest side is at most this many
+            pixels (None keeps the rendered size)
+        resource_limits: Run every render under these limits (see `utils/sandbox.py`)
+            and record each scene's resource usage in its `SceneRenderResult`
+        render_profile: Render quality profile of the review renders: "draft" (240p10),
+            "review" (480p15), "final" (1080p60) or "4k" (see `utils/profiles.py`)
+        time_scale: Factor applied to every run_time and wait duration of full renders,
+            e.g. 0.25 for renders four times shorter (see `utils/time_compression.py`)
+        keep_clips: Keep the scene clips of a fully successful, uncompressed full
+            execution, keyed by code and profile, for promotion to the final video
+            instead of deleting them (see `utils/review_clips.py`)
+        asset_cache: Shared Tex/Text SVG cache used by every render of this execution
+            (see `utils/asset_cache.py`)
+        tex_precompile: Compile the literal Tex strings of the scenes to render into the
+            asset cache in parallel before rendering (see `utils/tex_precompile.py`)
 
     Returns a tuple containing:
       - a boolean success flag (True only if all scenes rendered successfully and files were found),
-      - a list of Base64 encoded image strings as data URLs,
+      - a list of encoded frames (`EncodedFrame`),
       - a combined log string,
       - a list of successfully rendered scene names.
     """
-    # save code to temp file
-    filename = save_code_to_file(code, filename=f"{output_media_dir}/video.py")
+    # save code to temp file; validate runs skip animations, so only full runs are compressed
+    time_scale = time_scale if execution_mode == "full" else 1.0
+    filename = save_code_to_file(
+        compress_code(code, time_scale), filename=f"{output_media_dir}/video.py"
+    )
 
     # extract scene names
     scene_names = extract_scene_class_names(code)
@@ -67,71 +411,160 @@ def run_manim_multiscene(
             console.print(f"[red]Code parsing error: {str(scene_names)}[/red]")
         return False, [], error_msg, []
 
-    combined_logs = ""
-    rendering_success = True
-    successful_scenes = []
+    profile = get_render_profile(render_profile)
 
-    # Run each scene
-    for scene in scene_names:
-        command = [
-            "manim",
-            "-ql",  # low quality for speed; produces 480p15 folder
+    # -s skips animations and only writes the last frame as a PNG
+    extra_args = ["-s"] if execution_mode == "validate" else []
+    asset_run = asset_cache.start_run() if asset_cache is not None else None
+    commands = {
+        scene: [
+            *manim_command(asset_run),
+            *profile.manim_args(),
+            *extra_args,
             "--media_dir",
             output_media_dir,
             filename,
             scene,
         ]
+        for scene in scene_names
+    }
+
+    # scenes failing static validation are reported without launching Manim
+    invalid = preflight_check(code) if preflight else {}
+    if invalid and not headless:
+        console.print(
+            f"[red]Pre-flight validation failed for {len(invalid)} scene(s): {', '.join(invalid)}[/red]"
+        )
 
-        def _run_scene() -> tuple[str, str, int, bool]:
-            process = subprocess.Popen(
-                command,
-                text=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                env=os.environ.copy(),
+    reused = {
+        scene: outcome
+        for scene, outcome in (reuse or {}).items()
+        if scene in scene_names and scene not in invalid
+    }
+
+    # scenes found in the render cache skip the Manim subprocess entirely
+    cache_keys: dict[str, str] = {}
+    cached: dict[str, CachedScene] = {}
+    if render_cache is not None:
+        fingerprints = scene_fingerprints(code)
+        settings = {
+            "quality": " ".join(profile.manim_args()),
+            "frame_extraction_mode": frame_extraction_mode,
+            "frame_count": frame_count,
+            "execution_mode": execution_mode,
+            "frame_format": frame_format,
+            "frame_quality": frame_quality,
+            "frame_max_dimension": frame_max_dimension,
+        }
+        if time_scale != 1:
+            settings["time_scale"] = time_scale
+        for scene in scene_names:
+            if scene in reused or scene in invalid:
+                continue
+            cache_keys[scene] = render_cache.make_key(fingerprints[scene], settings)
+            hit = render_cache.get(cache_keys[scene])
+            if hit is not None:
+                cached[scene] = hit
+    to_render = [
+        scene
+        for scene in scene_names
+        if scene not in cached and scene not in reused and scene not in invalid
+    ]
+
+    workers = max(1, min(render_workers or os.cpu_count() or 1, len(to_render) or 1))
+
+    def _render_all() -> list[SceneRenderResult]:
+        if not to_render:
+            return []
+        if render_backend == "batch":
+            return _render_batch(
+                filename,
+                to_render,
+                output_media_dir,
+                commands,
+                scene_timeout,
+                workers,
+                extra_args,
+                resource_limits,
+                profile,
+                asset_run,
             )
-            timed_out = False
-            try:
-                stdout, stderr = process.communicate(timeout=scene_timeout)
-            except subprocess.TimeoutExpired:
-                timed_out = True
-                process.kill()
-                stdout, stderr = process.communicate()
-            return stdout, stderr, process.returncode, timed_out
+        render_scene = _get_scene_renderer(
+            render_backend,
+            workers,
+            filename,
+            output_media_dir,
+            commands,
+            scene_timeout,
+            extra_args,
+            resource_limits,
+            profile,
+            asset_run,
+        )
+        # executor.map keeps results in scene order regardless of completion order
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(render_scene, to_render))
 
+    if asset_run is not None and tex_precompile and to_render:
         if headless:
-            stdout, stderr, returncode, timed_out = _run_scene()
+            precompile_scenes(code, to_render, asset_cache, asset_run, workers, output_media_dir)
         else:
-            with console.status(f"[bold blue]Rendering scene {scene}..."):
-                stdout, stderr, returncode, timed_out = _run_scene()
-
-        log_entry = (
-            f"<{scene}>\n"
-            f"\t<STDOUT>\n"
-            f"\t\t{stdout}\n"
-            f"\t</STDOUT>\n"
-            f"\t<STDERR>\n"
-            f"\t\t{stderr}\n"
-            f"\t</STDERR>\n"
-            f"</{scene}>\n\n"
-        )
+            with console.status("[bold blue]Pre-compiling Tex strings..."):
+                report = precompile_scenes(
+                    code, to_render, asset_cache, asset_run, workers, output_media_dir
+                )
+            if report is not None:
+                console.print(f"[blue]{report.describe()}")
+
+    if headless:
+        rendered = {result.scene: result for result in _render_all()}
+    else:
+        skipped = len(cached) + len(reused)
+        cached_note = f" ({skipped} unchanged)" if skipped else ""
+        action = "Validating" if execution_mode == "validate" else "Rendering"
+        with console.status(
+            f"[bold blue]{action} {len(to_render)} scene(s) with {workers} worker(s){cached_note}..."
+        ):
+            rendered = {result.scene: result for result in _render_all()}
+
+    if asset_run is not None:
+        asset_stats = asset_cache.finish_run(asset_run)
+        if any(asset_stats.values()):
+            logger.info(describe_stats(asset_stats))
+            if not headless:
+                console.print(f"[blue]{describe_stats(asset_stats)}")
 
-        if timed_out:
-            log_entry += f"<!> Scene {scene} timed out after {scene_timeout} seconds\n\n"
+    combined_logs = ""
+    rendering_success = True
+    successful_scenes = []
 
-        combined_logs += log_entry
+    results: dict[str, SceneRenderResult] = {}
+    for scene in scene_names:
+        if scene in invalid:
+            result = SceneRenderResult(
+                scene, "", format_preflight_error(invalid[scene]), 1, False, 0.0
+            )
+        elif scene in reused:
+            result = reused[scene].result
+        elif scene in cached:
+            hit = cached[scene]
+            result = SceneRenderResult(scene, hit.stdout, hit.stderr, 0, False, hit.elapsed)
+        else:
+            result = rendered[scene]
+        results[scene] = result
+        combined_logs += _format_scene_log(result, scene_timeout)
 
-        if timed_out:
+        if result.timed_out:
             rendering_success = False
             if not headless:
                 console.print(
                     f"[red]Rendering scene {scene} timed out after {scene_timeout} seconds[/red]"
                 )
-        elif returncode != 0:
+        elif result.returncode != 0:
             rendering_success = False
-            if not headless:
+            if not headless and scene not in invalid:
                 console.print(
-                    f"[red]Rendering scene {scene} failed with exit code {returncode}[/red]"
+                    f"[red]Rendering scene {scene} failed with exit code {result.returncode}[/red]"
                 )
         else:
             successful_scenes.append(scene)
@@ -139,99 +572,204 @@ def run_manim_multiscene(
     # Determine videos directory for the rendered files
     # According to Manim docs, structure: <media_dir>/videos/<script_basename>/<quality_folder>/<Scene>.mp4
     script_basename = os.path.splitext(os.path.basename(filename))[0]
-    quality_folder = "480p15"  # matches -ql argument
-
-    video_base_path = os.path.join(output_media_dir, "videos", script_basename, quality_folder)
-
-    # List of tuples: (scene_name, data_url)
-    frames: list[tuple[str, str]] = []
-
-    if os.path.exists(video_base_path):
-        # Only extract frames from scenes that rendered successfully
-        for scene in successful_scenes:
-            scene_video_path = os.path.join(video_base_path, f"{scene}.mp4")
-            if os.path.exists(scene_video_path):
-                try:
-                    extracted_frames = extract_frames_from_video(
-                        scene_video_path, frame_extraction_mode, frame_count
-                    )
-                    if extracted_frames:
-                        # encode all frames to base64
-                        for idx, frame in enumerate(extracted_frames):
-                            success, buffer = cv2.imencode(".png", frame)
-                            if success:
-                                image_base64 = base64.b64encode(buffer.tobytes()).decode("utf-8")
-                                data_url = f"data:image/png;base64,{image_base64}"
-                                frame_name = (
-                                    f"{scene}_{idx + 1}" if len(extracted_frames) > 1 else scene
-                                )
-                                frames.append((frame_name, data_url))
-                            else:
-                                if not headless:
-                                    console.print(
-                                        f"[yellow]Failed to encode frame {idx + 1} for {scene_video_path}[/yellow]"
-                                    )
-                    else:
-                        if not headless:
-                            console.print(
-                                f"[yellow]No suitable frames extracted from {scene_video_path}[/yellow]"
-                            )
-                except Exception as e:
-                    if not headless:
-                        console.print(
-                            f"[red]Error extracting frame from {scene_video_path}: {e}[/red]"
-                        )
-            else:
-                if not headless:
-                    console.print(
-                        f"[red]Video file not found for scene {scene} at {scene_video_path}[/red]"
-                    )
-
-        # save artifacts (e.g extracted frames) using scene names
-        if step_name and artifact_manager and frames:
-            step_frames_dir = artifact_manager.get_step_frames_path(step_name)
-            os.makedirs(step_frames_dir, exist_ok=True)
-
-            for idx, (scene_name, data_url) in enumerate(frames, start=1):
-                base64_data = data_url.split(",")[1]
-                image_data = base64.b64decode(base64_data)
-                safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", scene_name)
-                frame_filename = f"{idx:02d}_{safe_name}.png"
-                frame_path = os.path.join(step_frames_dir, frame_filename)
-
-                with open(frame_path, "wb") as f:
-                    f.write(image_data)
-
-        # Clean up video files after extracting frames to prevent old videos
-        # from previous iterations affecting scene counting
-        # Only clean up videos from successful scenes (failed scenes won't have videos)
-        if headless:
-            for scene in successful_scenes:
-                scene_video_path = os.path.join(video_base_path, f"{scene}.mp4")
-                if os.path.exists(scene_video_path):
-                    try:
-                        os.remove(scene_video_path)
-                    except Exception as e:
-                        if not headless:
-                            console.print(
-                                f"[yellow]Warning: Could not delete {scene_video_path}: {e}[/yellow]"
-                            )
+    video_base_path = profile.videos_dir(output_media_dir, filename)
+    # `manim -s` writes stills to <media_dir>/images/<script_basename>/
+    image_base_path = os.path.join(output_media_dir, "images", script_basename)
+
+    # List of tuples: (frame_name, png_bytes)
+    frames: list[tuple[str, bytes]] = []
+    scene_frames_by_name: dict[str, list[tuple[str, bytes]]] = {}
+    rendered_files: list[str] = []
+    fresh_videos: dict[str, str] = {}
+
+    # Only extract frames from scenes that rendered successfully
+    for scene in successful_scenes:
+        if scene in reused:
+            scene_frames_by_name[scene] = reused[scene].frames
+            frames.extend(reused[scene].frames)
+            continue
+        if scene in cached:
+            scene_frames_by_name[scene] = cached[scene].frames
+            frames.extend(cached[scene].frames)
+            continue
+
+        if execution_mode == "validate":
+            media_path = _find_last_frame(image_base_path, scene)
+            missing_message = f"Last frame not found for scene {scene} in {image_base_path}"
+        else:
+            media_path = os.path.join(video_base_path, f"{scene}.mp4")
+            if not os.path.exists(media_path):
+                media_path = None
+            missing_message = f"Video file not found for scene {scene} in {video_base_path}"
+        if media_path is None:
+            if not headless:
+                console.print(f"[red]{missing_message}[/red]")
+            continue
+
+        rendered_files.append(media_path)
+        if execution_mode == "validate":
+            with open(media_path, "rb") as f:
+                still = reencode_image(f.read(), frame_format, frame_quality, frame_max_dimension)
+            scene_frames = [(scene, still)] if still is not None else []
         else:
-            with console.status("[bold blue]Cleaning up video files..."):
-                for scene in successful_scenes:
-                    scene_video_path = os.path.join(video_base_path, f"{scene}.mp4")
-                    if os.path.exists(scene_video_path):
-                        try:
-                            os.remove(scene_video_path)
-                        except Exception as e:
-                            console.print(
-                                f"[yellow]Warning: Could not delete {scene_video_path}: {e}[/yellow]"
-                            )
+            fresh_videos[scene] = media_path
+            scene_frames = _extract_scene_frames(
+                scene,
+                media_path,
+                frame_extraction_mode,
+                frame_count,
+                console,
+                headless,
+                frame_format,
+                frame_quality,
+                frame_max_dimension,
+            )
+        scene_frames_by_name[scene] = scene_frames
+        frames.extend(scene_frames)
+
+        if render_cache is not None:
+            result = rendered[scene]
+            render_cache.put(
+                cache_keys[scene],
+                media_path if execution_mode == "full" else None,
+                scene_frames,
+                result.stdout,
+                result.stderr,
+                result.elapsed,
+            )
+
+    kept_clips: dict[str, str] = {}
+    if keep_clips and rendering_success and execution_mode == "full" and time_scale == 1:
+        kept_clips = _keep_clips(
+            code, render_profile, output_media_dir, scene_names, fresh_videos, cached, reused
+        )
+        if kept_clips:
+            rendered_files = [path for path in rendered_files if path not in fresh_videos.values()]
+
+    if outcomes is not None:
+        for scene, result in results.items():
+            outcomes[scene] = SceneOutcome(
+                result, scene_frames_by_name.get(scene, []), kept_clips.get(scene)
+            )
+
+    _, mime_type = FRAME_FORMATS[frame_format]
+    encoded_frames = [EncodedFrame(name, data, mime_type) for name, data in frames]
+
+    # save artifacts (e.g extracted frames) using scene names
+    if step_name and artifact_manager and frames:
+        step_frames_dir = artifact_manager.get_step_frames_path(step_name)
+        os.makedirs(step_frames_dir, exist_ok=True)
+
+        for idx, frame in enumerate(encoded_frames, start=1):
+            safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", frame.name)
+            frame_filename = f"{idx:02d}_{safe_name}{frame.extension}"
+            frame_path = os.path.join(step_frames_dir, frame_filename)
+
+            with open(frame_path, "wb") as f:
+                f.write(frame.data)
+
+    # Clean up video files after extracting frames to prevent old videos
+    # from previous iterations affecting scene counting
+    # Only clean up videos from successful scenes (failed scenes won't have videos)
+    if headless:
+        _remove_videos(rendered_files, console, headless)
     else:
+        with console.status("[bold blue]Cleaning up video files..."):
+            _remove_videos(rendered_files, console, headless)
+
+    return rendering_success, encoded_frames, combined_logs, successful_scenes
+
+
+def _extract_scene_frames(
+    scene: str,
+    scene_video_path: str,
+    frame_extraction_mode: str,
+    frame_count: int,
+    console: Console,
+    headless: bool,
+    frame_format: str = "png",
+    frame_quality: int = 85,
+    frame_max_dimension: int | None = None,
+) -> list[tuple[str, bytes]]:
+    """Extract frames from a rendered scene and encode them in the requested format."""
+    scene_frames: list[tuple[str, bytes]] = []
+    try:
+        extracted_frames = extract_frames_from_video(
+            scene_video_path, frame_extraction_mode, frame_count
+        )
+        if not extracted_frames:
+            if not headless:
+                console.print(
+                    f"[yellow]No suitable frames extracted from {scene_video_path}[/yellow]"
+                )
+            return scene_frames
+
+        for idx, frame in enumerate(extracted_frames):
+            data = encode_frame(frame, frame_format, frame_quality, frame_max_dimension)
+            if data is not None:
+                frame_name = f"{scene}_{idx + 1}" if len(extracted_frames) > 1 else scene
+                scene_frames.append((frame_name, data))
+            elif not headless:
+                console.print(
+                    f"[yellow]Failed to encode frame {idx + 1} for {scene_video_path}[/yellow]"
+                )
+    except Exception as e:
         if not headless:
-            console.print(f"[red]Video directory not found at {video_base_path}[/red]")
+            console.print(f"[red]Error extracting frame from {scene_video_path}: {e}[/red]")
+    return scene_frames
+
 
-    return rendering_success, [data_url for _, data_url in frames], combined_logs, successful_scenes
+def _find_last_frame(image_dir: str, scene: str) -> str | None:
+    """Locate the still written by `manim -s` (named `<Scene>_ManimCE_v<version>.png`)."""
+    candidates = [os.path.join(image_dir, f"{scene}.png")]
+    candidates += sorted(glob.glob(os.path.join(glob.escape(image_dir), f"{scene}_ManimCE_v*.png")))
+    for path in candidates:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def _keep_clips(
+    code: str,
+    render_profile: str,
+    output_media_dir: str,
+    scene_names: list[str],
+    fresh_videos: dict[str, str],
+    cached: dict[str, CachedScene],
+    reused: dict[str, SceneOutcome],
+) -> dict[str, str]:
+    """
+    Store the clips of every scene as the promotable clip set of this code.
+
+    Freshly rendered videos are moved into the set; scenes served from the render
+    cache or carried forward from an earlier execution contribute their stored clip.
+    Nothing is stored unless every scene has a clip.
+    """
+    linked = {}
+    for scene in scene_names:
+        source = cached.get(scene) or reused.get(scene)
+        clip = source.clip_path if source is not None else None
+        if clip and os.path.exists(clip):
+            linked[scene] = clip
+    if len(linked) + len(fresh_videos) < len(scene_names):
+        return {}
+    try:
+        return store_clips(
+            output_media_dir, clip_set_key(code, render_profile), fresh_videos, linked
+        )
+    except OSError as e:
+        logger.warning("Could not keep review clips for promotion: %s", e)
+        return {}
+
+
+def _remove_videos(video_paths: list[str], console: Console, headless: bool) -> None:
+    """Delete rendered scene videos once their frames have been extracted."""
+    for video_path in video_paths:
+        try:
+            os.remove(video_path)
+        except Exception as e:
+            if not headless:
+                console.print(f"[yellow]Warning: Could not delete {video_path}: {e}[/yellow]")
 
 
 def calculate_scene_success_rate(
@@ -261,6 +799,43 @@ def calculate_scene_success_rate(
     return success_rate, scenes_rendered, total_scenes
 
 
+def _read_sampled_frames(cap: cv2.VideoCapture, frame_indices: np.ndarray):
+    """
+    Decode a video forward, yielding (index, frame) for the sampled indices.
+
+    Frames between samples are only `grab()`bed to advance the decoder and just the
+    sampled frames are `retrieve()`d (converted to BGR). A `CAP_PROP_POS_FRAMES` seek
+    re-decodes from the previous keyframe, so it is only used when the next sample is
+    more than a keyframe interval ahead, where it cannot be slower than grabbing.
+    """
+    position = 0
+    for idx in sorted({int(idx) for idx in frame_indices}):
+        if idx - position > MAX_SEQUENTIAL_GAP:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
+            position = idx
+        while position < idx:
+            if not cap.grab():
+                return
+            position += 1
+        if not cap.grab():
+            return
+        position += 1
+        ret, frame = cap.retrieve()
+        if ret:
+            yield idx, frame
+
+
+def _frame_density(frame: np.ndarray) -> float:
+    """Fraction of non-black pixels, measured on a thumbnail of the frame."""
+    height, width = frame.shape[:2]
+    scale = min(1.0, DENSITY_THUMBNAIL_WIDTH / width)
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    thumbnail = cv2.cvtColor(
+        cv2.resize(frame, size, interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2GRAY
+    )
+    return np.count_nonzero(thumbnail > DENSITY_BLACK_THRESHOLD) / thumbnail.size
+
+
 def extract_frames_from_video(
     video_path: str,
     mode: str = "fixed_count",
@@ -270,6 +845,9 @@ def extract_frames_from_video(
     """
     Extract frames from a video using different strategies.
 
+    Frames are read in a single forward decode pass. In highest_density mode the
+    sampled frames are scored on downsampled grayscale thumbnails.
+
     Args:
         video_path: Path to the video file
         mode: "highest_density" for single best frame, "fixed_count" for multiple frames
@@ -279,66 +857,43 @@ def extract_frames_from_video(
     Returns:
         list of numpy.ndarray: The extracted frames, or None if error
     """
+    cap = cv2.VideoCapture(video_path)
     try:
-        cap = cv2.VideoCapture(video_path)
-        if not cap.isOpened():
+        if not cap.isOpened() or mode not in ("highest_density", "fixed_count"):
             return None
 
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        if total_frames == 0:
+        # MP4 headers give the exact frame count; OpenCV estimates it from duration and fps
+        info = probe_video(video_path, use_ffprobe=False)
+        if info is not None and info.frame_count is not None:
+            total_frames = info.frame_count
+        else:
+            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        if total_frames <= 0:
             return None
 
-        if mode == "highest_density":
-            # evenly sample frames
-            frame_indices = np.linspace(
-                0, total_frames - 1, min(max_frames, total_frames), dtype=int
-            )
-
-            best_frame = None
-            best_density = 0
-
-            for frame_idx in frame_indices:
-                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
-                ret, frame = cap.read()
-
-                if not ret:
-                    continue
-
-                # Calculate non-black pixel density
-                # Consider a pixel non-black if any channel > threshold
-                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                non_black_pixels = np.sum(gray > 30)  # Threshold for "black"
-                total_pixels = gray.shape[0] * gray.shape[1]
-                density = non_black_pixels / total_pixels
-
-                if density > best_density:
-                    best_density = density
-                    best_frame = frame.copy()
-
-            cap.release()
-            return [best_frame] if best_frame is not None else None
-
-        elif mode == "fixed_count":
-            # extract fixed count
-            frame_indices = np.linspace(
-                0, total_frames - 1, min(frame_count, total_frames), dtype=int
-            )
-
-            extracted_frames = []
-            for frame_idx in frame_indices:
-                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
-                ret, frame = cap.read()
-
-                if ret:
-                    extracted_frames.append(frame.copy())
+        sample_count = max_frames if mode == "highest_density" else frame_count
+        frame_indices = np.linspace(0, total_frames - 1, min(sample_count, total_frames), dtype=int)
+        if len(frame_indices) == 0:
+            return None
 
-            cap.release()
+        if mode == "fixed_count":
+            extracted_frames = [frame for _, frame in _read_sampled_frames(cap, frame_indices)]
             return extracted_frames if extracted_frames else None
 
-        else:
-            cap.release()
-            return None
+        # highest_density: non-black pixel density scored on a small grayscale thumbnail,
+        # so only the best full-resolution frame is kept alive while decoding
+        best_frame = None
+        best_density = 0.0
+        for _, frame in _read_sampled_frames(cap, frame_indices):
+            density = _frame_density(frame)
+            if density > best_density:
+                best_density = density
+                best_frame = frame
+
+        return [best_frame] if best_frame is not None else None
 
     except Exception as e:
         logger.exception(f"Error extracting frames from {video_path}: {e}")
         return None
+    finally:
+        cap.release()
@@ -0,0 +1,87 @@
+"""Review clips kept for promotion to the final video.
+
+When review executions render at the final quality (or a review-quality final
+video is acceptable), the clips of the last fully successful execution are kept
+under `<output_dir>/review_clips/<key>/<Scene>.mp4` instead of being deleted, and
+the final video is concatenated from them without rendering the script again.
+
+The key hashes the exact code and render profile of the execution, so clips are
+only ever promoted for the very code they were rendered from. Only one clip set
+is kept: storing a new set removes the previous ones.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+CLIPS_DIR = "review_clips"
+
+
+def clip_set_key(code: str, render_profile: str) -> str:
+    """Key identifying the clips rendered from this exact code at this profile."""
+    payload = json.dumps({"code": code, "render_profile": render_profile}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def _link_or_copy(source: str, destination: str) -> None:
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+def store_clips(
+    output_dir: str, key: str, moved: dict[str, str], linked: dict[str, str]
+) -> dict[str, str]:
+    """
+    Store a complete clip set, replacing any previously stored set.
+
+    Args:
+        output_dir: Workflow output directory
+        key: Clip set key (see `clip_set_key`)
+        moved: Scene name -> freshly rendered clip, moved into the set
+        linked: Scene name -> clip owned by someone else (render cache, an earlier
+            set), hard-linked or copied into the set
+
+    Returns:
+        dict mapping scene names to their clip paths in the stored set
+    """
+    root = os.path.join(output_dir, CLIPS_DIR)
+    os.makedirs(root, exist_ok=True)
+    staging_dir = tempfile.mkdtemp(prefix=".staging_", dir=root)
+    for scene, clip in linked.items():
+        _link_or_copy(clip, os.path.join(staging_dir, f"{scene}.mp4"))
+    for scene, clip in moved.items():
+        shutil.move(clip, os.path.join(staging_dir, f"{scene}.mp4"))
+
+    # linked clips may come from the set being replaced, so they are staged first
+    for name in os.listdir(root):
+        if name != os.path.basename(staging_dir):
+            shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+    set_dir = os.path.join(root, key)
+    os.rename(staging_dir, set_dir)
+    return {scene: os.path.join(set_dir, f"{scene}.mp4") for scene in [*linked, *moved]}
+
+
+def find_clips(output_dir: str, key: str, scene_names: list[str]) -> dict[str, str] | None:
+    """
+    Look up the stored clips of every scene for a clip set key.
+
+    Args:
+        output_dir: Workflow output directory
+        key: Clip set key (see `clip_set_key`)
+        scene_names: Scenes that all need a clip
+
+    Returns:
+        dict mapping scene names to clip paths, or None unless every scene has one
+    """
+    set_dir = os.path.join(output_dir, CLIPS_DIR, key)
+    clips = {scene: os.path.join(set_dir, f"{scene}.mp4") for scene in scene_names}
+    if not scene_names or not all(os.path.exists(clip) for clip in clips.values()):
+        return None
+    return clips
@@ -0,0 +1,156 @@
+"""Opt-in resource limits and resource accounting for render processes.
+
+`sandbox_command` wraps a command so it runs under this module, which applies
+rlimits (address space, CPU time, open files) to the command's process and, once it
+exits, writes the process's peak RSS, user/system CPU time and wall time to a JSON
+file. The wrapper runs the command as a child rather than exec'ing it because the
+child's rusage is only available to the process that waits for it.
+
+Limits rely on the POSIX `resource` module; elsewhere commands run unlimited.
+"""
+
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+@dataclass
+class ResourceLimits:
+    """
+    Per-process resource limits. None leaves a resource unlimited.
+
+    Attributes:
+        max_memory_mb: Address space limit (RLIMIT_AS) in MB. This bounds virtual
+            memory, so it must leave room for the libraries manim maps at import.
+        max_cpu_seconds: CPU time limit (RLIMIT_CPU); the process gets SIGXCPU.
+        max_open_files: Open file descriptor limit (RLIMIT_NOFILE).
+    """
+
+    max_memory_mb: int | None = None
+    max_cpu_seconds: int | None = None
+    max_open_files: int | None = None
+
+    def apply(self) -> None:
+        """Set the limits on the current process (call in the child before running)."""
+        if resource is None:
+            return
+        if self.max_memory_mb:
+            limit = self.max_memory_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        if self.max_cpu_seconds:
+            # the hard limit is a little higher so SIGXCPU arrives before SIGKILL
+            resource.setrlimit(
+                resource.RLIMIT_CPU, (self.max_cpu_seconds, self.max_cpu_seconds + 5)
+            )
+        if self.max_open_files:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (self.max_open_files, self.max_open_files))
+
+    def scaled_cpu(self, factor: int) -> "ResourceLimits":
+        """Return limits with the CPU budget multiplied, for processes running several scenes."""
+        cpu = self.max_cpu_seconds * factor if self.max_cpu_seconds else None
+        return ResourceLimits(self.max_memory_mb, cpu, self.max_open_files)
+
+    def to_cli_args(self) -> list[str]:
+        """Arguments passing these limits to the sandbox module."""
+        args = []
+        if self.max_memory_mb:
+            args += ["--max-memory-mb", str(self.max_memory_mb)]
+        if self.max_cpu_seconds:
+            args += ["--max-cpu-seconds", str(self.max_cpu_seconds)]
+        if self.max_open_files:
+            args += ["--max-open-files", str(self.max_open_files)]
+        return args
+
+
+def is_supported() -> bool:
+    """Resource limits and accounting need the POSIX `resource` module."""
+    return resource is not None
+
+
+def usage_from_rusage(rusage, wall_seconds: float) -> dict:
+    """Convert a `resource.struct_rusage` into the usage dict stored in execution history."""
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    rss_unit = 1 if sys.platform == "darwin" else 1024
+    return {
+        "peak_rss_mb": round(rusage.ru_maxrss * rss_unit / (1024 * 1024), 1),
+        "user_cpu_seconds": round(rusage.ru_utime, 3),
+        "system_cpu_seconds": round(rusage.ru_stime, 3),
+        "wall_seconds": round(wall_seconds, 3),
+    }
+
+
+def sandbox_command(command: list[str], limits: ResourceLimits, usage_file: str) -> list[str]:
+    """Wrap a command so it runs under the given limits and reports its usage."""
+    return [
+        sys.executable,
+        "-m",
+        "manim_generator.utils.sandbox",
+        *limits.to_cli_args(),
+        "--usage-file",
+        usage_file,
+        "--",
+        *command,
+    ]
+
+
+def read_usage(usage_file: str) -> dict | None:
+    """Read and delete the usage file written by a sandboxed command."""
+    try:
+        with open(usage_file, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+    finally:
+        try:
+            os.remove(usage_file)
+        except OSError:
+            pass
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point: run a command under resource limits and record its usage."""
+    parser = argparse.ArgumentParser(description="Run a command under resource limits")
+    parser.add_argument("--max-memory-mb", type=int, default=None)
+    parser.add_argument("--max-cpu-seconds", type=int, default=None)
+    parser.add_argument("--max-open-files", type=int, default=None)
+    parser.add_argument("--usage-file", required=True)
+    parser.add_argument("command", nargs=argparse.REMAINDER)
+    args = parser.parse_args(argv)
+    command = args.command[1:] if args.command[:1] == ["--"] else args.command
+
+    limits = ResourceLimits(args.max_memory_mb, args.max_cpu_seconds, args.max_open_files)
+    start = time.perf_counter()
+    try:
+        returncode = subprocess.call(command, preexec_fn=limits.apply)
+    except OSError as e:
+        print(f"Failed to start {command[0]}: {e}", file=sys.stderr)
+        return 127
+    wall_seconds = time.perf_counter() - start
+
+    if resource is not None:
+        usage = usage_from_rusage(resource.getrusage(resource.RUSAGE_CHILDREN), wall_seconds)
+        with open(args.usage_file, "w", encoding="utf-8") as f:
+            json.dump(usage, f)
+
+    if returncode < 0:
+        name = signal.Signals(-returncode).name
+        print(
+            f"Render process was killed by {name} (resource limits: {limits})",
+            file=sys.stderr,
+        )
+        return 128 - returncode
+    return returncode
+
+
+if __name__ == "__main__":
+    sys.exit(main())
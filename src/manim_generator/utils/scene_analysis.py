@@ -0,0 +1,157 @@
+"""Static analysis of the module-level code each Scene class depends on.
+
+Builds on `extract_scene_class_names`: for every scene, collect the module-level
+classes, functions and constants it references (transitively) so scenes can be
+fingerprinted independently of the rest of the script.
+"""
+
+import ast
+import hashlib
+
+from manim_generator.utils.parsing import extract_scene_class_names
+
+
+def bound_names(node: ast.stmt) -> list[str] | None:
+    """
+    Return the names a top-level statement defines, or None if it is not a pure definition.
+
+    Statements that are not pure definitions (expressions, attribute assignments such
+    as `config.x = ...`, loops, conditionals) may have side effects on every scene.
+    """
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return [node.name]
+    if isinstance(node, ast.Assign):
+        names = []
+        for target in node.targets:
+            elements = target.elts if isinstance(target, (ast.Tuple, ast.List)) else [target]
+            if not all(isinstance(element, ast.Name) for element in elements):
+                return None
+            names.extend(element.id for element in elements)
+        return names
+    if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+        return [node.target.id]
+    return None
+
+
+def _referenced_names(node: ast.AST) -> set[str]:
+    """Collect every bare name referenced inside a node."""
+    return {child.id for child in ast.walk(node) if isinstance(child, ast.Name)}
+
+
+def _analyze(tree: ast.Module) -> tuple[dict[str, list[ast.stmt]], list[ast.stmt]]:
+    """Split top-level statements into named definitions and shared statements."""
+    definitions: dict[str, list[ast.stmt]] = {}
+    shared: list[ast.stmt] = []
+    for node in tree.body:
+        names = bound_names(node)
+        if names is None:
+            # imports and side-effecting statements apply to every scene
+            shared.append(node)
+            continue
+        for name in names:
+            definitions.setdefault(name, []).append(node)
+    return definitions, shared
+
+
+def _dependency_closure(
+    scene: str, definitions: dict[str, list[ast.stmt]]
+) -> tuple[set[str], list[ast.stmt]]:
+    """Return the module-level names a scene depends on and their defining statements."""
+    seen: set[str] = set()
+    statements: list[ast.stmt] = []
+    pending = [scene]
+    while pending:
+        name = pending.pop()
+        if name in seen or name not in definitions:
+            continue
+        seen.add(name)
+        for node in definitions[name]:
+            if node not in statements:
+                statements.append(node)
+            pending.extend(_referenced_names(node) - seen)
+    seen.discard(scene)
+    return seen, statements
+
+
+def scene_statements(tree: ast.Module, scenes: list[str]) -> list[ast.stmt]:
+    """
+    Return the top-level statements that run when the given scenes render.
+
+    These are the shared statements (imports and side effects) plus each scene's
+    definition and the definitions it depends on, in source order.
+    """
+    definitions, shared = _analyze(tree)
+    statements: list[ast.stmt] = list(shared)
+    for scene in scenes:
+        _, closure = _dependency_closure(scene, definitions)
+        statements.extend(node for node in closure if node not in statements)
+    order = {id(node): index for index, node in enumerate(tree.body)}
+    statements.sort(key=lambda node: order[id(node)])
+    return statements
+
+
+def get_scene_dependencies(code: str) -> dict[str, set[str]] | Exception:
+    """
+    Map each Scene class to the module-level helper classes, functions and constants
+    it references, directly or transitively (including custom base classes).
+
+    Returns:
+        dict mapping scene name to dependency names, or the parsing exception.
+    """
+    scene_names = extract_scene_class_names(code)
+    if isinstance(scene_names, Exception):
+        return scene_names
+
+    definitions, _ = _analyze(ast.parse(code))
+    return {scene: _dependency_closure(scene, definitions)[0] for scene in scene_names}
+
+
+def scene_fingerprints(code: str) -> dict[str, str] | Exception:
+    """
+    Compute a normalized content hash for every Scene class.
+
+    The hash covers the AST of the scene class, of every module-level definition it
+    depends on, and of all imports and side-effecting module-level statements.
+    ASTs are dumped without positions, so formatting and comment changes or edits
+    to unrelated scenes leave the fingerprint unchanged.
+
+    Returns:
+        dict mapping scene name to a hex digest, or the parsing exception.
+    """
+    scene_names = extract_scene_class_names(code)
+    if isinstance(scene_names, Exception):
+        return scene_names
+
+    tree = ast.parse(code)
+    definitions, shared = _analyze(tree)
+    order = {id(node): index for index, node in enumerate(tree.body)}
+    shared_dump = "\n".join(ast.dump(node) for node in shared)
+
+    fingerprints: dict[str, str] = {}
+    for scene in scene_names:
+        if scene in definitions:
+            _, statements = _dependency_closure(scene, definitions)
+        else:
+            # scene class is not defined at module level: depend on the whole module
+            statements = [node for node in tree.body if node not in shared]
+        statements.sort(key=lambda node: order[id(node)])
+        digest = hashlib.sha256(shared_dump.encode("utf-8"))
+        for node in statements:
+            digest.update(b"\0")
+            digest.update(ast.dump(node).encode("utf-8"))
+        fingerprints[scene] = digest.hexdigest()
+    return fingerprints
+
+
+def changed_scenes(previous_code: str, code: str) -> list[str] | None:
+    """
+    List the scenes of a revision whose fingerprint differs from the previous code.
+
+    Scenes that are new in the revision count as changed. Returns None when either
+    version cannot be parsed, in which case every scene should be re-rendered.
+    """
+    previous = scene_fingerprints(previous_code)
+    current = scene_fingerprints(code)
+    if isinstance(previous, Exception) or isinstance(current, Exception):
+        return None
+    return [scene for scene, fingerprint in current.items() if previous.get(scene) != fingerprint]
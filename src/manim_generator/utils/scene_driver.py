@@ -0,0 +1,256 @@
+"""In-process Manim driver that renders several scenes in a single interpreter.
+
+Run as `python -m manim_generator.utils.scene_driver`. The script is imported
+once and manim is imported once, then every requested scene is rendered in turn.
+Each scene's stdout/stderr are captured at the file-descriptor level, a per-scene
+timeout is enforced with SIGALRM where available, and one JSON line per scene is
+appended to the results file as soon as the scene finishes, so a crash of the
+driver loses at most the scene that was being rendered. Where the `resource`
+module is available, each result carries the CPU time spent on the scene and the
+driver's peak RSS so far (a high-water mark shared by all scenes of the batch).
+Successful results also report the scene's number of animations (`play()` and
+`wait()` calls), which `utils/sharding.py` uses to split long scenes.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import signal
+import sys
+import tempfile
+import time
+import traceback
+from pathlib import Path
+
+from manim_generator.utils import asset_cache as asset_cache_module
+from manim_generator.utils.asset_cache import AssetCacheRun
+from manim_generator.utils.sandbox import resource, usage_from_rusage
+
+QUALITY_FLAGS = {
+    "-ql": "low_quality",
+    "-qm": "medium_quality",
+    "-qh": "high_quality",
+    "-qp": "production_quality",
+    "-qk": "fourk_quality",
+}
+
+
+def quality_args(quality_flag: str) -> list[str]:
+    """
+    Driver arguments selecting a Manim quality preset given as its CLI flag, e.g. "-ql".
+
+    The driver takes the preset's letter (`--quality l`), since argparse refuses an
+    option value that starts with "-".
+    """
+    return ["--quality", quality_flag.removeprefix("-q")]
+
+
+class SceneTimeout(BaseException):
+    """Raised inside a scene when its time budget is exhausted.
+
+    Derives from BaseException so broad `except Exception` blocks in generated
+    scene code cannot swallow it.
+    """
+
+
+def _raise_timeout(signum, frame):
+    raise SceneTimeout()
+
+
+class _CapturedOutput:
+    """Redirect fds 1/2 (and the Python streams) into temporary files."""
+
+    def __enter__(self):
+        sys.stdout.flush()
+        sys.stderr.flush()
+        self._saved_fds = (os.dup(1), os.dup(2))
+        self._saved_streams = (sys.stdout, sys.stderr)
+        self._files = (tempfile.TemporaryFile(), tempfile.TemporaryFile())
+        os.dup2(self._files[0].fileno(), 1)
+        os.dup2(self._files[1].fileno(), 2)
+        sys.stdout = open(1, "w", encoding="utf-8", errors="replace", closefd=False)
+        sys.stderr = open(2, "w", encoding="utf-8", errors="replace", closefd=False)
+        return self
+
+    def __exit__(self, *exc_info):
+        sys.stdout.flush()
+        sys.stderr.flush()
+        sys.stdout, sys.stderr = self._saved_streams
+        os.dup2(self._saved_fds[0], 1)
+        os.dup2(self._saved_fds[1], 2)
+        for fd in self._saved_fds:
+            os.close(fd)
+        self.stdout, self.stderr = (self._read(f) for f in self._files)
+        return False
+
+    @staticmethod
+    def _read(file) -> str:
+        file.seek(0)
+        content = file.read().decode("utf-8", errors="replace")
+        file.close()
+        return content
+
+
+def _load_module(script_file: str):
+    """Import the generated script once, under its file-based module name."""
+    module_name = Path(script_file).stem
+    spec = importlib.util.spec_from_file_location(module_name, script_file)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def render_scenes(
+    script_file: str,
+    scenes: list[str],
+    quality: str,
+    media_dir: str,
+    results_file: str,
+    timeout: float | None = None,
+    save_last_frame: bool = False,
+    resolution: tuple[int, int] | None = None,
+    fps: float | None = None,
+    asset_cache: AssetCacheRun | None = None,
+) -> int:
+    """
+    Render scenes one after another in this process, appending results as JSON lines.
+
+    With save_last_frame, animations are skipped and only each scene's last frame is
+    written as a PNG, like `manim -s`. resolution (width, height) and fps override
+    the quality preset, like Manim's `-r` and `--fps`. With asset_cache, Tex and Text
+    SVGs are shared through the cache (see `utils/asset_cache.py`).
+    """
+    use_alarm = timeout is not None and hasattr(signal, "setitimer")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+
+    with _CapturedOutput() as setup:
+        module = None
+        try:
+            from manim import config, tempconfig
+
+            config.media_dir = media_dir
+            config.quality = QUALITY_FLAGS[quality]
+            if resolution is not None:
+                config.pixel_width, config.pixel_height = resolution
+            if fps is not None:
+                config.frame_rate = fps
+            if save_last_frame:
+                config.save_last_frame = True
+                config.write_to_movie = False
+            config.input_file = script_file
+            if asset_cache is not None:
+                asset_cache_module.install(asset_cache.cache_dir, asset_cache.stats_dir)
+            module = _load_module(script_file)
+        except BaseException:
+            traceback.print_exc()
+
+    failures = 0
+    with open(results_file, "a", encoding="utf-8") as results:
+        for scene in scenes:
+            start = time.perf_counter()
+            before = resource.getrusage(resource.RUSAGE_SELF) if resource else None
+            returncode = 0
+            timed_out = False
+            animations = None
+            with _CapturedOutput() as captured:
+                if module is None:
+                    # the module failed to import: every scene fails with the same error
+                    sys.stderr.write(setup.stderr)
+                    returncode = 1
+                else:
+                    try:
+                        if use_alarm:
+                            signal.setitimer(signal.ITIMER_REAL, timeout)
+                        with tempconfig({}):
+                            instance = getattr(module, scene)()
+                            instance.render()
+                        renderer = getattr(instance, "renderer", None)
+                        animations = getattr(renderer, "num_plays", None)
+                    except SceneTimeout:
+                        timed_out = True
+                        returncode = 1
+                    except BaseException:
+                        traceback.print_exc()
+                        returncode = 1
+                    finally:
+                        if use_alarm:
+                            signal.setitimer(signal.ITIMER_REAL, 0)
+
+            elapsed = time.perf_counter() - start
+            usage = None
+            if before is not None:
+                after = resource.getrusage(resource.RUSAGE_SELF)
+                usage = usage_from_rusage(after, elapsed)
+                usage["user_cpu_seconds"] = round(after.ru_utime - before.ru_utime, 3)
+                usage["system_cpu_seconds"] = round(after.ru_stime - before.ru_stime, 3)
+
+            failures += returncode != 0
+            results.write(
+                json.dumps(
+                    {
+                        "scene": scene,
+                        "stdout": captured.stdout,
+                        "stderr": captured.stderr,
+                        "returncode": returncode,
+                        "timed_out": timed_out,
+                        "elapsed": elapsed,
+                        "usage": usage,
+                        "animations": animations,
+                    }
+                )
+                + "\n"
+            )
+            results.flush()
+
+    asset_cache_module.write_stats()
+    return 1 if failures else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point used by `run_manim_multiscene` in batch mode."""
+    parser = argparse.ArgumentParser(description="Render several Manim scenes in one process")
+    parser.add_argument("script_file")
+    parser.add_argument("scenes", nargs="+")
+    parser.add_argument(
+        "--quality",
+        default="l",
+        choices=sorted(flag.removeprefix("-q") for flag in QUALITY_FLAGS),
+        help="Quality preset letter, as in Manim's -q<letter>",
+    )
+    parser.add_argument("--media_dir", required=True)
+    parser.add_argument("--results", required=True, help="JSON lines file receiving results")
+    parser.add_argument("--timeout", type=float, default=None, help="Per-scene timeout")
+    parser.add_argument(
+        "-s", "--save_last_frame", action="store_true", help="Only save each scene's last frame"
+    )
+    parser.add_argument("-r", "--resolution", default=None, help='Override resolution as "W,H"')
+    parser.add_argument("--fps", type=float, default=None, help="Override the frame rate")
+    parser.add_argument("--asset-cache-dir", default=None, help="Shared Tex/Text SVG cache")
+    parser.add_argument(
+        "--asset-stats-dir", default=None, help="Directory receiving asset cache lookup counts"
+    )
+    args = parser.parse_args(argv)
+    resolution = None
+    if args.resolution:
+        width, height = args.resolution.split(",")
+        resolution = (int(width), int(height))
+
+    return render_scenes(
+        args.script_file,
+        args.scenes,
+        f"-q{args.quality}",
+        args.media_dir,
+        args.results,
+        args.timeout,
+        args.save_last_frame,
+        resolution,
+        args.fps,
+        AssetCacheRun(args.asset_cache_dir, args.asset_stats_dir) if args.asset_cache_dir else None,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
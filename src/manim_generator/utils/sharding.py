@@ -0,0 +1,142 @@
+"""Splitting long scenes into animation ranges that render in parallel.
+
+Manim numbers every `play()`/`wait()` call of a scene. With `-n first,last` it
+skips the animations before `first` (applying their end state without rendering
+frames), renders `first` through `last` inclusive and stops the scene after
+`last`. Rendering contiguous ranges in separate processes and concatenating the
+resulting videos therefore reproduces the full scene, with the shards encoded
+in parallel. (Each shard replays construct() on its own, so scenes drawing
+unseeded random values may differ from one shard to the next.)
+
+Animation counts come from a quick pass of the batch driver with animations
+skipped (see `utils/scene_driver.py`).
+"""
+
+import json
+import logging
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from manim_generator.utils.asset_cache import AssetCacheRun
+from manim_generator.utils.scene_driver import quality_args
+
+logger = logging.getLogger(__name__)
+
+# a shard pays for a Manim start-up and for replaying the skipped animations,
+# so scenes are never split into shards smaller than this
+MIN_SHARD_ANIMATIONS = 8
+
+
+def count_scene_animations(
+    script_file: str,
+    scene_names: list[str],
+    work_dir: str,
+    timeout: float | None = None,
+    asset_cache: AssetCacheRun | None = None,
+) -> dict[str, int]:
+    """
+    Count the animations of each scene with one skip-animations pass of the batch driver.
+
+    Args:
+        script_file: Path to the Manim script
+        scene_names: Scenes to count
+        work_dir: Directory in which a scratch media directory is created and removed
+        timeout: Max seconds for the whole pass (None disables the timeout)
+        asset_cache: Shared Tex/Text SVG cache, so the pass warms it for the shards
+
+    Returns:
+        dict mapping scene names to their number of animations; scenes that failed
+        to run are missing
+    """
+    scratch_dir = tempfile.mkdtemp(prefix="animation_counts_", dir=work_dir)
+    results_file = os.path.join(scratch_dir, "counts.jsonl")
+    command = [
+        sys.executable,
+        "-m",
+        "manim_generator.utils.scene_driver",
+        script_file,
+        *scene_names,
+        *quality_args("-ql"),
+        "--media_dir",
+        scratch_dir,
+        "--results",
+        results_file,
+        "--save_last_frame",
+    ]
+    if asset_cache is not None:
+        command += asset_cache.driver_args()
+    counts: dict[str, int] = {}
+    try:
+        process = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+        if os.path.exists(results_file):
+            with open(results_file, encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    result = json.loads(line)
+                    if result["returncode"] == 0 and result.get("animations") is not None:
+                        counts[result["scene"]] = result["animations"]
+        missing = [scene for scene in scene_names if scene not in counts]
+        if missing:
+            logger.warning(
+                "Could not count the animations of %s (exit code %d), so they are not sharded: %s",
+                ", ".join(missing),
+                process.returncode,
+                process.stderr.strip()[-500:],
+            )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.warning("Counting scene animations failed: %s", e)
+    finally:
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+    return counts
+
+
+def plan_shards(
+    animation_counts: dict[str, int],
+    workers: int,
+    min_shard_animations: int = MIN_SHARD_ANIMATIONS,
+) -> dict[str, list[tuple[int, int | None]]]:
+    """
+    Split scenes holding more than their share of all animations into ranges.
+
+    A worker's fair share is the total number of animations divided by the number of
+    workers (but at least min_shard_animations). Each scene is cut into as many
+    contiguous, near-equal ranges as it has shares, up to one per worker and without
+    any range holding fewer than min_shard_animations animations.
+
+    Args:
+        animation_counts: Number of animations of each scene
+        workers: Number of render jobs that run concurrently
+        min_shard_animations: Smallest number of animations worth a separate shard
+
+    Returns:
+        dict mapping each sharded scene to its inclusive (first, last) animation
+        ranges in order; the last range ends at None (the end of the scene).
+        Scenes rendered in one piece are not included.
+    """
+    total = sum(animation_counts.values())
+    if workers < 2 or total == 0:
+        return {}
+    share = max(min_shard_animations, math.ceil(total / workers))
+
+    plans: dict[str, list[tuple[int, int | None]]] = {}
+    for scene, count in animation_counts.items():
+        shards = min(workers, math.ceil(count / share), count // min_shard_animations)
+        if shards < 2:
+            continue
+        bounds = [round(i * count / shards) for i in range(shards + 1)]
+        ranges: list[tuple[int, int | None]] = [
+            (bounds[i], bounds[i + 1] - 1) for i in range(shards - 1)
+        ]
+        ranges.append((bounds[-2], None))
+        plans[scene] = ranges
+    return plans
+
+
+def shard_args(first: int, last: int | None) -> list[str]:
+    """Manim CLI arguments rendering animations first..last (inclusive)."""
+    return ["-n", f"{first}" if last is None else f"{first},{last}"]
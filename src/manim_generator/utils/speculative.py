@@ -0,0 +1,285 @@
+"""Speculative final renders.
+
+Once an execution fully succeeds, its code may already be the code that ends up
+in the final video, so the final render of that code can start in the background
+while the review cycles go on. `SpeculativeRender` keeps at most one such render
+running: a later successful revision cancels it and starts over with the newer
+code, and finalization waits for the render of the final working code and takes
+its video instead of rendering again.
+
+Each render runs `python -m manim_generator.utils.speculative` in its own
+process group at a lower CPU priority than the review renders on the critical
+path. Cancelling it sends SIGTERM to the group, then SIGKILL after a grace
+period, so it stops the manim processes it started: those in its group directly,
+and the sandboxed renders, which run in sessions of their own, from its SIGTERM
+handler. It renders its own copy of the script into
+`<output_dir>/speculative/<key>/`, which is removed once the render is cancelled
+or its video has been taken. Background renders always use the subprocess
+backend, since warm render workers belong to the parent process.
+"""
+
+import argparse
+import atexit
+import hashlib
+import json
+import logging
+import os
+import shutil
+import signal
+import subprocess
+import sys
+from dataclasses import dataclass
+
+from manim_generator.utils.asset_cache import AssetCache
+from manim_generator.utils.rendering import kill_sandboxed_renders
+from manim_generator.utils.sandbox import ResourceLimits
+from manim_generator.utils.video import render_and_concat
+
+logger = logging.getLogger(__name__)
+
+SPECULATIVE_DIR = "speculative"
+SCRIPT_NAME = "video.py"
+VIDEO_NAME = "final_video.mp4"
+LOG_NAME = "render.log"
+# added to the niceness of background renders so review renders get the CPU first
+NICENESS = 10
+# seconds a cancelled render gets to stop its sandboxed renders before it is killed
+STOP_GRACE_SECONDS = 5
+
+# background renders still running, stopped when the interpreter exits
+_running: set[subprocess.Popen] = set()
+
+
+def render_key(code: str, render_profile: str) -> str:
+    """Key identifying the final render of this exact code at this profile."""
+    payload = json.dumps({"code": code, "render_profile": render_profile}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def _stop(process: subprocess.Popen) -> None:
+    """Stop a background render and everything it started."""
+    if process.poll() is None:
+        try:
+            # the render kills its sandboxed renders on SIGTERM (see `main`)
+            os.killpg(process.pid, signal.SIGTERM)
+            process.wait(STOP_GRACE_SECONDS)
+        except (AttributeError, OSError):
+            process.terminate()
+        except subprocess.TimeoutExpired:
+            pass
+        # whatever is left of the group, including a render that did not stop in time
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (AttributeError, OSError):
+            process.kill()
+        process.wait()
+    _running.discard(process)
+
+
+def _handle_sigterm(signum, frame) -> None:
+    """Stop the sandboxed renders, which are outside this process group, then exit."""
+    kill_sandboxed_renders()
+    os._exit(128 + signum)
+
+
+@atexit.register
+def _stop_all() -> None:
+    for process in list(_running):
+        _stop(process)
+
+
+@dataclass
+class _Job:
+    code: str
+    directory: str
+    process: subprocess.Popen
+
+
+class SpeculativeRender:
+    """The background final render of the latest fully successful code."""
+
+    def __init__(
+        self,
+        output_dir: str,
+        render_profile: str = "final",
+        resource_limits: ResourceLimits | None = None,
+        render_workers: int | None = None,
+        shard_scenes: bool = False,
+        asset_cache_dir: str | None = None,
+        asset_cache_max_mb: int = 512,
+    ):
+        """
+        Args:
+            output_dir: Workflow output directory
+            render_profile: Render quality profile of the final video
+            resource_limits: Render each scene under these limits
+            render_workers: Max render jobs run concurrently (None uses the CPU count)
+            shard_scenes: Split long scenes into parallel animation ranges
+            asset_cache_dir: Shared Tex/Text SVG cache directory (None for none)
+            asset_cache_max_mb: Size budget of the Tex/Text SVG cache
+        """
+        self.output_dir = output_dir
+        self.render_profile = render_profile
+        self.resource_limits = resource_limits
+        self.render_workers = render_workers
+        self.shard_scenes = shard_scenes
+        self.asset_cache_dir = asset_cache_dir
+        self.asset_cache_max_mb = asset_cache_max_mb
+        self._job: _Job | None = None
+
+    def _command(self, job_dir: str) -> list[str]:
+        command = [
+            sys.executable,
+            "-m",
+            __name__,
+            os.path.join(job_dir, SCRIPT_NAME),
+            job_dir,
+            VIDEO_NAME,
+            "--profile",
+            self.render_profile,
+        ]
+        if self.render_workers:
+            command += ["--workers", str(self.render_workers)]
+        if self.shard_scenes:
+            command.append("--shard-scenes")
+        if self.resource_limits is not None:
+            command += ["--sandbox", *self.resource_limits.to_cli_args()]
+        if self.asset_cache_dir:
+            command += [
+                "--asset-cache-dir",
+                self.asset_cache_dir,
+                "--asset-cache-max-mb",
+                str(self.asset_cache_max_mb),
+            ]
+        return command
+
+    def start(self, code: str) -> bool:
+        """
+        Start the final render of this code, cancelling the render of any other code.
+
+        Args:
+            code: Manim script code of a fully successful execution
+
+        Returns:
+            bool: True if a render started, False if this code is already rendering
+        """
+        if self._job is not None and self._job.code == code:
+            return False
+        self.cancel()
+
+        job_dir = os.path.join(
+            self.output_dir, SPECULATIVE_DIR, render_key(code, self.render_profile)
+        )
+        shutil.rmtree(job_dir, ignore_errors=True)
+        os.makedirs(job_dir)
+        with open(os.path.join(job_dir, SCRIPT_NAME), "w", encoding="utf-8") as f:
+            f.write(code)
+
+        with open(os.path.join(job_dir, LOG_NAME), "w", encoding="utf-8") as log:
+            process = subprocess.Popen(
+                self._command(job_dir),
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                start_new_session=True,
+            )
+        _running.add(process)
+        self._job = _Job(code, job_dir, process)
+        logger.info("Started speculative final render in %s (pid %d)", job_dir, process.pid)
+        return True
+
+    def result(self, code: str, timeout: float | None = None) -> str | None:
+        """
+        Wait for the final render of this code.
+
+        A render of any other code is cancelled. The returned video stays in the
+        render directory until `cancel` is called, so callers move it out first.
+
+        Args:
+            code: Final working code
+            timeout: Seconds to wait before giving up on the render (None waits until it ends)
+
+        Returns:
+            str | None: Path to the rendered final video, or None if this code was
+            not rendering or its render failed
+        """
+        job = self._job
+        if job is None or job.code != code:
+            self.cancel()
+            return None
+
+        try:
+            returncode = job.process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            logger.warning("Speculative final render did not finish within %ss", timeout)
+            self.cancel()
+            return None
+        _running.discard(job.process)
+
+        video_path = os.path.join(job.directory, VIDEO_NAME)
+        if returncode != 0 or not os.path.exists(video_path):
+            logger.warning(
+                "Speculative final render failed with exit code %s (see %s)",
+                returncode,
+                os.path.join(job.directory, LOG_NAME),
+            )
+            return None
+        return video_path
+
+    def cancel(self) -> None:
+        """Stop the current render, if any, and remove its directory."""
+        job, self._job = self._job, None
+        if job is None:
+            return
+        if job.process.poll() is None:
+            logger.info("Cancelling speculative final render in %s", job.directory)
+        _stop(job.process)
+        shutil.rmtree(job.directory, ignore_errors=True)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point: render a script's final video at a lower CPU priority."""
+    parser = argparse.ArgumentParser(description="Render a final video in the background")
+    parser.add_argument("script_file")
+    parser.add_argument("output_media_dir")
+    parser.add_argument("final_output")
+    parser.add_argument("--profile", default="final")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--shard-scenes", action="store_true")
+    parser.add_argument("--sandbox", action="store_true")
+    parser.add_argument("--max-memory-mb", type=int, default=None)
+    parser.add_argument("--max-cpu-seconds", type=int, default=None)
+    parser.add_argument("--max-open-files", type=int, default=None)
+    parser.add_argument("--asset-cache-dir", default=None)
+    parser.add_argument("--asset-cache-max-mb", type=int, default=512)
+    args = parser.parse_args(argv)
+
+    if hasattr(os, "nice"):
+        os.nice(NICENESS)
+    signal.signal(signal.SIGTERM, _handle_sigterm)
+
+    video_path = render_and_concat(
+        args.script_file,
+        args.output_media_dir,
+        args.final_output,
+        resource_limits=(
+            ResourceLimits(args.max_memory_mb, args.max_cpu_seconds, args.max_open_files)
+            if args.sandbox
+            else None
+        ),
+        render_workers=args.workers,
+        shard_scenes=args.shard_scenes,
+        render_profile=args.profile,
+        autoplay=False,
+        asset_cache=(
+            AssetCache(args.asset_cache_dir, args.asset_cache_max_mb * 1024 * 1024)
+            if args.asset_cache_dir
+            else None
+        ),
+    )
+    return 0 if video_path else 1
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
@@ -0,0 +1,277 @@
+"""Parallel LaTeX pre-compilation of the Tex strings found in a script.
+
+Each scene render compiles its Tex/MathTex strings one after another, so a scene
+with many formulas spends most of its time waiting on LaTeX. Before rendering,
+`find_tex_jobs` walks the AST of the scenes about to render (and the module-level
+code they depend on, see `utils/scene_analysis.py`) and collects every
+`Tex`/`MathTex`/`SingleStringMathTex` call whose strings are literals, together
+with the arguments that change what LaTeX compiles: `arg_separator`,
+`tex_environment`, `substrings_to_isolate`, the keys of `tex_to_color_map` and a
+`tex_template` taken from `TexTemplateLibrary`.
+
+`precompile_tex` then builds those mobjects on a pool of processes with the
+shared asset cache installed (see `utils/asset_cache.py`). Building the real
+mobject makes Manim compile exactly the LaTeX documents the scene will ask for,
+so the scene renders find every SVG in the cache. Calls with computed strings,
+or with templates built in the script, are left to the scene render.
+"""
+
+import ast
+import logging
+import multiprocessing
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from manim_generator.utils import asset_cache
+from manim_generator.utils.parsing import extract_scene_class_names
+from manim_generator.utils.scene_analysis import scene_statements
+
+logger = logging.getLogger(__name__)
+
+TEX_MOBJECTS = ("Tex", "MathTex", "SingleStringMathTex")
+# keyword arguments that change the LaTeX source of a Tex mobject
+LITERAL_KWARGS = ("arg_separator", "tex_environment", "substrings_to_isolate")
+
+
+@dataclass(frozen=True)
+class TexJob:
+    """
+    A Tex mobject to build ahead of the scene renders.
+
+    Attributes:
+        mobject: Manim class name, e.g. "MathTex".
+        args: The literal tex strings.
+        kwargs: Literal keyword arguments that affect the compiled LaTeX, as sorted pairs.
+        template: Name of a `TexTemplateLibrary` template, or None for the default.
+    """
+
+    mobject: str
+    args: tuple[str, ...]
+    kwargs: tuple[tuple[str, object], ...] = ()
+    template: str | None = None
+
+
+@dataclass
+class PrecompileReport:
+    """
+    Outcome of a pre-compilation pass.
+
+    Attributes:
+        jobs: Number of Tex mobjects built.
+        compiled: Number of LaTeX documents compiled (the others were cached).
+        latex_seconds: Time spent building mobjects that needed compiling, summed
+            over the pool: LaTeX time moved out of the scene renders.
+        wall_seconds: Duration of the whole pass, including the pool start-up.
+        built: Tex mobjects that built without error; the others are left to the
+            scene renders.
+    """
+
+    jobs: int
+    compiled: int
+    latex_seconds: float
+    wall_seconds: float
+    built: list[TexJob] = field(default_factory=list)
+
+    def describe(self) -> str:
+        """One-line summary for the console and logs."""
+        return (
+            f"Pre-compiled {self.compiled} LaTeX document(s) for {self.jobs} Tex string(s) "
+            f"in {self.wall_seconds:.1f}s ({self.latex_seconds:.1f}s of LaTeX moved out of "
+            "scene renders)"
+        )
+
+
+def _hashable(value):
+    """Freeze a literal so jobs can be deduplicated."""
+    if isinstance(value, list):
+        return tuple(_hashable(item) for item in value)
+    return value
+
+
+def _tex_job(call: ast.Call) -> TexJob | None:
+    """Describe a Tex mobject call, or None if its LaTeX depends on runtime values."""
+    func = call.func
+    name = func.id if isinstance(func, ast.Name) else getattr(func, "attr", None)
+    if name not in TEX_MOBJECTS or not call.args:
+        return None
+    if not all(isinstance(arg, ast.Constant) and isinstance(arg.value, str) for arg in call.args):
+        return None
+
+    kwargs: dict[str, object] = {}
+    template = None
+    for keyword in call.keywords:
+        if keyword.arg is None:
+            return None  # **kwargs
+        if keyword.arg == "tex_template":
+            value = keyword.value
+            if not (
+                isinstance(value, ast.Attribute)
+                and isinstance(value.value, ast.Name)
+                and value.value.id == "TexTemplateLibrary"
+            ):
+                return None
+            template = value.attr
+        elif keyword.arg == "tex_to_color_map":
+            # only the keys change the compiled LaTeX: they are isolated like substrings
+            if not isinstance(keyword.value, ast.Dict):
+                return None
+            keys = keyword.value.keys
+            if not all(
+                isinstance(key, ast.Constant) and isinstance(key.value, str) for key in keys
+            ):
+                return None
+            kwargs["tex_to_color_map"] = tuple(key.value for key in keys)
+        elif keyword.arg in LITERAL_KWARGS:
+            try:
+                value = _hashable(ast.literal_eval(keyword.value))
+            except (ValueError, TypeError, SyntaxError):
+                return None
+            kwargs[keyword.arg] = value
+    return TexJob(
+        name,
+        tuple(arg.value for arg in call.args),
+        tuple(sorted(kwargs.items())),
+        template,
+    )
+
+
+def find_tex_jobs(code: str, scenes: list[str] | None = None) -> list[TexJob]:
+    """
+    Collect the literal Tex mobjects the given scenes create.
+
+    Args:
+        code: Manim script code
+        scenes: Scenes about to render (None for every scene)
+
+    Returns:
+        list of distinct TexJobs in the order they appear in the script
+    """
+    scene_names = extract_scene_class_names(code)
+    if isinstance(scene_names, Exception):
+        return []
+    tree = ast.parse(code)
+
+    jobs: dict[TexJob, None] = {}
+    for statement in scene_statements(tree, scene_names if scenes is None else scenes):
+        for node in ast.walk(statement):
+            if isinstance(node, ast.Call):
+                job = _tex_job(node)
+                if job is not None:
+                    jobs.setdefault(job)
+    return list(jobs)
+
+
+def _init_worker(cache_dir: str, stats_dir: str | None, media_root: str) -> None:
+    """Import manim once per pool process and compile into a private media directory."""
+    from manim import config
+
+    config.media_dir = tempfile.mkdtemp(prefix="worker_", dir=media_root)
+    asset_cache.install(cache_dir, stats_dir)
+
+
+def _build(job: TexJob) -> tuple[bool, int, float]:
+    """
+    Build one Tex mobject; returns (whether it built, LaTeX documents compiled,
+    seconds if any were).
+    """
+    import manim
+
+    misses_before = asset_cache.lookup_counts()["tex_misses"]
+    start = time.perf_counter()
+    built = False
+    try:
+        kwargs = dict(job.kwargs)
+        if "substrings_to_isolate" in kwargs:
+            kwargs["substrings_to_isolate"] = list(kwargs["substrings_to_isolate"])
+        if "tex_to_color_map" in kwargs:
+            # the colors do not matter, the keys decide how the strings are split
+            kwargs["tex_to_color_map"] = dict.fromkeys(kwargs["tex_to_color_map"], "#FFFFFF")
+        if job.template is not None:
+            kwargs["tex_template"] = getattr(manim.TexTemplateLibrary, job.template)
+        getattr(manim, job.mobject)(*job.args, **kwargs)
+        built = True
+    except Exception as e:
+        # the scene render reports LaTeX errors with the scene's context
+        logger.debug("Pre-compiling %s%r failed: %s", job.mobject, job.args, e)
+    elapsed = time.perf_counter() - start
+    compiled = asset_cache.lookup_counts()["tex_misses"] - misses_before
+    asset_cache.write_stats()
+    return built, compiled, elapsed if compiled else 0.0
+
+
+def precompile_tex(
+    jobs: list[TexJob],
+    cache: asset_cache.AssetCacheRun,
+    workers: int,
+    work_dir: str,
+) -> PrecompileReport:
+    """
+    Compile the LaTeX of Tex mobjects into the shared asset cache in parallel.
+
+    Args:
+        jobs: Tex mobjects to build (see `find_tex_jobs`)
+        cache: Asset cache run the compiled SVGs are published to
+        workers: Max processes compiling concurrently
+        work_dir: Directory in which scratch media directories are created and removed
+
+    Returns:
+        PrecompileReport: How much LaTeX was compiled ahead of the scene renders
+    """
+    start = time.perf_counter()
+    if not jobs:
+        return PrecompileReport(0, 0, 0.0, 0.0)
+
+    media_root = tempfile.mkdtemp(prefix="tex_precompile_", dir=work_dir)
+    compiled = 0
+    latex_seconds = 0.0
+    built: list[TexJob] = []
+    try:
+        with ProcessPoolExecutor(
+            max_workers=max(1, min(workers, len(jobs))),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(cache.cache_dir, cache.stats_dir, media_root),
+        ) as executor:
+            for job, (job_built, job_compiled, seconds) in zip(jobs, executor.map(_build, jobs)):
+                if job_built:
+                    built.append(job)
+                compiled += job_compiled
+                latex_seconds += seconds
+    except Exception as e:
+        # pre-compilation is an optimization: scene renders compile whatever is missing
+        logger.warning("Tex pre-compilation failed: %s", e)
+    finally:
+        shutil.rmtree(media_root, ignore_errors=True)
+
+    report = PrecompileReport(
+        len(jobs), compiled, latex_seconds, time.perf_counter() - start, built
+    )
+    logger.info(report.describe())
+    return report
+
+
+def precompile_scenes(
+    code: str,
+    scenes: list[str],
+    cache: asset_cache.AssetCache,
+    run: asset_cache.AssetCacheRun,
+    workers: int,
+    work_dir: str,
+) -> PrecompileReport | None:
+    """
+    Pre-compile the Tex strings of the scenes about to render, skipping those
+    this process already pre-compiled into the cache. Strings that failed to
+    build are tried again on the next pass.
+
+    Returns:
+        PrecompileReport | None: The pass, or None if there was nothing to compile
+    """
+    jobs = [job for job in find_tex_jobs(code, scenes) if job not in cache.precompiled]
+    if not jobs:
+        return None
+    report = precompile_tex(jobs, run, workers, work_dir)
+    cache.precompiled.update(report.built)
+    return report
@@ -0,0 +1,89 @@
+"""Time-compressed review renders.
+
+Review renders only need to surface errors and sample a few frames, so they can
+play every animation faster than the final video. `compress_code` appends a
+one-line shim to the review copy of a script; when the script is imported, the
+shim wraps `Scene.compile_animations`, through which every `play()` and `wait()`
+call passes, and multiplies each animation's `run_time` by the time scale.
+
+Animations interpolate on their progress (alpha) rather than on elapsed time, so
+every animation still reaches the same states, and frames sampled at the same
+relative positions of the shorter video show the same content. Updaters driven
+by `dt` (e.g. continuous rotations) advance less. Run times are never scaled
+below one frame. The shim is appended rather than prepended so that line
+numbers in tracebacks still match the code under review; final renders use the
+unmodified script (and strip the shim from a review copy, see `strip_compression`).
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+SHIM_COMMENT = "# review render: animations time-compressed"
+
+_time_scale = 1.0
+_installed = False
+
+
+def compress_code(code: str, time_scale: float) -> str:
+    """
+    Append the time compression shim to a script.
+
+    Args:
+        code: Manim script code
+        time_scale: Factor applied to every run_time and wait duration, in (0, 1)
+
+    Returns:
+        str: The script with the shim as its last line (unchanged when time_scale is 1)
+    """
+    if time_scale == 1:
+        return code
+    return (
+        f"{code.rstrip()}\n\n"
+        f"import manim_generator.utils.time_compression as _manim_generator_time_compression; "
+        f"_manim_generator_time_compression.install({time_scale!r})  {SHIM_COMMENT}\n"
+    )
+
+
+def strip_compression(code: str) -> str:
+    """Remove the time compression shim from a script, if present."""
+    lines = code.splitlines(keepends=True)
+    if not lines or SHIM_COMMENT not in lines[-1]:
+        return code
+    return "".join(lines[:-1]).rstrip() + "\n"
+
+
+def _scaled_run_time(run_time: float, frame_rate: float) -> float:
+    """Scale a run time without going below one frame (or below the original run time)."""
+    return max(run_time * _time_scale, min(run_time, 1 / frame_rate))
+
+
+def install(time_scale: float) -> None:
+    """
+    Scale the run time of every animation played by Manim scenes in this process.
+
+    Installing again only changes the time scale.
+
+    Args:
+        time_scale: Factor applied to every run_time and wait duration
+    """
+    global _time_scale, _installed
+    _time_scale = time_scale
+    if _installed:
+        return
+
+    from manim import Scene, config
+
+    original = getattr(Scene, "compile_animations", None)
+    if original is None:
+        logger.warning("Scene.compile_animations not found; review renders are not compressed")
+        return
+
+    def compile_animations(self, *args, **kwargs):
+        animations = original(self, *args, **kwargs)
+        for animation in animations:
+            animation.run_time = _scaled_run_time(animation.run_time, config.frame_rate)
+        return animations
+
+    Scene.compile_animations = compile_animations
+    _installed = True
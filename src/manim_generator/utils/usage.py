@@ -13,10 +13,19 @@ class TokenUsageTracker:
             "total_llm_time": 0.0,
             "total_reasoning_tokens": 0,
             "total_answer_tokens": 0,
+            "total_cached_prompt_tokens": 0,
+            "cached_steps": 0,
+            "total_rate_limit_wait": 0.0,
         }
 
     def add_step(self, step_name: str, model: str, usage_info: dict) -> None:
-        """Add a step's usage information to tracking."""
+        """Add a step's usage information to tracking.
+
+        Steps served from the LLM response cache keep the token counts of the
+        original request but add no tokens to the totals, and cost nothing.
+        Prompt tokens the provider read from its prompt cache are counted in
+        `cached_prompt_tokens` (they are part of `prompt_tokens`).
+        """
         step_info = {
             "step": step_name,
             "model": model,
@@ -24,12 +33,20 @@ class TokenUsageTracker:
         }
         step_info.setdefault("reasoning_tokens", 0)
         step_info.setdefault("answer_tokens", step_info.get("completion_tokens", 0))
+        step_info.setdefault("cached_prompt_tokens", 0)
+        step_info.setdefault("cached", False)
         self.token_usage_tracking["steps"].append(step_info)
+        self.token_usage_tracking["total_rate_limit_wait"] += usage_info.get("rate_limit_wait", 0.0)
+        if step_info["cached"]:
+            self.token_usage_tracking["cached_steps"] += 1
+            self.token_usage_tracking["total_llm_time"] += usage_info.get("llm_time", 0.0)
+            return
         self.token_usage_tracking["total_tokens"] += usage_info.get("total_tokens", 0)
         self.token_usage_tracking["total_cost"] += usage_info.get("cost", 0.0)
         self.token_usage_tracking["total_llm_time"] += usage_info.get("llm_time", 0.0)
         self.token_usage_tracking["total_reasoning_tokens"] += step_info.get("reasoning_tokens", 0)
         self.token_usage_tracking["total_answer_tokens"] += step_info.get("answer_tokens", 0)
+        self.token_usage_tracking["total_cached_prompt_tokens"] += step_info["cached_prompt_tokens"]
 
     def get_tracking_data(self) -> dict:
         """Get the complete tracking data."""
@@ -37,19 +54,12 @@ class TokenUsageTracker:
 
 
 def get_usage_totals(token_usage_tracking: dict) -> tuple[int, int, int, int]:
-    """Calculate total prompt, completion, reasoning, and answer tokens."""
-    total_prompt_tokens = sum(
-        step.get("prompt_tokens", 0) or 0 for step in token_usage_tracking["steps"]
-    )
-    total_completion_tokens = sum(
-        step.get("completion_tokens", 0) or 0 for step in token_usage_tracking["steps"]
-    )
-    total_reasoning_tokens = sum(
-        step.get("reasoning_tokens", 0) or 0 for step in token_usage_tracking["steps"]
-    )
-    total_answer_tokens = sum(
-        step.get("answer_tokens", 0) or 0 for step in token_usage_tracking["steps"]
-    )
+    """Calculate total prompt, completion, reasoning, and answer tokens of uncached steps."""
+    steps = [step for step in token_usage_tracking["steps"] if not step.get("cached")]
+    total_prompt_tokens = sum(step.get("prompt_tokens", 0) or 0 for step in steps)
+    total_completion_tokens = sum(step.get("completion_tokens", 0) or 0 for step in steps)
+    total_reasoning_tokens = sum(step.get("reasoning_tokens", 0) or 0 for step in steps)
+    total_answer_tokens = sum(step.get("answer_tokens", 0) or 0 for step in steps)
     return (
         total_prompt_tokens,
         total_completion_tokens,
@@ -64,6 +74,7 @@ def display_usage_summary(console: Console, token_usage_tracking: dict):
     table.add_column("Step", style="cyan")
     table.add_column("Model", style="green")
     table.add_column("Prompt Tokens", justify="right", style="blue")
+    table.add_column("Cached Prompt", justify="right", style="blue")
     table.add_column("Completion Tokens", justify="right", style="blue")
     table.add_column("Reasoning Tokens", justify="right", style="blue")
     table.add_column("Answer Tokens", justify="right", style="blue")
@@ -79,9 +90,10 @@ def display_usage_summary(console: Console, token_usage_tracking: dict):
 
     for step in token_usage_tracking["steps"]:
         table.add_row(
-            step["step"],
+            f"{step['step']} [dim](cached)" if step.get("cached") else step["step"],
             step["model"],
             str(step.get("prompt_tokens", 0)),
+            str(step.get("cached_prompt_tokens", 0)),
             str(step.get("completion_tokens", 0)),
             str(step.get("reasoning_tokens", 0)),
             str(step.get("answer_tokens", 0)),
@@ -94,6 +106,7 @@ def display_usage_summary(console: Console, token_usage_tracking: dict):
         "[bold]TOTAL",
         "",
         f"[bold]{total_prompt_tokens}",
+        f"[bold]{token_usage_tracking['total_cached_prompt_tokens']}",
         f"[bold]{total_completion_tokens}",
         f"[bold]{total_reasoning_tokens}",
         f"[bold]{total_answer_tokens}",
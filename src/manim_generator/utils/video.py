@@ -1,141 +1,153 @@
 """Utility functions for video generation and manipulation with Manim."""
 
-import json
 import logging
+import math
 import os
+import shutil
 import subprocess
-
-from manim_generator.utils.rendering import extract_scene_class_names
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from manim_generator.utils import render_worker
+from manim_generator.utils.asset_cache import (
+    AssetCache,
+    AssetCacheRun,
+    describe_stats,
+    manim_command,
+)
+from manim_generator.utils.media_info import probe_video
+from manim_generator.utils.profiles import RENDER_PROFILES, RenderProfile, get_render_profile
+from manim_generator.utils.rendering import (
+    SceneRenderResult,
+    _run_scene_command,
+    extract_scene_class_names,
+)
+from manim_generator.utils.sandbox import ResourceLimits
+from manim_generator.utils.sharding import count_scene_animations, plan_shards, shard_args
+from manim_generator.utils.tex_precompile import precompile_scenes
+from manim_generator.utils.time_compression import strip_compression
 
 logger = logging.getLogger(__name__)
 
-
-def render_and_concat(script_file: str, output_media_dir: str, final_output: str) -> str | None:
+# trailing characters of a failed scene's error output included in the failure report
+FAILURE_LOG_CHARS = 2000
+
+
+def render_and_concat(
+    script_file: str,
+    output_media_dir: str,
+    final_output: str,
+    render_backend: str = "subprocess",
+    resource_limits: ResourceLimits | None = None,
+    render_workers: int | None = None,
+    shard_scenes: bool = False,
+    render_profile: str = "final",
+    clips: dict[str, str] | None = None,
+    autoplay: bool = True,
+    asset_cache: AssetCache | None = None,
+    tex_precompile: bool = True,
+) -> str | None:
     """
-    Runs a Manim script as a subprocess, then concatenates the rendered scene videos
-    (in the order they appear in the script) into one final video using ffmpeg.
+    Renders every scene of a Manim script at the given quality profile as its own parallel job, then
+    concatenates the rendered scene videos (in the order they appear in the script)
+    into one final video using ffmpeg. The concat only runs once every scene rendered;
+    scenes that failed are reported with their exit code and error output.
+
+    With shard_scenes, scenes holding more than their share of the script's animations
+    are split into animation ranges rendered as separate jobs and stitched back
+    together without re-encoding (see `utils/sharding.py`).
 
     Parameters:
       script_file (str): Path to the Manim Python script (e.g. "video.py")
       output_media_dir (str): The media directory specified to Manim (e.g. "output")
       final_output (str): The filename for the concatenated final video (e.g. "final_video.mp4")
+      render_backend (str): "subprocess" to run the `manim` CLI per scene, or "warm" to
+        render on pre-imported render workers (see `utils/render_worker.py`)
+      resource_limits (ResourceLimits | None): Render each scene under these limits
+        (see `utils/sandbox.py`)
+      render_workers (int | None): Max render jobs run concurrently (None uses the CPU count)
+      shard_scenes (bool): Split long scenes into parallel animation ranges
+      render_profile (str): Render quality profile, e.g. "final" (1080p60) or "4k"
+        (see `utils/profiles.py`)
+      clips (dict[str, str] | None): Already rendered clips by scene name, e.g. promoted
+        review clips (see `utils/review_clips.py`); when every scene has one they are
+        concatenated without rendering
+      autoplay (bool): Open the final video in a media player once it is created
+      asset_cache (AssetCache | None): Shared Tex/Text SVG cache used by every render job
+        (see `utils/asset_cache.py`)
+      tex_precompile (bool): Compile the script's literal Tex strings into the asset cache
+        in parallel before rendering (see `utils/tex_precompile.py`)
 
     Returns:
       str | None: Absolute path to the final concatenated video file, or None if rendering failed
     """
 
-    # run Manim as a subprocess with real-time output
-    manim_command = [
-        "manim",
-        "-qh",
-        script_file,
-        "--write_all",
-        "--media_dir",
-        output_media_dir,
-    ]
-    process = subprocess.Popen(
-        manim_command,
-        text=True,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        env=os.environ.copy(),
-        bufsize=1,
-        universal_newlines=True,
-    )
-
-    # print output in real-time
-    while True:
-        output = process.stdout.readline()
-        if output == "" and process.poll() is not None:
-            break
-        if output:
-            print(output.strip())
-            logger.info(output.strip())
-
-    if process.returncode != 0:
-        logger.error("Error during Manim rendering")
-        return
-    else:
-        logger.info("Manim rendering completed successfully.")
-
     # extract scene names
     with open(script_file, encoding="utf-8") as f:
         content = f.read()
+    # a review copy of the script may carry the time compression shim; final renders never do
+    if strip_compression(content) != content:
+        content = strip_compression(content)
+        with open(script_file, "w", encoding="utf-8") as f:
+            f.write(content)
+        logger.info("Removed the review time compression from %s", script_file)
     scene_names = extract_scene_class_names(content)
+    if isinstance(scene_names, Exception) or not scene_names:
+        logger.error("No scenes to render in %s: %s", script_file, scene_names or "none found")
+        return None
 
     logger.info("Found scene names in order: %s", scene_names)
 
-    # Build the path to the rendered videos.
-    script_basename = os.path.splitext(os.path.basename(script_file))[0]
-
-    # The quality folder is "1080p60" since the -pqh argument
-    quality_folder = "1080p60"
-    videos_dir = os.path.join(output_media_dir, "videos", script_basename, quality_folder)
-    if not os.path.exists(videos_dir):
-        logger.error("Rendered videos folder not found: %s", videos_dir)
-        return
-
-    # create a temporary file for ffmpeg's concat list in the output directory
-    concat_list_path = os.path.join(output_media_dir, "ffmpeg_concat_list.txt")
-    with open(concat_list_path, "w", encoding="utf-8") as file_list:
-        for scene in scene_names:
-            video_path = os.path.join(videos_dir, f"{scene}.mp4")
-            if not os.path.exists(video_path):
-                logger.warning(
-                    "Expected video file for scene '%s' not found at %s",
-                    scene,
-                    video_path,
-                )
-            abs_path = os.path.abspath(video_path)
-            file_list.write(f"file '{abs_path}'\n")
+    profile = get_render_profile(render_profile)
+    if clips is not None and all(scene in clips for scene in scene_names):
+        message = (
+            f"Promoting {len(scene_names)} review clip(s) to the final video without rendering"
+        )
+        print(message)
+        logger.info(message)
+        scene_videos = [clips[scene] for scene in scene_names]
+    else:
+        scene_videos = _render_scene_videos(
+            script_file,
+            scene_names,
+            output_media_dir,
+            profile,
+            render_backend,
+            resource_limits,
+            max(1, render_workers or os.cpu_count() or 1),
+            shard_scenes,
+            asset_cache,
+            tex_precompile,
+        )
+        if scene_videos is None:
+            return None
 
     final_output_path = os.path.join(output_media_dir, final_output)
     final_output_path = os.path.abspath(final_output_path)
 
-    # use ffmpeg to concat individual scenes
-    ffmpeg_command = [
-        "ffmpeg",
-        "-f",
-        "concat",
-        "-safe",
-        "0",
-        "-i",
-        concat_list_path,
-        "-c",
-        "copy",
+    # use ffmpeg to concat individual scenes, with its concat list in the output directory
+    if not _concat_videos(
+        scene_videos,
         final_output_path,
-    ]
-    logger.info("Concatenating videos with ffmpeg: %s", " ".join(ffmpeg_command))
-
-    ffmpeg_proc = subprocess.Popen(
-        ffmpeg_command,
-        text=True,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        bufsize=1,
-        universal_newlines=True,
-    )
-
-    # print ffmpeg output in real-time
-    while True:
-        output = ffmpeg_proc.stdout.readline()
-        if output == "" and ffmpeg_proc.poll() is not None:
-            break
-        if output:
-            print(output.strip())
-            logger.info(output.strip())
-
-    if ffmpeg_proc.returncode != 0:
+        os.path.join(output_media_dir, "ffmpeg_concat_list.txt"),
+    ):
         logger.error("Error during ffmpeg concatenation")
         return None
     else:
         logger.info("Final concatenated video created at: %s", final_output_path)
-    os.remove(concat_list_path)
 
-    # autoplay final video
+    if autoplay:
+        play_video(final_output_path)
+
+    return final_output_path
+
+
+def play_video(video_path: str) -> None:
+    """Open a video in the default media player of the system."""
+    final_output_path = os.path.abspath(video_path)
     play_command = []
     if os.name == "nt":  # Windows
-        final_output_path = os.path.abspath(final_output_path)
         try:
             subprocess.run(["cmd", "/c", "start", "", final_output_path], shell=True)
             logger.info("Playing video with default media player")
@@ -171,12 +183,249 @@ def render_and_concat(script_file: str, output_media_dir: str, final_output: str
     else:
         logger.error("Could not determine appropriate video player command for this system")
 
-    return final_output_path
+
+def _render_scene_videos(
+    script_file: str,
+    scene_names: list[str],
+    output_media_dir: str,
+    profile: RenderProfile,
+    render_backend: str,
+    resource_limits: ResourceLimits | None,
+    workers: int,
+    shard_scenes: bool,
+    asset_cache: AssetCache | None = None,
+    tex_precompile: bool = True,
+) -> list[str] | None:
+    """Render every scene (sharding long ones if asked) and return their videos in order, or None on failure."""
+    # Manim names the folder of the rendered videos after the profile
+    videos_dir = profile.videos_dir(output_media_dir, script_file)
+    asset_run = asset_cache.start_run() if asset_cache is not None else None
+    if asset_run is not None and tex_precompile:
+        with open(script_file, encoding="utf-8") as f:
+            code = f.read()
+        report = precompile_scenes(
+            code, scene_names, asset_cache, asset_run, workers, output_media_dir
+        )
+        if report is not None:
+            print(report.describe())
+    shards: dict[str, list[tuple[int, int | None]]] = {}
+    if shard_scenes and workers > 1:
+        animation_counts = count_scene_animations(
+            script_file, scene_names, output_media_dir, asset_cache=asset_run
+        )
+        shards = plan_shards(animation_counts, workers)
+        for scene, ranges in shards.items():
+            logger.info(
+                "Splitting scene %s (%d animations) into %d shards",
+                scene,
+                animation_counts[scene],
+                len(ranges),
+            )
+
+    shard_root = os.path.join(output_media_dir, "shards")
+    jobs: list[_FinalRenderJob] = []
+    for scene in scene_names:
+        if scene not in shards:
+            jobs.append(_FinalRenderJob(scene, scene, output_media_dir))
+            continue
+        for index, (first, last) in enumerate(shards[scene]):
+            jobs.append(
+                _FinalRenderJob(
+                    scene,
+                    f"{scene} [animations {first}-{'end' if last is None else last}]",
+                    os.path.join(shard_root, f"{scene}_{index}"),
+                    shard_args(first, last),
+                )
+            )
+
+    results = _render_final_jobs(
+        script_file, jobs, render_backend, resource_limits, workers, profile, asset_run
+    )
+    if asset_run is not None:
+        asset_stats = asset_cache.finish_run(asset_run)
+        if any(asset_stats.values()):
+            print(describe_stats(asset_stats))
+            logger.info(describe_stats(asset_stats))
+
+    failed_scenes = []
+    for scene in scene_names:
+        scene_jobs = [(job, result) for job, result in zip(jobs, results) if job.scene == scene]
+        failed = [
+            (job, result)
+            for job, result in scene_jobs
+            if result.returncode != 0 or result.timed_out
+        ]
+        if failed:
+            failed_scenes.append(scene)
+            for job, result in failed:
+                logger.error(
+                    "Rendering scene %s failed with exit code %s:\n%s",
+                    job.label,
+                    result.returncode,
+                    result.stderr.strip()[-FAILURE_LOG_CHARS:],
+                )
+            continue
+
+        video_path = os.path.join(videos_dir, f"{scene}.mp4")
+        if scene in shards:
+            shard_videos = [
+                os.path.join(profile.videos_dir(job.media_dir, script_file), f"{scene}.mp4")
+                for job, _ in scene_jobs
+            ]
+            os.makedirs(videos_dir, exist_ok=True)
+            if not _concat_videos(
+                shard_videos, video_path, os.path.join(shard_root, f"{scene}_concat_list.txt")
+            ):
+                failed_scenes.append(scene)
+                logger.error("Stitching the shards of scene %s failed", scene)
+                continue
+
+        if not os.path.exists(video_path):
+            failed_scenes.append(scene)
+            logger.error("Scene %s rendered but its video was not found at %s", scene, video_path)
+
+    shutil.rmtree(shard_root, ignore_errors=True)
+
+    if failed_scenes:
+        message = (
+            f"Final render failed for {len(failed_scenes)} of {len(scene_names)} scene(s): "
+            f"{', '.join(failed_scenes)}"
+        )
+        print(message)
+        logger.error(message)
+        return None
+    logger.info("Manim rendering completed successfully.")
+    return [os.path.join(videos_dir, f"{scene}.mp4") for scene in scene_names]
+
+
+@dataclass
+class _FinalRenderJob:
+    """A scene, or one animation range of a scene, rendered by the final render."""
+
+    scene: str
+    label: str
+    media_dir: str
+    extra_args: list[str] = field(default_factory=list)
+
+
+def _render_final_jobs(
+    script_file: str,
+    jobs: list[_FinalRenderJob],
+    render_backend: str,
+    resource_limits: ResourceLimits | None,
+    workers: int,
+    profile: RenderProfile = RENDER_PROFILES["final"],
+    asset_cache: AssetCacheRun | None = None,
+) -> list[SceneRenderResult]:
+    """Render each job at the profile's quality, at most `workers` at a time, returning results in job order."""
+    workers = max(1, min(workers, len(jobs)))
+
+    if render_backend == "warm" and render_worker.is_supported():
+        pool = render_worker.get_render_worker_pool(workers)
+
+        def render_job(job: _FinalRenderJob) -> SceneRenderResult:
+            return pool.render(
+                render_worker.RenderJob(
+                    script_file=script_file,
+                    scene=job.scene,
+                    quality=profile.quality_flag,
+                    media_dir=job.media_dir,
+                    extra_args=[*profile.override_args(), *job.extra_args],
+                    limits=resource_limits,
+                    asset_cache=asset_cache,
+                )
+            )
+    else:
+
+        def render_job(job: _FinalRenderJob) -> SceneRenderResult:
+            command = [
+                *manim_command(asset_cache),
+                *profile.manim_args(),
+                "--media_dir",
+                job.media_dir,
+                *job.extra_args,
+                script_file,
+                job.scene,
+            ]
+            return _run_scene_command(job.scene, command, None, resource_limits=resource_limits)
+
+    def render_and_report(job: _FinalRenderJob) -> SceneRenderResult:
+        result = render_job(job)
+        for line in (result.stdout + result.stderr).splitlines():
+            logger.info("[%s] %s", job.label, line.strip())
+        if result.usage:
+            logger.info("Scene %s resource usage: %s", job.label, result.usage)
+        status = "rendered" if result.returncode == 0 else "FAILED"
+        print(f"Scene {job.label} {status} in {result.elapsed:.1f}s")
+        return result
+
+    logger.info("Rendering %d job(s) with %d worker(s)", len(jobs), workers)
+    # executor.map keeps results in job order regardless of completion order
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(render_and_report, jobs))
+
+
+def _concat_videos(video_paths: list[str], output_path: str, concat_list_path: str) -> bool:
+    """Concatenate videos in order with ffmpeg's concat demuxer, without re-encoding."""
+    # stream copy needs identical video streams; check the ones whose headers can be read
+    infos = [probe_video(video_path, use_ffprobe=False) for video_path in video_paths]
+    stream_formats = {info.stream_format for info in infos if info and info.width}
+    if len(stream_formats) > 1:
+        logger.error(
+            "Cannot concatenate videos with different streams (width, height, fps): %s",
+            ", ".join(str(stream_format) for stream_format in stream_formats),
+        )
+        return False
+
+    with open(concat_list_path, "w", encoding="utf-8") as file_list:
+        for video_path in video_paths:
+            file_list.write(f"file '{os.path.abspath(video_path)}'\n")
+
+    ffmpeg_command = [
+        "ffmpeg",
+        "-y",
+        "-f",
+        "concat",
+        "-safe",
+        "0",
+        "-i",
+        concat_list_path,
+        "-c",
+        "copy",
+        output_path,
+    ]
+    logger.info("Concatenating videos with ffmpeg: %s", " ".join(ffmpeg_command))
+
+    ffmpeg_proc = subprocess.Popen(
+        ffmpeg_command,
+        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        universal_newlines=True,
+    )
+
+    # print ffmpeg output in real-time
+    while True:
+        output = ffmpeg_proc.stdout.readline()
+        if output == "" and ffmpeg_proc.poll() is not None:
+            break
+        if output:
+            print(output.strip())
+            logger.info(output.strip())
+
+    if ffmpeg_proc.returncode != 0:
+        return False
+    os.remove(concat_list_path)
+    return True
 
 
 def get_video_duration(video_path: str) -> float | None:
     """
-    Get the duration of a video file in seconds using ffprobe.
+    Get the duration of a video file in seconds.
+
+    MP4 headers are read in process and other files are probed with ffprobe; results
+    are memoized per file version (see `utils/media_info.py`).
 
     Args:
         video_path: Path to the video file
@@ -184,167 +433,187 @@ def get_video_duration(video_path: str) -> float | None:
     Returns:
         float: Duration in seconds, or None if error
     """
-    try:
-        command = [
-            "ffprobe",
-            "-v",
-            "error",
-            "-show_entries",
-            "format=duration",
-            "-of",
-            "json",
-            video_path,
-        ]
-        result = subprocess.run(
-            command, capture_output=True, text=True, check=True, timeout=30
-        )
-        data = json.loads(result.stdout)
-        duration = float(data["format"]["duration"])
-        return duration
-    except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError, ValueError, subprocess.TimeoutExpired) as e:
-        logger.error(f"Error getting video duration: {e}")
+    info = probe_video(video_path)
+    if info is None:
+        logger.error(f"Error getting video duration of {video_path}")
         return None
+    return info.duration
 
 
-def extend_video_to_duration(
-    input_path: str, output_path: str, target_duration: float
-) -> bool:
+@dataclass
+class DurationPlan:
     """
-    Extend a video to a target duration by looping it using ffmpeg.
+    How a video is brought within duration bounds, executed as a single ffmpeg command.
 
-    Args:
-        input_path: Path to input video file
-        output_path: Path to output video file
-        target_duration: Target duration in seconds
+    Attributes:
+        action: "keep" (already within bounds), "extend" or "trim".
+        target_duration: Duration of the output video in seconds.
+        source_duration: Duration of the input video in seconds (only needed to extend).
+    """
 
-    Returns:
-        bool: True if successful, False otherwise
+    action: str
+    target_duration: float
+    source_duration: float | None = None
+
+    @property
+    def loops(self) -> int:
+        """Extra passes over the input needed to reach the target duration by looping."""
+        if self.action != "extend" or not self.source_duration:
+            return 0
+        return max(0, math.ceil(self.target_duration / self.source_duration) - 1)
+
+
+def plan_duration_adjustment(
+    current_duration: float, min_duration: float | None = None, max_duration: float | None = None
+) -> DurationPlan:
     """
-    try:
-        # Get current duration
-        current_duration = get_video_duration(input_path)
-        if current_duration is None:
-            logger.error("Could not determine input video duration")
-            return False
+    Decide how to bring a video of current_duration within [min_duration, max_duration].
 
-        if current_duration >= target_duration:
-            # Video is already long enough, just copy it
-            import shutil
-            shutil.copy2(input_path, output_path)
-            logger.info(f"Video already {current_duration:.2f}s, copying as-is")
-            return True
-
-        # Calculate how many times we need to loop
-        loops_needed = int(target_duration / current_duration) + 1
-        logger.info(
-            f"Extending video from {current_duration:.2f}s to {target_duration:.2f}s "
-            f"(looping {loops_needed} times)"
-        )
+    A video shorter than min_duration is extended to it (capped at max_duration), a
+    video longer than max_duration is trimmed to it; anything else is kept.
+    """
+    if min_duration and current_duration < min_duration:
+        target = min(min_duration, max_duration) if max_duration else min_duration
+        if current_duration < target:
+            return DurationPlan("extend", target, current_duration)
+    if max_duration and current_duration > max_duration:
+        return DurationPlan("trim", max_duration, current_duration)
+    return DurationPlan("keep", current_duration, current_duration)
+
+
+def build_duration_command(
+    input_path: str, output_path: str, plan: DurationPlan, extend_mode: str = "loop"
+) -> list[str]:
+    """
+    Build the single ffmpeg command executing a duration plan.
 
-        # Create a temporary concat file
-        concat_file = output_path + ".concat.txt"
-        with open(concat_file, "w", encoding="utf-8") as f:
-            abs_input = os.path.abspath(input_path)
-            for _ in range(loops_needed):
-                f.write(f"file '{abs_input}'\n")
-
-        # Use ffmpeg to concatenate (loop) the video
-        command = [
-            "ffmpeg",
-            "-f",
-            "concat",
-            "-safe",
-            "0",
+    Extending either loops the input (`-stream_loop`, stream copy) or freezes its last
+    frame (`tpad`, which re-encodes the video stream); `-t` cuts the output at the
+    target duration in the same pass. Trimming is a stream copy cut with `-t`.
+    """
+    command = ["ffmpeg", "-y", "-v", "error"]
+    target = f"{plan.target_duration:.3f}"
+    if plan.action == "extend" and extend_mode == "freeze":
+        pad = plan.target_duration - (plan.source_duration or 0.0)
+        command += [
             "-i",
-            concat_file,
-            "-c",
+            input_path,
+            "-vf",
+            f"tpad=stop_mode=clone:stop_duration={pad:.3f}",
+            "-t",
+            target,
+            "-c:v",
+            "libx264",
+            "-pix_fmt",
+            "yuv420p",
+            "-c:a",
             "copy",
-            output_path,
         ]
+    elif plan.action == "extend":
+        command += ["-stream_loop", str(plan.loops), "-i", input_path, "-t", target, "-c", "copy"]
+    else:
+        command += ["-i", input_path, "-t", target, "-c", "copy"]
+    return [*command, output_path]
 
-        result = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            timeout=300,  # 5 minute timeout
-        )
 
-        # Clean up concat file
-        try:
-            os.remove(concat_file)
-        except Exception:
-            pass
+def _write_adjusted_video(
+    input_path: str, output_path: str, plan: DurationPlan, extend_mode: str = "loop"
+) -> bool:
+    """
+    Run a duration plan, writing to a temporary file that atomically replaces output_path.
 
+    The output path never holds a partial file, and input_path may equal output_path.
+    """
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    fd, temp_path = tempfile.mkstemp(
+        prefix=".adjust_", suffix=os.path.splitext(output_path)[1], dir=output_dir
+    )
+    os.close(fd)
+    try:
+        command = build_duration_command(input_path, temp_path, plan, extend_mode)
+        result = subprocess.run(command, capture_output=True, text=True, timeout=300)
         if result.returncode != 0:
-            logger.error(f"Error extending video: {result.stderr}")
+            logger.error(f"Error adjusting video duration: {result.stderr}")
             return False
-
-        # Trim to exact target duration if needed
-        final_duration = get_video_duration(output_path)
-        if final_duration and final_duration > target_duration:
-            return trim_video_to_duration(output_path, output_path, target_duration)
-
+        os.replace(temp_path, output_path)
         return True
-    except Exception as e:
-        logger.exception(f"Error extending video: {e}")
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.error(f"Error adjusting video duration: {e}")
         return False
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
 
 
-def trim_video_to_duration(
-    input_path: str, output_path: str, target_duration: float
+def extend_video_to_duration(
+    input_path: str, output_path: str, target_duration: float, extend_mode: str = "loop"
 ) -> bool:
     """
-    Trim a video to a target duration using ffmpeg.
+    Extend a video to a target duration using ffmpeg.
 
     Args:
         input_path: Path to input video file
         output_path: Path to output video file
         target_duration: Target duration in seconds
+        extend_mode: "loop" to repeat the video, "freeze" to hold its last frame
 
     Returns:
         bool: True if successful, False otherwise
     """
-    try:
-        command = [
-            "ffmpeg",
-            "-i",
-            input_path,
-            "-t",
-            str(target_duration),
-            "-c",
-            "copy",
-            "-y",  # Overwrite output file
-            output_path,
-        ]
+    current_duration = get_video_duration(input_path)
+    if current_duration is None:
+        logger.error("Could not determine input video duration")
+        return False
 
-        result = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            timeout=300,  # 5 minute timeout
-        )
+    if current_duration >= target_duration:
+        # Video is already long enough, just copy it
+        shutil.copy2(input_path, output_path)
+        logger.info(f"Video already {current_duration:.2f}s, copying as-is")
+        return True
 
-        if result.returncode != 0:
-            logger.error(f"Error trimming video: {result.stderr}")
-            return False
+    plan = DurationPlan("extend", target_duration, current_duration)
+    logger.info(
+        f"Extending video from {current_duration:.2f}s to {target_duration:.2f}s ({extend_mode})"
+    )
+    return _write_adjusted_video(input_path, output_path, plan, extend_mode)
 
-        logger.info(f"Trimmed video to {target_duration:.2f}s")
-        return True
-    except Exception as e:
-        logger.exception(f"Error trimming video: {e}")
+
+def trim_video_to_duration(input_path: str, output_path: str, target_duration: float) -> bool:
+    """
+    Trim a video to a target duration using ffmpeg.
+
+    Args:
+        input_path: Path to input video file
+        output_path: Path to output video file (may be the input path)
+        target_duration: Target duration in seconds
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    if not _write_adjusted_video(input_path, output_path, DurationPlan("trim", target_duration)):
         return False
+    logger.info(f"Trimmed video to {target_duration:.2f}s")
+    return True
 
 
 def adjust_video_duration(
-    video_path: str, min_duration: float | None = None, max_duration: float | None = None
+    video_path: str,
+    min_duration: float | None = None,
+    max_duration: float | None = None,
+    extend_mode: str = "loop",
 ) -> str | None:
     """
     Adjust video duration to be within min_duration and max_duration.
 
+    The video is probed once and adjusted with a single ffmpeg command (see
+    `plan_duration_adjustment` and `build_duration_command`). The adjusted video is
+    written next to the input as `<name>_adjusted<ext>`; the input is left untouched.
+
     Args:
         video_path: Path to the video file
         min_duration: Minimum duration in seconds (extend if shorter)
         max_duration: Maximum duration in seconds (trim if longer)
+        extend_mode: "loop" to repeat a short video, "freeze" to hold its last frame
 
     Returns:
         str: Path to adjusted video (may be same as input if no adjustment needed), or None if error
@@ -357,68 +626,16 @@ def adjust_video_duration(
         logger.error("Could not determine video duration")
         return None
 
-    # Determine target duration (respect max if both are set)
-    target_duration = min_duration
-    if max_duration and min_duration:
-        # If both are set, use min but don't exceed max
-        target_duration = min(min_duration, max_duration)
-    elif max_duration and not min_duration:
-        # Only max is set, use current duration if it's already within limit
-        if current_duration <= max_duration:
-            return video_path
-        target_duration = max_duration
-
-    needs_adjustment = False
-    if min_duration and current_duration < min_duration:
-        needs_adjustment = True
-        logger.info(
-            f"Video duration {current_duration:.2f}s is shorter than minimum {min_duration:.2f}s"
-        )
-    if max_duration and current_duration > max_duration:
-        needs_adjustment = True
-        logger.info(
-            f"Video duration {current_duration:.2f}s is longer than maximum {max_duration:.2f}s"
-        )
-
-    if not needs_adjustment:
+    plan = plan_duration_adjustment(current_duration, min_duration, max_duration)
+    if plan.action == "keep":
         return video_path
 
-    # Create temporary output path
+    logger.info(
+        f"Video duration {current_duration:.2f}s is outside [{min_duration}, {max_duration}]s, "
+        f"{plan.action}ing to {plan.target_duration:.2f}s"
+    )
     base, ext = os.path.splitext(video_path)
-    temp_output = f"{base}_adjusted{ext}"
-
-    # Extend if too short (but don't exceed max_duration if set)
-    if min_duration and current_duration < min_duration:
-        extend_to = min_duration
-        if max_duration:
-            extend_to = min(min_duration, max_duration)
-        
-        if not extend_video_to_duration(video_path, temp_output, extend_to):
-            return None
-        
-        # Update paths for potential trimming
-        if os.path.exists(temp_output):
-            if video_path != temp_output:
-                try:
-                    os.remove(video_path)
-                except Exception:
-                    pass
-            video_path = temp_output
-            current_duration = get_video_duration(video_path)
-            if current_duration is None:
-                return None
-
-    # Trim if too long (after extension, might need trimming)
-    if max_duration and current_duration and current_duration > max_duration:
-        final_output = f"{base}_final{ext}"
-        if not trim_video_to_duration(video_path, final_output, max_duration):
-            return None
-        # Clean up intermediate file if it exists
-        if video_path != final_output and os.path.exists(video_path):
-            try:
-                os.remove(video_path)
-            except Exception:
-                pass
-        return final_output
-
-    return video_path
+    adjusted_path = f"{base}_adjusted{ext}"
+    if not _write_adjusted_video(video_path, adjusted_path, plan, extend_mode):
+        return None
+    return adjusted_path
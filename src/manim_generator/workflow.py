@@ -1,3 +1,4 @@
+import asyncio
 import os
 
 from rich.console import Console
@@ -9,23 +10,34 @@ from manim_generator.artifacts import ArtifactManager
 from manim_generator.console import (
     HeadlessProgressManager,
     get_response_with_status,
+    get_response_with_status_async,
     print_code_with_syntax,
 )
+from manim_generator.utils.asset_cache import COUNTERS, AssetCache
 from manim_generator.utils.file import save_code_to_file
 from manim_generator.utils.llm import check_and_register_models
+from manim_generator.utils.llm_cache import LLMResponseCache
 from manim_generator.utils.parsing import parse_code_block
 from manim_generator.utils.prompt import (
+    cached_prefix_message,
     convert_frames_to_message_format,
     format_previous_reviews,
     format_prompt,
 )
+from manim_generator.utils.render_cache import SceneRenderCache
 from manim_generator.utils.rendering import (
+    SceneOutcome,
     calculate_scene_success_rate,
     extract_scene_class_names,
     run_manim_multiscene,
 )
+from manim_generator.utils.review_clips import clip_set_key, find_clips
+from manim_generator.utils.sandbox import ResourceLimits
+from manim_generator.utils.sandbox import is_supported as sandbox_supported
+from manim_generator.utils.scene_analysis import changed_scenes
+from manim_generator.utils.speculative import SpeculativeRender
 from manim_generator.utils.usage import TokenUsageTracker
-from manim_generator.utils.video import render_and_concat
+from manim_generator.utils.video import play_video, render_and_concat
 
 
 class ManimWorkflow:
@@ -43,6 +55,54 @@ class ManimWorkflow:
         self.initial_success = False
         self.headless = config.get("headless", False)
         self.headless_manager = None
+        # code and per-scene outcomes of the last execution in each execution mode,
+        # used to skip scenes that did not change
+        self.last_executions: dict[str, tuple[str, dict[str, SceneOutcome]]] = {}
+        self.response_cache = None
+        if config.get("llm_cache_path"):
+            ttl_hours = config.get("llm_cache_ttl_hours")
+            self.response_cache = LLMResponseCache(
+                config["llm_cache_path"],
+                config.get("llm_cache_max_mb", 256) * 1024 * 1024,
+                ttl_hours * 3600 if ttl_hours else None,
+            )
+        self.render_cache = None
+        if config.get("render_cache_dir"):
+            self.render_cache = SceneRenderCache(
+                config["render_cache_dir"],
+                config.get("render_cache_max_mb", 2048) * 1024 * 1024,
+            )
+        self.asset_cache = None
+        if config.get("asset_cache_dir"):
+            self.asset_cache = AssetCache(
+                config["asset_cache_dir"],
+                config.get("asset_cache_max_mb", 512) * 1024 * 1024,
+            )
+        self.resource_limits = None
+        if config.get("sandbox"):
+            if sandbox_supported():
+                self.resource_limits = ResourceLimits(
+                    config.get("max_memory_mb"),
+                    config.get("max_cpu_seconds"),
+                    config.get("max_open_files"),
+                )
+            elif not self.headless:
+                console.print(
+                    "[yellow]Render sandbox is not supported on this platform; rendering without limits"
+                )
+
+        # final render of the latest fully successful code, started during the reviews
+        self.speculative_render = None
+        if config.get("speculative_render"):
+            self.speculative_render = SpeculativeRender(
+                config["output_dir"],
+                config.get("final_profile", "final"),
+                self.resource_limits,
+                config.get("render_workers"),
+                config.get("shard_scenes", False),
+                config.get("asset_cache_dir"),
+                config.get("asset_cache_max_mb", 512),
+            )
 
         if self.headless:
             self.headless_manager = HeadlessProgressManager(console, config["review_cycles"])
@@ -60,30 +120,55 @@ class ManimWorkflow:
         Returns:
             tuple: (generated_code, conversation_history)
         """
+        request = self._initial_code_request(video_data)
+        response = get_response_with_status(**request)
+        return self._finish_initial_code(video_data, request["messages"], *response)
+
+    def _llm_request(self, model: str, messages: list, status: str) -> dict:
+        """Keyword arguments of `get_response_with_status` for a request to a model."""
+        temperature = None if self.config.get("no_temperature") else self.config["temperature"]
+        return {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "streaming": self.config["streaming"],
+            "status": status,
+            "console": self.console,
+            "reasoning": self.config["reasoning"],
+            "provider": self.config["provider"],
+            "headless": self.headless,
+            "response_cache": self.response_cache,
+        }
+
+    def _initial_code_request(self, video_data: str) -> dict:
+        """Announce the initial code generation and build its LLM request."""
         if self.headless and self.headless_manager:
             self.headless_manager.update("Initial Code Generation")
         else:
             self.console.rule("[bold green]Initial Manim Code Generation", style="green")
 
+        # the same system message opens every code revision, which then reads it from the cache
         main_messages = [
-            {
-                "role": "system",
-                "content": format_prompt("init_prompt", {"video_data": video_data}),
-            }
+            cached_prefix_message(
+                "system", format_prompt("init_prompt", {"video_data": video_data})
+            )
         ]
 
-        response, usage_info, reasoning_content = get_response_with_status(
+        return self._llm_request(
             self.config["manim_model"],
             main_messages,
-            None if self.config.get("no_temperature") else self.config["temperature"],
-            self.config["streaming"],
             f"[bold green]Generating initial code \\[{self.config['manim_model']}\\]",
-            self.console,
-            reasoning=self.config["reasoning"],
-            provider=self.config["provider"],
-            headless=self.headless,
         )
 
+    def _finish_initial_code(
+        self,
+        video_data: str,
+        main_messages: list,
+        response: str,
+        usage_info: dict,
+        reasoning_content: str | None,
+    ) -> tuple[str, list]:
+        """Record, display and save the response to the initial code request."""
         self.usage_tracker.add_step(
             "Initial Code Generation", self.config["manim_model"], usage_info
         )
@@ -113,12 +198,22 @@ class ManimWorkflow:
 
         return code, main_messages
 
-    def execute_code(self, code: str, step_name: str = "Execution") -> tuple[bool, list, str, list]:
+    def execute_code(
+        self, code: str, step_name: str = "Execution", previous_code: str | None = None
+    ) -> tuple[bool, list, str, list]:
         """Execute Manim code and return results.
 
         Args:
             code: The Manim code to execute
             step_name: Name of the execution step for logging
+            previous_code: Code of the previous revision; when given, scenes whose
+                dependencies did not change since they last ran are not re-rendered and
+                their results are carried forward
+
+        The configured execution_mode decides how scenes run: "full" renders videos,
+        "validate" only runs construct() and saves last frames, and "auto" validates
+        first and renders full videos once the success threshold for the enhanced
+        visual review is reached.
 
         Returns:
             tuple: (success, frames, logs, successful_scenes)
@@ -128,18 +223,25 @@ class ManimWorkflow:
         else:
             self.console.rule(f"[bold green]Running Manim Script - {step_name}", style="green")
 
-        success, frames, logs, successful_scenes = run_manim_multiscene(
-            code,
-            self.console,
-            self.config["output_dir"],
-            step_name.lower().replace(" ", "_"),
-            self.artifact_manager,
-            self.config.get("frame_extraction_mode", "fixed_count"),
-            self.config.get("frame_count", 3),
-            headless=self.headless,
-            scene_timeout=self.config.get("scene_timeout"),
+        cache_hits_before = self.render_cache.hits if self.render_cache else 0
+        asset_counts_before = dict(self.asset_cache.counts) if self.asset_cache else {}
+        execution_mode = self.config.get("execution_mode", "full")
+        run_mode = "full" if execution_mode == "full" else "validate"
+        success, frames, logs, successful_scenes, outcomes, reuse = self._run_scenes(
+            code, step_name, run_mode, previous_code
         )
 
+        if execution_mode == "auto" and self._meets_success_threshold(code, successful_scenes):
+            # the enhanced visual review needs real video frames
+            if not self.headless:
+                self.console.print(
+                    "[blue]Scenes pass the success threshold - rendering full videos for visual review"
+                )
+            run_mode = "full"
+            success, frames, logs, successful_scenes, outcomes, reuse = self._run_scenes(
+                code, step_name, run_mode, previous_code
+            )
+
         scene_names = extract_scene_class_names(code)
         requested_scenes = None if isinstance(scene_names, Exception) else scene_names
 
@@ -151,6 +253,7 @@ class ManimWorkflow:
         self.execution_count += 1
         if success:
             self.successful_executions += 1
+            self._start_speculative_render(code)
 
         self.execution_history.append(
             {
@@ -158,6 +261,27 @@ class ManimWorkflow:
                 "success": success,
                 "successful_scenes": successful_scenes,
                 "requested_scenes": requested_scenes,
+                "execution_mode": run_mode,
+                "reused_scenes": [scene for scene in outcomes if scene in reuse],
+                "scene_timings": {
+                    scene: round(outcome.result.elapsed, 3) for scene, outcome in outcomes.items()
+                },
+                "render_cache_hits": (
+                    self.render_cache.hits - cache_hits_before if self.render_cache else 0
+                ),
+                "asset_cache": (
+                    {
+                        counter: self.asset_cache.counts[counter] - asset_counts_before[counter]
+                        for counter in COUNTERS
+                    }
+                    if self.asset_cache
+                    else None
+                ),
+                "scene_resources": {
+                    scene: outcome.result.usage
+                    for scene, outcome in outcomes.items()
+                    if outcome.result.usage and scene not in reuse
+                },
             }
         )
 
@@ -170,6 +294,137 @@ class ManimWorkflow:
 
         return success, frames, logs, successful_scenes
 
+    def _run_scenes(
+        self, code: str, step_name: str, execution_mode: str, previous_code: str | None
+    ) -> tuple[bool, list, str, list, dict[str, SceneOutcome], dict[str, SceneOutcome]]:
+        """Run the scenes in one execution mode, carrying forward unchanged scenes.
+
+        Returns:
+            tuple: (success, frames, logs, successful_scenes, outcomes, reused_outcomes)
+        """
+        reuse = self._unchanged_scene_outcomes(previous_code, code, execution_mode)
+        if reuse and not self.headless:
+            self.console.print(
+                f"[blue]Reusing results of {len(reuse)} unchanged scene(s): {', '.join(reuse)}"
+            )
+
+        outcomes: dict[str, SceneOutcome] = {}
+        success, frames, logs, successful_scenes = run_manim_multiscene(
+            code,
+            self.console,
+            self.config["output_dir"],
+            step_name.lower().replace(" ", "_"),
+            self.artifact_manager,
+            self.config.get("frame_extraction_mode", "fixed_count"),
+            self.config.get("frame_count", 3),
+            headless=self.headless,
+            scene_timeout=self.config.get("scene_timeout"),
+            render_workers=self.config.get("render_workers"),
+            render_backend=self.config.get("render_backend", "subprocess"),
+            render_cache=self.render_cache,
+            reuse=reuse,
+            outcomes=outcomes,
+            preflight=self.config.get("preflight", True),
+            execution_mode=execution_mode,
+            frame_format=self.config.get("frame_format", "png"),
+            frame_quality=self.config.get("frame_quality", 85),
+            frame_max_dimension=self.config.get("frame_max_dimension"),
+            resource_limits=self.resource_limits,
+            render_profile=self.config.get("review_profile", "review"),
+            time_scale=self.config.get("review_time_scale", 1.0),
+            keep_clips=self._promotes_review_clips(),
+            asset_cache=self.asset_cache,
+            tex_precompile=self.config.get("tex_precompile", True),
+        )
+        self.last_executions[execution_mode] = (code, outcomes)
+        return success, frames, logs, successful_scenes, outcomes, reuse
+
+    def _meets_success_threshold(self, code: str, successful_scenes: list[str]) -> bool:
+        """Whether enough scenes succeed for the enhanced visual review prompt."""
+        success_rate, _, _ = calculate_scene_success_rate(
+            successful_scenes, extract_scene_class_names(code)
+        )
+        return success_rate >= self.config["success_threshold"]
+
+    def _promotes_review_clips(self) -> bool:
+        """Whether review clips are kept and promoted to the final video.
+
+        Clips qualify when reviews render at the final profile, or when the user
+        accepts a review-quality final video; time-compressed clips never do.
+        """
+        if self.config.get("review_time_scale", 1.0) != 1:
+            return False
+        return self.config.get("promote_review_clips", False) or self.config.get(
+            "review_profile", "review"
+        ) == self.config.get("final_profile", "final")
+
+    def promoted_clips(self, code: str) -> dict[str, str] | None:
+        """Kept review clips of exactly this code, by scene name, or None if there are none."""
+        if not self._promotes_review_clips():
+            return None
+        scene_names = extract_scene_class_names(code)
+        if isinstance(scene_names, Exception):
+            return None
+        key = clip_set_key(code, self.config.get("review_profile", "review"))
+        return find_clips(self.config["output_dir"], key, scene_names)
+
+    def _start_speculative_render(self, code: str) -> None:
+        """Start the final render of fully successful code in the background.
+
+        The render of earlier code is cancelled. Nothing starts when review clips
+        are promoted, since the final video then needs no render.
+        """
+        if self.speculative_render is None or self._promotes_review_clips():
+            return
+        if self.speculative_render.start(code) and not self.headless:
+            self.console.print("[blue]Started the final render of this code in the background")
+
+    def speculative_video(self, code: str) -> str | None:
+        """Wait for the background final render of this code and take its video.
+
+        Args:
+            code: Final working code
+
+        Returns:
+            str | None: Path of the video moved to `<output_dir>/final_video.mp4`, or
+            None if this code was not rendered in the background or its render failed
+        """
+        if self.speculative_render is None:
+            return None
+        if not self.headless:
+            self.console.print("[blue]Waiting for the background final render")
+        rendered = self.speculative_render.result(code)
+        video_path = None
+        if rendered:
+            video_path = os.path.abspath(os.path.join(self.config["output_dir"], "final_video.mp4"))
+            os.replace(rendered, video_path)
+        self.speculative_render.cancel()
+        return video_path
+
+    def cancel_speculative_render(self) -> None:
+        """Stop the background final render, if any."""
+        if self.speculative_render is not None:
+            self.speculative_render.cancel()
+
+    def _unchanged_scene_outcomes(
+        self, previous_code: str | None, code: str, execution_mode: str
+    ) -> dict[str, SceneOutcome]:
+        """Return the last outcomes of scenes unaffected by the changes since they ran."""
+        if previous_code is None or execution_mode not in self.last_executions:
+            return {}
+
+        executed_code, outcomes = self.last_executions[execution_mode]
+        changed = changed_scenes(executed_code, code)
+        if changed is None:
+            return {}
+
+        # timeouts may be transient, so those scenes are always retried
+        return {
+            scene: outcome
+            for scene, outcome in outcomes.items()
+            if scene not in changed and not outcome.result.timed_out
+        }
+
     def _display_execution_status(
         self,
         success: bool,
@@ -230,10 +485,7 @@ class ManimWorkflow:
         previous_reviews = []
 
         for cycle in range(self.config["review_cycles"]):
-            if self.headless and self.headless_manager:
-                self.headless_manager.set_cycle(cycle + 1)
-            else:
-                self.console.rule(f"[bold blue]Review Cycle {cycle + 1}", style="blue")
+            self._start_review_cycle(cycle + 1)
 
             review, review_reasoning = self._generate_review(
                 current_code,
@@ -244,31 +496,15 @@ class ManimWorkflow:
                 successful_scenes,
             )
             previous_reviews.append(review)
+            self._show_review(review, review_reasoning)
 
-            if not self.headless:
-                if review_reasoning and not self.config["streaming"]:
-                    self.console.print(
-                        Panel(
-                            review_reasoning,
-                            title="[yellow]Review Model Reasoning[/yellow]",
-                            border_style="yellow",
-                        )
-                    )
-
-                self.console.print(
-                    Panel(
-                        Markdown(review),
-                        title="[blue]Review Feedback[/blue]",
-                        border_style="blue",
-                    )
-                )
-
+            previous_code = current_code
             current_code = self._generate_code_revision(
                 current_code, review, video_data, cycle + 1, last_frames
             )
 
             success, last_frames, combined_logs, successful_scenes = self.execute_code(
-                current_code, f"Revision {cycle + 1}"
+                current_code, f"Revision {cycle + 1}", previous_code=previous_code
             )
             if success:
                 working_code = current_code
@@ -277,6 +513,34 @@ class ManimWorkflow:
 
         return current_code, working_code, combined_logs
 
+    def _start_review_cycle(self, cycle: int) -> None:
+        """Announce the start of a review cycle (numbered from 1)."""
+        if self.headless and self.headless_manager:
+            self.headless_manager.set_cycle(cycle)
+        else:
+            self.console.rule(f"[bold blue]Review Cycle {cycle}", style="blue")
+
+    def _show_review(self, review: str, review_reasoning: str | None) -> None:
+        """Display a review and the reasoning behind it."""
+        if self.headless:
+            return
+        if review_reasoning and not self.config["streaming"]:
+            self.console.print(
+                Panel(
+                    review_reasoning,
+                    title="[yellow]Review Model Reasoning[/yellow]",
+                    border_style="yellow",
+                )
+            )
+
+        self.console.print(
+            Panel(
+                Markdown(review),
+                title="[blue]Review Feedback[/blue]",
+                border_style="blue",
+            )
+        )
+
     def _generate_review(
         self,
         code: str,
@@ -287,6 +551,26 @@ class ManimWorkflow:
         successful_scenes: list[str],
     ) -> tuple[str, str | None]:
         """Generate a review of the current code."""
+        request, review_content = self._review_request(
+            code, logs, frames, previous_reviews, cycle_num, successful_scenes
+        )
+        response = get_response_with_status(**request)
+        return self._finish_review(cycle_num, review_content, *response)
+
+    def _review_request(
+        self,
+        code: str,
+        logs: str,
+        frames: list,
+        previous_reviews: list,
+        cycle_num: int,
+        successful_scenes: list[str],
+    ) -> tuple[dict, str]:
+        """Build the LLM request of a review.
+
+        Returns:
+            tuple: (request, review_prompt)
+        """
         if self.headless and self.headless_manager:
             self.headless_manager.update(f"Review Cycle {cycle_num}")
 
@@ -320,50 +604,49 @@ class ManimWorkflow:
                     f"[yellow]Success rate ({success_rate:.1f}%) - Using standard technical review prompt"
                 )
 
-        if use_enhanced_prompt:
-            review_content = format_prompt(
-                prompt_name,
-                {
-                    "previous_reviews": format_previous_reviews(previous_reviews),
-                    "video_code": code,
-                    "execution_logs": logs,
-                    "success_rate": success_rate,
-                    "scenes_rendered": scenes_rendered,
-                    "total_scenes": total_scenes,
-                },
-            )
-        else:
-            review_content = format_prompt(
-                prompt_name,
-                {
-                    "previous_reviews": format_previous_reviews(previous_reviews),
-                    "video_code": code,
-                    "execution_logs": logs,
-                },
-            )
+        # the instructions are the same every cycle and form the cached prefix; previous
+        # reviews only grow, so they come first in the part that changes
+        review_instructions = format_prompt(prompt_name, {})
+        review_input = format_prompt(
+            "review_input",
+            {
+                "previous_reviews": format_previous_reviews(previous_reviews),
+                "video_code": code,
+                "execution_logs": logs,
+                "success_rate": f"{success_rate:.1f}",
+                "scenes_rendered": scenes_rendered,
+                "total_scenes": total_scenes,
+            },
+        )
+        review_content = f"{review_instructions}\n\n{review_input}"
 
         review_message = [
+            cached_prefix_message("system", review_instructions),
             {
                 "role": "user",
                 "content": [
-                    {"type": "text", "text": review_content},
+                    {"type": "text", "text": review_input},
                 ]
                 + frames_formatted,
-            }
+            },
         ]
 
-        response, usage_info, reasoning_content = get_response_with_status(
+        request = self._llm_request(
             self.config["review_model"],
             review_message,
-            None if self.config.get("no_temperature") else self.config["temperature"],
-            self.config["streaming"],
-            status=f"[bold blue]Generating {'Enhanced Visual' if use_enhanced_prompt else 'Technical'} Review \\[{self.config['review_model']}\\]",
-            console=self.console,
-            reasoning=self.config["reasoning"],
-            provider=self.config["provider"],
-            headless=self.headless,
+            f"[bold blue]Generating {'Enhanced Visual' if use_enhanced_prompt else 'Technical'} Review \\[{self.config['review_model']}\\]",
         )
+        return request, review_content
 
+    def _finish_review(
+        self,
+        cycle_num: int,
+        review_content: str,
+        response: str,
+        usage_info: dict,
+        reasoning_content: str | None,
+    ) -> tuple[str, str | None]:
+        """Record and save the response to a review request."""
         self.usage_tracker.add_step(
             f"Review Cycle {cycle_num}", self.config["review_model"], usage_info
         )
@@ -385,34 +668,51 @@ class ManimWorkflow:
         frames: list | None = None,
     ) -> str:
         """Generate a revised version of the code based on review feedback."""
+        request, revision_prompt = self._code_revision_request(
+            current_code, review, video_data, cycle_num
+        )
+        response = get_response_with_status(**request)
+        return self._finish_code_revision(cycle_num, revision_prompt, *response)
+
+    def _code_revision_request(
+        self, current_code: str, review: str, video_data: str, cycle_num: int
+    ) -> tuple[dict, str]:
+        """Build the LLM request of a code revision.
+
+        Returns:
+            tuple: (request, revision_prompt)
+        """
         if self.headless and self.headless_manager:
             self.headless_manager.update(f"Code Revision {cycle_num}")
 
         revision_prompt = f"Here is the current code:\n\n```python\n{current_code}\n```\n\nHere is some feedback on your code:\n\n<review>\n{review}\n</review>\n\nPlease implement the suggestions and respond with the whole script. Do not leave anything out."
 
         revision_messages = [
-            {
-                "role": "system",
-                "content": format_prompt("init_prompt", {"video_data": video_data}),
-            },
+            cached_prefix_message(
+                "system", format_prompt("init_prompt", {"video_data": video_data})
+            ),
             {"role": "user", "content": revision_prompt},
         ]
 
         if not self.headless:
             self.console.rule(f"[bold green]Generating Code Revision {cycle_num}", style="green")
 
-        revised_response, usage_info, reasoning_content = get_response_with_status(
+        request = self._llm_request(
             self.config["manim_model"],
             revision_messages,
-            None if self.config.get("no_temperature") else self.config["temperature"],
-            self.config["streaming"],
             f"[bold green]Generating code revision \\[{self.config['manim_model']}]",
-            self.console,
-            reasoning=self.config["reasoning"],
-            provider=self.config["provider"],
-            headless=self.headless,
         )
+        return request, revision_prompt
 
+    def _finish_code_revision(
+        self,
+        cycle_num: int,
+        revision_prompt: str,
+        revised_response: str,
+        usage_info: dict,
+        reasoning_content: str | None,
+    ) -> str:
+        """Record, display and save the response to a code revision request."""
         if not self.headless:
             if reasoning_content and not self.config["streaming"]:
                 self.console.print(
@@ -467,9 +767,23 @@ class ManimWorkflow:
                 self.console.rule("[bold blue]Rendering Options", style="blue")
                 if Confirm.ask("[bold blue]Would you like to render the final video?[/bold blue]"):
                     self.console.rule("[bold blue]Rendering Final Video", style="blue")
-                    video_path = render_and_concat(
-                        saved_file, self.config["output_dir"], "final_video.mp4"
-                    )
+                    video_path = self.speculative_video(working_code)
+                    if video_path:
+                        play_video(video_path)
+                    else:
+                        video_path = render_and_concat(
+                            saved_file,
+                            self.config["output_dir"],
+                            "final_video.mp4",
+                            render_backend=self.config.get("render_backend", "subprocess"),
+                            resource_limits=self.resource_limits,
+                            render_workers=self.config.get("render_workers"),
+                            shard_scenes=self.config.get("shard_scenes", False),
+                            render_profile=self.config.get("final_profile", "final"),
+                            clips=self.promoted_clips(working_code),
+                            asset_cache=self.asset_cache,
+                            tex_precompile=self.config.get("tex_precompile", True),
+                        )
 
                     if video_path:
                         video_path = os.path.abspath(video_path)
@@ -486,4 +800,85 @@ class ManimWorkflow:
                     Panel(logs, title="[red]Execution Errors[/red]", border_style="red")
                 )
 
+        # the final video was taken, declined, or is not rendered in headless mode
+        self.cancel_speculative_render()
         return video_path
+
+
+class AsyncManimWorkflow(ManimWorkflow):
+    """ManimWorkflow whose LLM requests and renders do not block the event loop.
+
+    LLM requests go through litellm's async client, and executions, which spend
+    their time waiting on manim subprocesses, run in worker threads. One event
+    loop can then drive many generations at once, e.g. in the API server. The
+    steps take the same arguments as in ManimWorkflow and are awaited instead.
+    """
+
+    async def generate_initial_code(self, video_data: str) -> tuple[str, list]:
+        """Generate the initial Manim code based on video data.
+
+        Returns:
+            tuple: (generated_code, conversation_history)
+        """
+        request = self._initial_code_request(video_data)
+        response = await get_response_with_status_async(**request)
+        return self._finish_initial_code(video_data, request["messages"], *response)
+
+    async def execute_code(
+        self, code: str, step_name: str = "Execution", previous_code: str | None = None
+    ) -> tuple[bool, list, str, list]:
+        """Execute Manim code in a worker thread and return results.
+
+        Returns:
+            tuple: (success, frames, logs, successful_scenes)
+        """
+        return await asyncio.to_thread(super().execute_code, code, step_name, previous_code)
+
+    async def review_and_update_code(
+        self,
+        current_code: str,
+        combined_logs: str,
+        last_frames: list,
+        video_data: str,
+        successful_scenes: list[str],
+    ) -> tuple[str, str | None, str]:
+        """Perform review cycles and update the Manim code.
+
+        Returns:
+            tuple: (final_code, last_working_code, final_logs)
+        """
+        working_code = None
+        previous_reviews = []
+
+        for cycle in range(self.config["review_cycles"]):
+            self._start_review_cycle(cycle + 1)
+
+            request, review_content = self._review_request(
+                current_code,
+                combined_logs,
+                last_frames,
+                previous_reviews,
+                cycle + 1,
+                successful_scenes,
+            )
+            response = await get_response_with_status_async(**request)
+            review, review_reasoning = self._finish_review(cycle + 1, review_content, *response)
+            previous_reviews.append(review)
+            self._show_review(review, review_reasoning)
+
+            previous_code = current_code
+            request, revision_prompt = self._code_revision_request(
+                current_code, review, video_data, cycle + 1
+            )
+            response = await get_response_with_status_async(**request)
+            current_code = self._finish_code_revision(cycle + 1, revision_prompt, *response)
+
+            success, last_frames, combined_logs, successful_scenes = await self.execute_code(
+                current_code, f"Revision {cycle + 1}", previous_code=previous_code
+            )
+            if success:
+                working_code = current_code
+
+            self.cycles_completed = cycle + 1
+
+        return current_code, working_code, combined_logs
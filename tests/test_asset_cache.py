@@ -0,0 +1,131 @@
+"""Tests for the shared Tex/Text SVG cache."""
+
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+import types
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from manim_generator.utils import asset_cache
+from manim_generator.utils.asset_cache import AssetCache, manim_command
+
+
+def _fake_manim(tex_dir: str, compiled: list) -> dict[str, types.ModuleType]:
+    """Build stand-ins for the manim and manimpango modules the cache patches."""
+    config = types.SimpleNamespace(tex_template="template")
+
+    def generate_tex_file(expression, environment=None, tex_template=None):
+        name = hashlib.sha256(f"{tex_template}{environment}{expression}".encode()).hexdigest()
+        tex_file = Path(tex_dir) / f"{name[:16]}.tex"
+        tex_file.write_text(expression)
+        return tex_file
+
+    def tex_to_svg_file(expression, environment=None, tex_template=None):
+        compiled.append(expression)
+        svg_file = generate_tex_file(expression, environment, tex_template).with_suffix(".svg")
+        svg_file.write_text(f"<svg>{expression}</svg>")
+        return svg_file
+
+    def text2svg(settings, size, line_spacing, disable_liga, file_name, *args):
+        compiled.append(file_name)
+        Path(file_name).write_text("<svg>text</svg>")
+        return file_name
+
+    tex_file_writing = types.ModuleType("manim.utils.tex_file_writing")
+    tex_file_writing.generate_tex_file = generate_tex_file
+    tex_file_writing.tex_to_svg_file = tex_to_svg_file
+    tex_mobject = types.ModuleType("manim.mobject.text.tex_mobject")
+    tex_mobject.tex_to_svg_file = tex_to_svg_file
+    manim = types.ModuleType("manim")
+    manim.config = config
+    manimpango = types.ModuleType("manimpango")
+    manimpango.text2svg = text2svg
+    return {
+        "manim": manim,
+        "manim.utils": types.ModuleType("manim.utils"),
+        "manim.utils.tex_file_writing": tex_file_writing,
+        "manim.mobject": types.ModuleType("manim.mobject"),
+        "manim.mobject.text": types.ModuleType("manim.mobject.text"),
+        "manim.mobject.text.tex_mobject": tex_mobject,
+        "manimpango": manimpango,
+    }
+
+
+class TestAssetCache(unittest.TestCase):
+    """Test cases for sharing SVGs between render processes."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = AssetCache(os.path.join(self.temp_dir, "cache"), 1024 * 1024)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def _render_process(self, media_dir: str, run) -> list:
+        """Simulate one manim process rendering a MathTex and a Text in media_dir."""
+        tex_dir = os.path.join(self.temp_dir, media_dir, "Tex")
+        os.makedirs(tex_dir, exist_ok=True)
+        compiled: list = []
+        modules = _fake_manim(tex_dir, compiled)
+        with (
+            patch.dict(sys.modules, modules),
+            patch.object(asset_cache, "_installed", False),
+            patch.dict(asset_cache._counts, dict.fromkeys(asset_cache.COUNTERS, 0)),
+        ):
+            asset_cache.install(run.cache_dir, run.stats_dir)
+            svg_file = modules["manim.mobject.text.tex_mobject"].tex_to_svg_file(
+                r"e^{i\pi}", environment="align*"
+            )
+            self.assertEqual(Path(svg_file).read_text(), r"<svg>e^{i\pi}</svg>")
+            text_file = os.path.join(self.temp_dir, media_dir, "text.svg")
+            modules["manimpango"].text2svg({}, 48, 1, False, text_file, 0, 0, 600, 400, "hi")
+            self.assertTrue(os.path.exists(text_file))
+            asset_cache.write_stats()
+        return compiled
+
+    def test_second_process_reuses_the_first_ones_svgs(self):
+        """Each SVG is built once and then linked into other media directories."""
+        run = self.cache.start_run()
+        first = self._render_process("run_1", run)
+        second = self._render_process("run_2", run)
+        stats = self.cache.finish_run(run)
+
+        self.assertEqual(len(first), 2)
+        self.assertEqual(second, [])
+        self.assertEqual(stats, {"tex_hits": 1, "tex_misses": 1, "text_hits": 1, "text_misses": 1})
+        self.assertFalse(os.path.exists(run.stats_dir))
+        self.assertEqual(self.cache.get_stats()["hit_rate"], 0.5)
+
+    def test_least_recently_used_svgs_are_evicted(self):
+        """Only the most recently used SVGs stay within the size budget."""
+        cache = AssetCache(os.path.join(self.temp_dir, "small"), 250)
+        for idx in range(3):
+            path = os.path.join(cache.cache_dir, asset_cache.TEX_DIR, f"{idx}.svg")
+            with open(path, "w") as f:
+                f.write("x" * 100)
+            os.utime(path, (time.time() - 100 + idx, time.time() - 100 + idx))
+
+        cache.evict()
+
+        remaining = sorted(os.listdir(os.path.join(cache.cache_dir, asset_cache.TEX_DIR)))
+        self.assertEqual(remaining, ["1.svg", "2.svg"])
+        self.assertEqual(cache.evictions, 1)
+
+    def test_manim_command_runs_through_the_cache_only_when_enabled(self):
+        """Without a cache run, scenes render with the plain manim CLI."""
+        run = self.cache.start_run()
+
+        self.assertEqual(manim_command(None), ["manim"])
+        self.assertEqual(manim_command(run)[1:3], ["-m", "manim_generator.utils.asset_cache"])
+        self.assertEqual(manim_command(run)[3:], [run.cache_dir, run.stats_dir])
+
+
+if __name__ == "__main__":
+    unittest.main()
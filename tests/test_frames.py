@@ -0,0 +1,77 @@
+"""Tests for frame encoding."""
+
+import unittest
+
+import cv2
+import numpy as np
+
+from manim_generator.utils.frames import EncodedFrame, encode_frame, reencode_image
+
+
+def _scene_frame() -> np.ndarray:
+    """A Manim-like frame: anti-aliased text and a gradient shape on black."""
+    frame = np.zeros((480, 854, 3), dtype=np.uint8)
+    for line in range(6):
+        cv2.putText(
+            frame,
+            f"Step {line}: x = x - lr * grad",
+            (40, 60 + 60 * line),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            0.9,
+            (255, 255, 255),
+            2,
+            cv2.LINE_AA,
+        )
+    rows, cols = np.mgrid[0:480, 0:854]
+    mask = (cols - 640) ** 2 + (rows - 290) ** 2 < 120**2
+    frame[mask, 0] = cols[mask] * 255 // 854
+    frame[mask, 1] = rows[mask] * 255 // 480
+    return frame
+
+
+class TestEncodeFrame(unittest.TestCase):
+    """Test cases for encode_frame and reencode_image."""
+
+    def test_formats_decode_back(self):
+        """Every supported format produces an image decodable at the original size."""
+        for image_format in ("png", "jpeg", "webp"):
+            with self.subTest(image_format=image_format):
+                data = encode_frame(_scene_frame(), image_format, quality=80)
+                self.assertIsNotNone(data)
+                decoded = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+                self.assertEqual(decoded.shape, (480, 854, 3))
+
+    def test_lossy_formats_are_smaller(self):
+        """JPEG and WebP payloads are smaller than PNG."""
+        png = encode_frame(_scene_frame(), "png")
+        for image_format in ("jpeg", "webp"):
+            with self.subTest(image_format=image_format):
+                data = encode_frame(_scene_frame(), image_format, quality=80)
+                self.assertLess(len(data), len(png) * 0.75)
+
+    def test_max_dimension_downscales(self):
+        """Frames larger than max_dimension are downscaled keeping the aspect ratio."""
+        data = encode_frame(_scene_frame(), "png", max_dimension=427)
+        decoded = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+        self.assertEqual(decoded.shape[:2], (240, 427))
+
+    def test_reencode_png_passthrough(self):
+        """PNG stills are passed through untouched when no conversion is needed."""
+        png = encode_frame(_scene_frame(), "png")
+        self.assertIs(reencode_image(png, "png"), png)
+        self.assertTrue(reencode_image(png, "jpeg").startswith(b"\xff\xd8"))
+
+
+class TestEncodedFrame(unittest.TestCase):
+    """Test cases for EncodedFrame."""
+
+    def test_data_url_and_extension(self):
+        """The data URL and file extension follow the MIME type."""
+        frame = EncodedFrame("Scene", b"abc", "image/webp")
+
+        self.assertEqual(frame.to_data_url(), "data:image/webp;base64,YWJj")
+        self.assertEqual(frame.extension, ".webp")
+
+
+if __name__ == "__main__":
+    unittest.main()
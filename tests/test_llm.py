@@ -2,8 +2,9 @@
 
 import unittest
 from types import SimpleNamespace
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+from litellm import RateLimitError
 from rich.console import Console
 
 from manim_generator.utils.llm import (
@@ -11,8 +12,11 @@ from manim_generator.utils.llm import (
     _build_usage_info,
     check_and_register_models,
     get_completion_with_retry,
+    get_completion_with_retry_async,
     get_streaming_completion_with_retry,
+    get_streaming_completion_with_retry_async,
 )
+from manim_generator.utils.rate_limit import RateLimiter
 
 
 class TestLiteLLMParams(unittest.TestCase):
@@ -194,9 +198,9 @@ class TestGetStreamingCompletionWithRetry(unittest.TestCase):
     def test_streaming_completion(self, mock_completion):
         """Test streaming completion request."""
         mock_chunk1 = MagicMock()
-        mock_chunk1.choices = [MagicMock(delta=MagicMock(content="Hello"))]
+        mock_chunk1.choices = [MagicMock(delta=MagicMock(content="Hello", reasoning_content=None))]
         mock_chunk2 = MagicMock()
-        mock_chunk2.choices = [MagicMock(delta=MagicMock(content=" world"))]
+        mock_chunk2.choices = [MagicMock(delta=MagicMock(content=" world", reasoning_content=None))]
         mock_completion.return_value = iter([mock_chunk1, mock_chunk2])
 
         console = Console()
@@ -210,9 +214,94 @@ class TestGetStreamingCompletionWithRetry(unittest.TestCase):
         chunks = list(generator)
         self.assertEqual(len(chunks), 3)  # 2 chunks + 1 final empty
         self.assertEqual(chunks[0].token, "Hello")
-        self.assertEqual(chunks[0].response, "Hello")
+        self.assertEqual(chunks[0].response, "")
         self.assertEqual(chunks[1].token, " world")
-        self.assertEqual(chunks[1].response, "Hello world")
+        self.assertFalse(chunks[1].final)
+        self.assertTrue(chunks[2].final)
+        self.assertEqual(chunks[2].response, "Hello world")
+
+    @patch("manim_generator.utils.llm.completion_cost", return_value=0.002)
+    @patch("manim_generator.utils.llm.completion")
+    def test_streaming_cost_is_computed_once(self, mock_completion, mock_cost):
+        """Only the final payload carries the usage; the cost is computed from the last usage chunk."""
+        chunks = [
+            SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content=token))],
+                usage=SimpleNamespace(prompt_tokens=10, completion_tokens=n, total_tokens=10 + n),
+            )
+            for n, token in enumerate(("a", "b", "c"), start=1)
+        ]
+        mock_completion.return_value = iter(chunks)
+
+        payloads = list(
+            get_streaming_completion_with_retry(
+                model="gpt-4",
+                messages=[{"role": "user", "content": "Test"}],
+                temperature=None,
+                console=Console(),
+            )
+        )
+
+        mock_cost.assert_called_once_with(chunks[-1])
+        self.assertEqual([payload.usage for payload in payloads[:-1]], [{}, {}, {}])
+        self.assertEqual(payloads[-1].usage["completion_tokens"], 3)
+        self.assertEqual(payloads[-1].usage["cost"], 0.002)
+        self.assertIn("time_to_first_token", payloads[-1].usage)
+
+
+class TestAsyncCompletionWithRetry(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the async completion functions."""
+
+    @patch("manim_generator.utils.llm.get_rate_limiter", return_value=RateLimiter())
+    @patch("manim_generator.utils.llm.asyncio.sleep", new_callable=AsyncMock)
+    @patch("manim_generator.utils.llm.acompletion", new_callable=AsyncMock)
+    async def test_rate_limit_waits_without_blocking(self, mock_acompletion, mock_sleep, _):
+        """A rate limited request is retried after an asyncio.sleep backoff."""
+        mock_response = MagicMock()
+        mock_response.__getitem__ = MagicMock(
+            side_effect=lambda key: {"choices": [{"message": {"content": "Test response"}}]}[key]
+        )
+        mock_acompletion.side_effect = [
+            RateLimitError("slow down", llm_provider="openai", model="gpt-4"),
+            mock_response,
+        ]
+
+        result = await get_completion_with_retry_async(
+            model="gpt-4",
+            messages=[{"role": "user", "content": "Test"}],
+            temperature=0.5,
+            console=Console(),
+        )
+
+        self.assertEqual(result.content, "Test response")
+        self.assertEqual(mock_acompletion.call_count, 2)
+        mock_sleep.assert_awaited()
+        self.assertIn("rate_limit_wait", result.usage)
+
+    @patch("manim_generator.utils.llm.acompletion", new_callable=AsyncMock)
+    async def test_streaming_completion(self, mock_acompletion):
+        """Chunks of the async stream are accumulated like in the sync stream."""
+
+        async def stream():
+            for content in ("Hello", " world"):
+                yield MagicMock(
+                    choices=[MagicMock(delta=MagicMock(content=content, reasoning_content=None))]
+                )
+
+        mock_acompletion.return_value = stream()
+
+        chunks = [
+            chunk
+            async for chunk in get_streaming_completion_with_retry_async(
+                model="gpt-4",
+                messages=[{"role": "user", "content": "Test"}],
+                temperature=0.5,
+                console=Console(),
+            )
+        ]
+
+        self.assertEqual([chunk.token for chunk in chunks], ["Hello", " world", ""])
+        self.assertEqual(chunks[-1].response, "Hello world")
 
 
 class TestBuildUsageInfo(unittest.TestCase):
@@ -239,6 +328,32 @@ class TestBuildUsageInfo(unittest.TestCase):
         self.assertEqual(usage_info["total_tokens"], 0)
         self.assertEqual(usage_info["reasoning_tokens"], 0)
         self.assertEqual(usage_info["answer_tokens"], 0)
+        self.assertEqual(usage_info["cached_prompt_tokens"], 0)
+
+    def test_records_prompt_cache_tokens(self):
+        """Cache reads are taken from either usage format, cache writes from Anthropic's."""
+        openai_usage = SimpleNamespace(
+            prompt_tokens=2000,
+            completion_tokens=10,
+            total_tokens=2010,
+            prompt_tokens_details={"cached_tokens": 1536},
+        )
+        anthropic_usage = SimpleNamespace(
+            prompt_tokens=2000,
+            completion_tokens=10,
+            total_tokens=2010,
+            prompt_tokens_details=None,
+            cache_read_input_tokens=1200,
+            cache_creation_input_tokens=300,
+        )
+
+        openai_info = _build_usage_info("gpt-4o", openai_usage, 0.0, 1.0)
+        anthropic_info = _build_usage_info("claude", anthropic_usage, 0.0, 1.0)
+
+        self.assertEqual(openai_info["cached_prompt_tokens"], 1536)
+        self.assertEqual(openai_info["cache_write_tokens"], 0)
+        self.assertEqual(anthropic_info["cached_prompt_tokens"], 1200)
+        self.assertEqual(anthropic_info["cache_write_tokens"], 300)
 
 
 if __name__ == "__main__":
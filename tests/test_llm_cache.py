@@ -0,0 +1,134 @@
+"""Tests for the persistent LLM response cache."""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from rich.console import Console
+
+from manim_generator.utils.llm import get_completion_with_retry
+from manim_generator.utils.llm_cache import LLMResponseCache, make_key
+from manim_generator.utils.usage import TokenUsageTracker, get_usage_totals
+
+USAGE = {"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150, "cost": 0.01}
+
+
+def _image_message(data: str) -> list[dict]:
+    """A user message with one inline image."""
+    return [
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "Review"},
+                {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{data}"}},
+            ],
+        }
+    ]
+
+
+class TestLLMResponseCache(unittest.TestCase):
+    """Test cases for storing, expiring and evicting responses."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "llm.sqlite3")
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_keys_depend_on_request_not_on_streaming(self):
+        """Parameters and image contents change the key, streaming does not."""
+        request = {"model": "gpt-4", "messages": _image_message("AAAA"), "temperature": 0.4}
+
+        self.assertEqual(make_key(request), make_key({**request, "stream": True}))
+        self.assertNotEqual(make_key(request), make_key({**request, "temperature": 0.5}))
+        self.assertNotEqual(
+            make_key(request), make_key({**request, "messages": _image_message("BBBB")})
+        )
+
+    def test_stored_response_is_served_until_it_expires(self):
+        """A stored response is a hit within its time to live."""
+        cache = LLMResponseCache(self.path, 1024 * 1024, ttl_seconds=60)
+        cache.put("key", "content", "reasoning", USAGE)
+
+        cached = cache.get("key")
+        self.assertEqual((cached.content, cached.reasoning), ("content", "reasoning"))
+        self.assertEqual(cached.usage, USAGE)
+
+        with patch("manim_generator.utils.llm_cache.time.time", return_value=time.time() + 120):
+            self.assertIsNone(cache.get("key"))
+        self.assertEqual(cache.get_stats()["hits"], 1)
+        self.assertEqual(cache.get_stats()["misses"], 1)
+        self.assertEqual(cache.get_stats()["saved_cost"], 0.01)
+
+    def test_least_recently_used_responses_are_evicted(self):
+        """Only the most recently used responses stay within the size budget."""
+        cache = LLMResponseCache(self.path, 2 * (100 + len('{"cost": 0.0}')), ttl_seconds=None)
+        cache.put("a", "x" * 100, None, {"cost": 0.0})
+        cache.put("b", "x" * 100, None, {"cost": 0.0})
+        cache.get("a")
+        cache.put("c", "x" * 100, None, {"cost": 0.0})
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+        self.assertEqual(cache.evictions, 1)
+
+
+class TestCachedCompletions(unittest.TestCase):
+    """Test cases for serving completions from the cache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = LLMResponseCache(
+            os.path.join(self.temp_dir, "llm.sqlite3"), 1024 * 1024, ttl_seconds=None
+        )
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    @patch("manim_generator.utils.llm.completion_cost", return_value=0.01)
+    @patch("manim_generator.utils.llm.completion")
+    def test_repeated_request_is_free_and_flagged(self, mock_completion, mock_cost):
+        """The second identical request skips the provider and costs nothing."""
+        mock_response = MagicMock()
+        mock_response.__getitem__ = MagicMock(
+            side_effect=lambda key: {"choices": [{"message": {"content": "Test response"}}]}[key]
+        )
+        mock_response.usage.prompt_tokens = 100
+        mock_response.usage.completion_tokens = 50
+        mock_response.usage.total_tokens = 150
+        mock_completion.return_value = mock_response
+
+        tracker = TokenUsageTracker()
+        for step in ("Review Cycle 1", "Review Cycle 2"):
+            result = get_completion_with_retry(
+                model="gpt-4",
+                messages=[{"role": "user", "content": "Test"}],
+                temperature=0.5,
+                console=Console(),
+                response_cache=self.cache,
+            )
+            self.assertEqual(result.content, "Test response")
+            tracker.add_step(step, "gpt-4", result.usage)
+
+        mock_completion.assert_called_once()
+        first, second = tracker.get_tracking_data()["steps"]
+        self.assertFalse(first["cached"])
+        self.assertTrue(second["cached"])
+        self.assertEqual(second["cost"], 0.0)
+        self.assertEqual(second["prompt_tokens"], 100)
+        self.assertEqual(tracker.get_tracking_data()["total_cost"], 0.01)
+        self.assertEqual(tracker.get_tracking_data()["total_tokens"], 150)
+        self.assertEqual(get_usage_totals(tracker.get_tracking_data())[0], 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
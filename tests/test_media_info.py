@@ -0,0 +1,88 @@
+"""Tests for reading video duration and stream info."""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import cv2
+import numpy as np
+
+from manim_generator.utils import media_info
+from manim_generator.utils.media_info import VideoInfo, probe_video, read_mp4_info
+
+
+class TestMediaInfo(unittest.TestCase):
+    """Test cases for the MP4 header reader and the probe cache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        media_info._probe_file.cache_clear()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def _write_clip(self, frames: int, fps: int = 15, size=(320, 240)) -> str:
+        """Encode a small MP4 clip with OpenCV."""
+        video_path = os.path.join(self.temp_dir, "clip.mp4")
+        writer = cv2.VideoWriter(video_path, cv2.VideoWriter_fourcc(*"mp4v"), fps, size)
+        if not writer.isOpened():
+            self.skipTest("no mp4 encoder available")
+        for idx in range(frames):
+            writer.write(np.full((size[1], size[0], 3), idx % 256, dtype=np.uint8))
+        writer.release()
+        return video_path
+
+    @patch("manim_generator.utils.media_info.subprocess.run")
+    def test_mp4_headers_give_stream_info(self, mock_run):
+        """Duration, size, fps and frame count come from moov without ffprobe."""
+        video_path = self._write_clip(frames=30, fps=15)
+
+        info = probe_video(video_path)
+
+        self.assertEqual(info, VideoInfo(2.0, 320, 240, 15.0, 30))
+        mock_run.assert_not_called()
+
+    @patch("manim_generator.utils.media_info.subprocess.run")
+    def test_other_files_fall_back_to_ffprobe(self, mock_run):
+        """Files without MP4 headers are probed with ffprobe."""
+        video_path = os.path.join(self.temp_dir, "clip.webm")
+        with open(video_path, "wb") as f:
+            f.write(b"\x1a\x45\xdf\xa3 not an mp4")
+        probe = {
+            "format": {"duration": "2.500000"},
+            "streams": [{"width": 854, "height": 480, "avg_frame_rate": "30/1"}],
+        }
+        mock_run.return_value = MagicMock(stdout=json.dumps(probe))
+
+        self.assertIsNone(read_mp4_info(video_path))
+        self.assertEqual(probe_video(video_path), VideoInfo(2.5, 854, 480, 30.0, None))
+        probe_video(video_path)
+        mock_run.assert_called_once()
+
+    def test_results_are_memoized_per_file_version(self):
+        """A file is parsed once until it is rewritten."""
+        video_path = self._write_clip(frames=30)
+
+        with patch(
+            "manim_generator.utils.media_info.read_mp4_info", wraps=read_mp4_info
+        ) as mock_read:
+            first = probe_video(video_path)
+            self.assertIs(probe_video(video_path), first)
+            self.assertEqual(mock_read.call_count, 1)
+
+            self._write_clip(frames=45)
+            self.assertEqual(probe_video(video_path).frame_count, 45)
+            self.assertEqual(mock_read.call_count, 2)
+
+    def test_missing_file(self):
+        """Missing files are reported as None."""
+        self.assertIsNone(probe_video(os.path.join(self.temp_dir, "missing.mp4")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""Tests for the static pre-flight validation."""
+
+import sys
+import types
+import unittest
+from unittest.mock import patch
+
+from manim_generator.utils.preflight import format_preflight_error, preflight_check
+
+
+def _fake_manim() -> types.ModuleType:
+    """Build a stand-in for the manim module with a small public namespace."""
+    module = types.ModuleType("manim")
+    module.__all__ = ["Scene", "Text", "Create", "Write", "Circle", "config", "UP"]
+    for name in module.__all__:
+        setattr(module, name, object())
+    return module
+
+
+CODE = """from manim import *
+
+
+def make_title(text):
+    return Txt(text)
+
+
+class TitleScene(Scene):
+    def construct(self):
+        self.play(Write(make_title("Hello")))
+
+
+class CircleScene(Scene):
+    def construct(self):
+        circle = Circle()
+        self.play(Create(circle))
+
+
+class TypoScene(Scene):
+    def construct(self):
+        self.play(Creat(Circle()))
+"""
+
+
+class TestPreflightCheck(unittest.TestCase):
+    """Test cases for preflight_check."""
+
+    @patch.dict(sys.modules, {"manim": _fake_manim()})
+    def test_unknown_names_are_attributed_to_scenes(self):
+        """Unknown names fail the scenes using them, directly or through helpers."""
+        failures = preflight_check(CODE)
+
+        self.assertEqual(sorted(failures), ["TitleScene", "TypoScene"])
+        self.assertIn("name 'Txt' is not defined", failures["TitleScene"][0])
+        self.assertIn("name 'Creat' is not defined", failures["TypoScene"][0])
+        self.assertTrue(failures["TypoScene"][0].startswith("line 21:"))
+
+    @patch.dict(sys.modules, {"manim": _fake_manim()})
+    def test_module_level_problems_fail_every_scene(self):
+        """Bad imports and config changes at module level affect all scenes."""
+        code = "from manim import *\nfrom manim import Creatte\nimport not_a_real_module_xyz\n"
+        code += "config.frame_rate = 30\n\nclass A(Scene):\n    pass\n\nclass B(Scene):\n    pass\n"
+
+        failures = preflight_check(code)
+
+        self.assertEqual(sorted(failures), ["A", "B"])
+        messages = "\n".join(failures["A"])
+        self.assertIn("cannot import name 'Creatte'", messages)
+        self.assertIn("No module named 'not_a_real_module_xyz'", messages)
+        self.assertIn("config.frame_rate", messages)
+
+    @patch.dict(sys.modules, {"manim": _fake_manim()})
+    def test_config_change_inside_scene(self):
+        """Config changes inside a scene only fail that scene."""
+        code = CODE.replace(
+            "circle = Circle()", 'config["background_color"] = UP\n        circle = Circle()'
+        )
+
+        failures = preflight_check(code)
+
+        self.assertIn("CircleScene", failures)
+        self.assertIn("Forbidden configuration change", failures["CircleScene"][0])
+
+    def test_compile_errors_fail_every_scene(self):
+        """Errors only raised at compile time are reported for every scene."""
+        failures = preflight_check("class A(Scene):\n    pass\n\nreturn 1\n")
+
+        self.assertEqual(list(failures), ["A"])
+        self.assertIn("SyntaxError", failures["A"][0])
+
+    @patch.dict(sys.modules, {"manim": None})
+    def test_name_checks_need_manim(self):
+        """Without an importable manim, namespace checks are skipped."""
+        self.assertEqual(preflight_check(CODE), {})
+
+    def test_format_preflight_error(self):
+        """Errors are formatted as a scene's STDERR block."""
+        error = format_preflight_error(["line 1: NameError: name 'x' is not defined"])
+
+        self.assertIn("not rendered", error)
+        self.assertIn("NameError", error)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+"""Tests for the render quality profiles."""
+
+import unittest
+
+from manim_generator.utils.profiles import RENDER_PROFILES, get_render_profile
+
+
+class TestRenderProfiles(unittest.TestCase):
+    """Test cases for RenderProfile and get_render_profile."""
+
+    def test_preset_profiles_use_plain_quality_flags(self):
+        """Profiles matching a Manim preset add no overrides."""
+        self.assertEqual(RENDER_PROFILES["review"].manim_args(), ["-ql"])
+        self.assertEqual(RENDER_PROFILES["final"].manim_args(), ["-qh"])
+        self.assertEqual(RENDER_PROFILES["4k"].folder, "2160p60")
+
+    def test_draft_overrides_resolution_and_frame_rate(self):
+        """The draft tier goes below -ql and renders to its own quality folder."""
+        draft = get_render_profile("draft")
+
+        self.assertEqual(draft.manim_args(), ["-ql", "-r", "426,240", "--fps", "10"])
+        self.assertEqual(
+            draft.videos_dir("output", "output/video.py"), "output/videos/video/240p10"
+        )
+
+    def test_unknown_profile(self):
+        """Unknown profile names are rejected with the available choices."""
+        with self.assertRaisesRegex(ValueError, "draft, review, final, 4k"):
+            get_render_profile("8k")
+
+
+if __name__ == "__main__":
+    unittest.main()
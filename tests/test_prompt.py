@@ -4,6 +4,7 @@ import os
 import tempfile
 import unittest
 
+from manim_generator.utils.frames import EncodedFrame
 from manim_generator.utils.prompt import (
     convert_frames_to_message_format,
     format_previous_reviews,
@@ -115,6 +116,14 @@ class TestConvertFramesToMessageFormat(unittest.TestCase):
             self.assertEqual(frame_msg["image_url"]["url"], frames[i])
             self.assertEqual(frame_msg["image_url"]["format"], "image/png")
 
+    def test_convert_encoded_frames(self):
+        """Encoded frames are turned into data URLs with their own MIME type."""
+        frames = [EncodedFrame("Scene", b"jpeg-bytes", "image/jpeg")]
+        result = convert_frames_to_message_format(frames)
+
+        self.assertEqual(result[0]["image_url"]["url"], "data:image/jpeg;base64,anBlZy1ieXRlcw==")
+        self.assertEqual(result[0]["image_url"]["format"], "image/jpeg")
+
     def test_convert_empty_frames(self):
         """Test converting empty frame list."""
         frames = []
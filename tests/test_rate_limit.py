@@ -0,0 +1,109 @@
+"""Tests for the process-wide LLM rate limiter."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import httpx
+import litellm
+from rich.console import Console
+
+from manim_generator.utils.llm import get_completion_with_retry
+from manim_generator.utils.rate_limit import RateLimiter, is_transient, retry_after
+
+
+def _error(error_class, status_code: int, headers: dict | None = None):
+    """Build a litellm error carrying an HTTP response with these headers."""
+    response = httpx.Response(
+        status_code, headers=headers or {}, request=httpx.Request("POST", "https://llm.test")
+    )
+    return error_class("failed", llm_provider="openai", model="gpt-4", response=response)
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test cases for budgets, backoff and Retry-After."""
+
+    @patch("manim_generator.utils.rate_limit.time.monotonic", return_value=1000.0)
+    def test_request_and_token_budgets_throttle(self, _):
+        """Requests beyond the per-minute budgets wait for them to refill."""
+        limiter = RateLimiter(requests_per_minute=2, tokens_per_minute=600)
+
+        self.assertEqual(limiter.acquire("gpt-4", 100), 0.0)
+        self.assertEqual(limiter.acquire("gpt-4", 100), 0.0)
+        # the third request exceeds the request budget: one request refills in 30s
+        self.assertAlmostEqual(limiter.acquire("gpt-4", 100), 30.0)
+        # the token budget is 600/min: 1000 tokens put it 400 into debt
+        self.assertAlmostEqual(limiter.acquire("claude", 1000), 40.0)
+        self.assertAlmostEqual(limiter.get_stats()["wait_seconds"], 70.0)
+
+    def test_retry_after_headers(self):
+        """Retry-After is read in seconds, milliseconds or as an HTTP date."""
+        self.assertEqual(
+            retry_after(_error(litellm.RateLimitError, 429, {"retry-after": "7"})), 7.0
+        )
+        self.assertEqual(
+            retry_after(_error(litellm.RateLimitError, 429, {"retry-after-ms": "1500"})), 1.5
+        )
+        date = retry_after(
+            _error(litellm.RateLimitError, 429, {"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        )
+        self.assertEqual(date, 0.0)
+        self.assertIsNone(retry_after(_error(litellm.RateLimitError, 429)))
+
+    def test_rate_limit_pauses_other_requests_to_the_same_model(self):
+        """After a 429 with Retry-After, concurrent requests to that model wait too."""
+        limiter = RateLimiter()
+        delay = limiter.backoff(
+            "gpt-4", 1, _error(litellm.RateLimitError, 429, {"retry-after": "20"})
+        )
+
+        self.assertEqual(delay, 20.0)
+        self.assertGreater(limiter.acquire("gpt-4", 10), 19.0)
+        self.assertEqual(limiter.acquire("claude", 10), 0.0)
+
+    def test_backoff_grows_exponentially_with_jitter(self):
+        """Without Retry-After, delays are drawn below a doubling cap."""
+        limiter = RateLimiter(base_delay=1.0, max_delay=5.0)
+        error = _error(litellm.InternalServerError, 500)
+        for attempt, cap in ((1, 1.0), (2, 2.0), (3, 4.0), (6, 5.0)):
+            self.assertLessEqual(limiter.backoff("gpt-4", attempt, error), cap)
+
+    def test_transient_errors(self):
+        """5xx responses and timeouts are retried, bad requests are not."""
+        self.assertTrue(is_transient(_error(litellm.InternalServerError, 500)))
+        self.assertTrue(is_transient(litellm.Timeout("slow", model="gpt-4", llm_provider="openai")))
+        self.assertFalse(
+            is_transient(litellm.BadRequestError("bad", model="gpt-4", llm_provider="openai"))
+        )
+
+
+class TestCompletionRetries(unittest.TestCase):
+    """Test cases for retrying completions through the limiter."""
+
+    @patch("manim_generator.utils.llm.get_rate_limiter", return_value=RateLimiter())
+    @patch("manim_generator.utils.llm.time.sleep")
+    @patch("manim_generator.utils.llm.completion")
+    def test_server_error_is_retried_after_retry_after(self, mock_completion, mock_sleep, _):
+        """A 503 is retried after the wait the provider asked for, which is reported."""
+        mock_response = MagicMock()
+        mock_response.__getitem__ = MagicMock(
+            side_effect=lambda key: {"choices": [{"message": {"content": "Test response"}}]}[key]
+        )
+        mock_completion.side_effect = [
+            _error(litellm.ServiceUnavailableError, 503, {"retry-after": "3"}),
+            mock_response,
+        ]
+
+        result = get_completion_with_retry(
+            model="gpt-4",
+            messages=[{"role": "user", "content": "Test"}],
+            temperature=0.5,
+            console=Console(),
+        )
+
+        self.assertEqual(result.content, "Test response")
+        mock_sleep.assert_called_once_with(3.0)
+        self.assertEqual(result.usage["rate_limit_wait"], 3.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
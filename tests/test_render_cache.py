@@ -0,0 +1,72 @@
+"""Tests for the scene render cache."""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from manim_generator.utils.render_cache import SceneRenderCache
+
+
+class TestSceneRenderCache(unittest.TestCase):
+    """Test cases for SceneRenderCache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, "cache")
+        self.clip = os.path.join(self.temp_dir, "Scene.mp4")
+        with open(self.clip, "wb") as f:
+            f.write(b"\0" * 1000)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_round_trip(self):
+        """A stored scene is returned with its clip, frames and logs."""
+        cache = SceneRenderCache(self.cache_dir, max_bytes=10_000_000)
+        key = cache.make_key("abc", {"quality": "-ql"})
+
+        self.assertIsNone(cache.get(key))
+        cache.put(key, self.clip, [("Scene", b"png-bytes")], "out", "err", 1.5)
+        hit = cache.get(key)
+
+        self.assertIsNotNone(hit)
+        if hit is not None:
+            self.assertEqual(hit.frames, [("Scene", b"png-bytes")])
+            self.assertEqual(hit.stdout, "out")
+            self.assertEqual(hit.stderr, "err")
+            self.assertTrue(hit.clip_path and os.path.exists(hit.clip_path))
+        self.assertEqual(cache.get_stats()["hits"], 1)
+        self.assertEqual(cache.get_stats()["misses"], 1)
+
+    def test_settings_change_key(self):
+        """Different render settings produce different keys."""
+        cache = SceneRenderCache(self.cache_dir, max_bytes=10_000_000)
+
+        self.assertNotEqual(
+            cache.make_key("abc", {"quality": "-ql"}),
+            cache.make_key("abc", {"quality": "-qh"}),
+        )
+
+    def test_least_recently_used_entries_are_evicted(self):
+        """Exceeding the size budget evicts the least recently used entry."""
+        cache = SceneRenderCache(self.cache_dir, max_bytes=2500)
+        cache.put("a" * 64, self.clip, [], "", "", 0.0)
+        time.sleep(0.02)
+        cache.put("b" * 64, self.clip, [], "", "", 0.0)
+        time.sleep(0.02)
+        cache.get("a" * 64)  # touch a so b becomes the oldest
+        time.sleep(0.02)
+        cache.put("c" * 64, self.clip, [], "", "", 0.0)
+
+        self.assertIsNotNone(cache.get("a" * 64))
+        self.assertIsNone(cache.get("b" * 64))
+        self.assertIsNotNone(cache.get("c" * 64))
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+"""Tests for the warm render worker utilities."""
+
+import os
+import sys
+import time
+import unittest
+from unittest.mock import patch
+
+from manim_generator.utils import render_worker
+from manim_generator.utils.render_worker import RenderJob, _run_job_in_child
+from manim_generator.utils.sandbox import ResourceLimits
+
+
+class TestRenderJob(unittest.TestCase):
+    """Test cases for RenderJob.to_cli_args."""
+
+    def test_single_scene_args(self):
+        """Test CLI arguments for a single scene render."""
+        job = RenderJob(script_file="out/video.py", scene="Intro", quality="-ql", media_dir="out")
+
+        self.assertEqual(job.to_cli_args(), ["-ql", "--media_dir", "out", "out/video.py", "Intro"])
+
+    def test_write_all_args(self):
+        """Test CLI arguments when rendering every scene."""
+        job = RenderJob(script_file="video.py", scene=None, quality="-qh", media_dir="media")
+
+        self.assertEqual(
+            job.to_cli_args(), ["-qh", "--media_dir", "media", "video.py", "--write_all"]
+        )
+
+
+@unittest.skipUnless(hasattr(os, "fork"), "warm workers require fork()")
+class TestRunJobInChild(unittest.TestCase):
+    """Test cases for rendering a job in a forked child."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.job = RenderJob(script_file="video.py", scene="Intro", quality="-ql", media_dir="out")
+
+    def test_captures_output_and_exit_code(self):
+        """The child's stdout, stderr and exit code are returned to the worker."""
+
+        def fake_cli(args):
+            print("rendering", " ".join(args))
+            print("warning", file=sys.stderr)
+            return 3
+
+        with patch("manim_generator.utils.render_worker._invoke_manim_cli", fake_cli):
+            stdout, stderr, returncode, timed_out, _, usage = _run_job_in_child(self.job)
+
+        self.assertIn("rendering -ql --media_dir out video.py Intro", stdout)
+        self.assertIn("warning", stderr)
+        self.assertEqual(returncode, 3)
+        self.assertFalse(timed_out)
+        self.assertIn("peak_rss_mb", usage)
+        self.assertIn("user_cpu_seconds", usage)
+
+    def test_child_is_killed_on_timeout(self):
+        """A hanging render is killed once the job timeout expires."""
+        self.job.timeout = 0.3
+
+        def hanging_cli(args):
+            time.sleep(30)
+            return 0
+
+        with patch("manim_generator.utils.render_worker._invoke_manim_cli", hanging_cli):
+            start = time.perf_counter()
+            _, _, returncode, timed_out, _, _ = _run_job_in_child(self.job)
+
+        self.assertTrue(timed_out)
+        self.assertNotEqual(returncode, 0)
+        self.assertLess(time.perf_counter() - start, 10)
+
+    def test_child_crash_is_isolated(self):
+        """An exception in the child is reported as a failed render."""
+
+        def crashing_cli(args):
+            raise RuntimeError("boom")
+
+        with patch("manim_generator.utils.render_worker._invoke_manim_cli", crashing_cli):
+            _, stderr, returncode, timed_out, _, _ = _run_job_in_child(self.job)
+
+        self.assertIn("boom", stderr)
+        self.assertEqual(returncode, 1)
+        self.assertFalse(timed_out)
+
+    def test_child_applies_resource_limits(self):
+        """The job's limits are set in the child, not in the worker."""
+        self.job.limits = ResourceLimits(max_open_files=64)
+
+        def report_limit(args):
+            import resource
+
+            print(resource.getrlimit(resource.RLIMIT_NOFILE)[0])
+            return 0
+
+        with patch("manim_generator.utils.render_worker._invoke_manim_cli", report_limit):
+            stdout, _, returncode, _, _, _ = _run_job_in_child(self.job)
+
+        self.assertEqual(returncode, 0)
+        self.assertEqual(stdout.strip(), "64")
+
+
+class _FakeWorker:
+    """Stands in for a worker process."""
+
+    def __init__(self, context):
+        self.ready = True
+
+    def stop(self):
+        pass
+
+
+class TestSharedRenderWorkerPool(unittest.TestCase):
+    """Test cases for the process-wide warm worker pool."""
+
+    def setUp(self):
+        """Start every test without a shared pool and with fake workers."""
+        render_worker.shutdown_render_worker_pool()
+        patcher = patch.object(render_worker, "_Worker", _FakeWorker)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(render_worker.shutdown_render_worker_pool)
+
+    def test_larger_request_grows_the_pool(self):
+        """A small first render does not cap the size of later renders."""
+        pool = render_worker.get_render_worker_pool(1)
+        self.assertEqual(pool.size, 1)
+
+        self.assertIs(render_worker.get_render_worker_pool(4), pool)
+        self.assertEqual(pool.size, 4)
+        self.assertEqual(pool._idle.qsize(), 4)
+
+        render_worker.get_render_worker_pool(2)
+        self.assertEqual(pool.size, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
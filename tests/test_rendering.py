@@ -1,14 +1,40 @@
 """Tests for the rendering utilities."""
 
+import json
+import os
+import shutil
+import tempfile
+import time
 import unittest
 from unittest.mock import MagicMock, patch
 
+import cv2
 import numpy as np
+from rich.console import Console
 
 from manim_generator.utils.rendering import (
+    SceneOutcome,
+    SceneRenderResult,
     calculate_scene_success_rate,
     extract_frames_from_video,
+    run_manim_multiscene,
 )
+from manim_generator.utils.review_clips import clip_set_key, find_clips
+
+MULTISCENE_CODE = """from manim import *
+
+class FirstScene(Scene):
+    def construct(self):
+        pass
+
+class SecondScene(Scene):
+    def construct(self):
+        pass
+
+class ThirdScene(Scene):
+    def construct(self):
+        pass
+"""
 
 
 class TestCalculateSceneSuccessRate(unittest.TestCase):
@@ -70,6 +96,325 @@ class TestCalculateSceneSuccessRate(unittest.TestCase):
         self.assertEqual(total, 0)
 
 
+class TestRunManimMultisceneParallel(unittest.TestCase):
+    """Test cases for concurrent scene rendering in run_manim_multiscene."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    @patch("manim_generator.utils.rendering._run_scene_command")
+    def test_results_keep_scene_order(self, mock_run_scene):
+        """Scenes finishing out of order still report logs and successes in script order."""
+        delays = {"FirstScene": 0.15, "SecondScene": 0.0, "ThirdScene": 0.05}
+
+        def fake_run(scene, command, scene_timeout, **_):
+            time.sleep(delays[scene])
+            return SceneRenderResult(
+                scene=scene,
+                stdout=f"out {scene}",
+                stderr="",
+                returncode=1 if scene == "SecondScene" else 0,
+                timed_out=False,
+                elapsed=delays[scene],
+            )
+
+        mock_run_scene.side_effect = fake_run
+
+        success, frames, logs, successful_scenes = run_manim_multiscene(
+            MULTISCENE_CODE,
+            Console(),
+            self.temp_dir,
+            headless=True,
+            render_workers=3,
+        )
+
+        self.assertFalse(success)
+        self.assertEqual(frames, [])
+        self.assertEqual(successful_scenes, ["FirstScene", "ThirdScene"])
+        self.assertLess(logs.index("<FirstScene>"), logs.index("<SecondScene>"))
+        self.assertLess(logs.index("<SecondScene>"), logs.index("<ThirdScene>"))
+        self.assertEqual(mock_run_scene.call_count, 3)
+
+    @patch("manim_generator.utils.rendering._run_scene_command")
+    def test_timeout_is_applied_per_scene(self, mock_run_scene):
+        """Every scene render receives the configured per-scene timeout."""
+        mock_run_scene.side_effect = lambda scene, command, scene_timeout, **_: SceneRenderResult(
+            scene=scene,
+            stdout="",
+            stderr="",
+            returncode=-9 if scene == "ThirdScene" else 0,
+            timed_out=scene == "ThirdScene",
+            elapsed=0.0,
+        )
+
+        success, _, logs, successful_scenes = run_manim_multiscene(
+            MULTISCENE_CODE,
+            Console(),
+            self.temp_dir,
+            headless=True,
+            scene_timeout=7,
+            render_workers=2,
+        )
+
+        self.assertFalse(success)
+        self.assertEqual(successful_scenes, ["FirstScene", "SecondScene"])
+        self.assertIn("<!> Scene ThirdScene timed out after 7 seconds", logs)
+        for call in mock_run_scene.call_args_list:
+            self.assertEqual(call.args[2], 7)
+
+    @patch("manim_generator.utils.rendering._extract_scene_frames")
+    @patch("manim_generator.utils.rendering._run_scene_command")
+    def test_render_profile_sets_flags_and_video_folder(self, mock_run_scene, mock_extract):
+        """Scenes render with the profile's flags and are found in its quality folder."""
+        videos_dir = os.path.join(self.temp_dir, "videos", "video", "240p10")
+
+        def fake_run(scene, command, scene_timeout, **_):
+            self.assertEqual(command[1:6], ["-ql", "-r", "426,240", "--fps", "10"])
+            os.makedirs(videos_dir, exist_ok=True)
+            with open(os.path.join(videos_dir, f"{scene}.mp4"), "wb") as f:
+                f.write(b"video")
+            return SceneRenderResult(scene, "", "", 0, False, 0.0)
+
+        mock_run_scene.side_effect = fake_run
+        mock_extract.side_effect = lambda scene, *args, **kwargs: [(scene, b"frame")]
+
+        success, frames, _, _ = run_manim_multiscene(
+            MULTISCENE_CODE, Console(), self.temp_dir, headless=True, render_profile="draft"
+        )
+
+        self.assertTrue(success)
+        self.assertEqual(
+            [frame.name for frame in frames], ["FirstScene", "SecondScene", "ThirdScene"]
+        )
+
+    @patch("manim_generator.utils.rendering._run_scene_command")
+    def test_time_scale_only_compresses_full_renders(self, mock_run_scene):
+        """The review script carries the time compression shim, validate runs do not."""
+        scripts = []
+
+        def fake_run(scene, command, scene_timeout, **_):
+            with open(command[-2], encoding="utf-8") as f:
+                scripts.append(f.read())
+            return SceneRenderResult(scene, "", "", 1, False, 0.0)
+
+        mock_run_scene.side_effect = fake_run
+
+        for execution_mode in ("full", "validate"):
+            run_manim_multiscene(
+                MULTISCENE_CODE,
+                Console(),
+                self.temp_dir,
+                headless=True,
+                execution_mode=execution_mode,
+                time_scale=0.25,
+            )
+
+        self.assertIn("install(0.25)", scripts[0])
+        self.assertNotIn("install(", scripts[-1])
+
+    @patch("manim_generator.utils.rendering._extract_scene_frames")
+    @patch("manim_generator.utils.rendering._run_scene_command")
+    def test_successful_clips_are_kept_for_promotion(self, mock_run_scene, mock_extract):
+        """With keep_clips, a fully successful execution keeps its clips under the code hash."""
+        videos_dir = os.path.join(self.temp_dir, "videos", "video", "1080p60")
+
+        def fake_run(scene, command, scene_timeout, **_):
+            os.makedirs(videos_dir, exist_ok=True)
+            with open(os.path.join(videos_dir, f"{scene}.mp4"), "wb") as f:
+                f.write(scene.encode())
+            return SceneRenderResult(scene, "", "", 0, False, 0.0)
+
+        mock_run_scene.side_effect = fake_run
+        mock_extract.return_value = []
+        outcomes = {}
+
+        run_manim_multiscene(
+            MULTISCENE_CODE,
+            Console(),
+            self.temp_dir,
+            headless=True,
+            outcomes=outcomes,
+            render_profile="final",
+            keep_clips=True,
+        )
+
+        scenes = ["FirstScene", "SecondScene", "ThirdScene"]
+        clips = find_clips(self.temp_dir, clip_set_key(MULTISCENE_CODE, "final"), scenes)
+        self.assertIsNotNone(clips)
+        self.assertEqual({scene: outcomes[scene].clip_path for scene in scenes}, clips)
+        self.assertEqual(os.listdir(videos_dir), [])
+
+
+class TestRunManimMultisceneReuse(unittest.TestCase):
+    """Test cases for carrying forward unchanged scene results."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    @patch("manim_generator.utils.rendering._run_scene_command")
+    def test_reused_scenes_are_not_rendered(self, mock_run_scene):
+        """Reused scenes keep their logs and frames and only the rest are rendered."""
+        mock_run_scene.side_effect = lambda scene, command, scene_timeout, **_: SceneRenderResult(
+            scene, f"out {scene}", "", 0, False, 0.0
+        )
+        reuse = {
+            "SecondScene": SceneOutcome(
+                SceneRenderResult("SecondScene", "previous out", "", 0, False, 1.0),
+                [("SecondScene", b"png")],
+            )
+        }
+        outcomes: dict = {}
+
+        success, frames, logs, successful_scenes = run_manim_multiscene(
+            MULTISCENE_CODE,
+            Console(),
+            self.temp_dir,
+            headless=True,
+            reuse=reuse,
+            outcomes=outcomes,
+        )
+
+        rendered = sorted(call.args[0] for call in mock_run_scene.call_args_list)
+        self.assertEqual(rendered, ["FirstScene", "ThirdScene"])
+        self.assertTrue(success)
+        self.assertEqual(successful_scenes, ["FirstScene", "SecondScene", "ThirdScene"])
+        self.assertIn("previous out", logs)
+        self.assertEqual(len(frames), 1)
+        self.assertEqual(list(outcomes), ["FirstScene", "SecondScene", "ThirdScene"])
+        self.assertEqual(outcomes["SecondScene"], reuse["SecondScene"])
+
+
+class TestRunManimMultiscenePreflight(unittest.TestCase):
+    """Test cases for pre-flight validation in run_manim_multiscene."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    @patch("manim_generator.utils.rendering._run_scene_command")
+    def test_invalid_scenes_are_not_rendered(self, mock_run_scene):
+        """Scenes failing pre-flight validation get a synthetic log and are skipped."""
+        mock_run_scene.side_effect = lambda scene, command, scene_timeout, **_: SceneRenderResult(
+            scene, "", "", 0, False, 0.0
+        )
+        code = MULTISCENE_CODE.replace(
+            "class SecondScene(Scene):\n    def construct(self):\n        pass",
+            "class SecondScene(Scene):\n    def construct(self):\n        config.quality = 'high'",
+        )
+
+        success, _, logs, successful_scenes = run_manim_multiscene(
+            code, Console(), self.temp_dir, headless=True
+        )
+
+        rendered = sorted(call.args[0] for call in mock_run_scene.call_args_list)
+        self.assertEqual(rendered, ["FirstScene", "ThirdScene"])
+        self.assertFalse(success)
+        self.assertEqual(successful_scenes, ["FirstScene", "ThirdScene"])
+        second_log = logs[logs.index("<SecondScene>") : logs.index("</SecondScene>")]
+        self.assertIn("Forbidden configuration change: `config.quality`", second_log)
+
+
+class TestRunManimMultisceneValidate(unittest.TestCase):
+    """Test cases for the validate-only execution mode."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    @patch("manim_generator.utils.rendering._run_scene_command")
+    def test_last_frames_replace_videos(self, mock_run_scene):
+        """Scenes run with -s and their last-frame stills are returned as frames."""
+        image_dir = os.path.join(self.temp_dir, "images", "video")
+
+        def fake_run(scene, command, scene_timeout, **_):
+            self.assertIn("-s", command)
+            os.makedirs(image_dir, exist_ok=True)
+            with open(os.path.join(image_dir, f"{scene}_ManimCE_v0.19.0.png"), "wb") as f:
+                f.write(scene.encode())
+            return SceneRenderResult(scene, "", "", 0, False, 0.0)
+
+        mock_run_scene.side_effect = fake_run
+
+        success, frames, _, successful_scenes = run_manim_multiscene(
+            MULTISCENE_CODE, Console(), self.temp_dir, headless=True, execution_mode="validate"
+        )
+
+        self.assertTrue(success)
+        self.assertEqual(len(frames), 3)
+        self.assertEqual(successful_scenes, ["FirstScene", "SecondScene", "ThirdScene"])
+        self.assertEqual(os.listdir(image_dir), [])
+
+
+class TestRunManimMultisceneBatch(unittest.TestCase):
+    """Test cases for the single-process batch render backend."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    @patch("manim_generator.utils.rendering._run_scene_command")
+    def test_driver_crash_is_attributed_and_remaining_scenes_fall_back(self, mock_run_scene):
+        """A driver crash fails the in-flight scene; unreached scenes render individually."""
+
+        def fake_run(scene, command, scene_timeout, **_):
+            if scene == "<batch>":
+                results_path = command[command.index("--results") + 1]
+                with open(results_path, "w", encoding="utf-8") as f:
+                    f.write(
+                        json.dumps(
+                            {
+                                "scene": "FirstScene",
+                                "stdout": "first ok",
+                                "stderr": "",
+                                "returncode": 0,
+                                "timed_out": False,
+                                "elapsed": 0.1,
+                            }
+                        )
+                        + "\n"
+                    )
+                return SceneRenderResult(scene, "", "Segmentation fault", -11, False, 0.2)
+            return SceneRenderResult(scene, f"out {scene}", "", 0, False, 0.1)
+
+        mock_run_scene.side_effect = fake_run
+
+        success, _, logs, successful_scenes = run_manim_multiscene(
+            MULTISCENE_CODE,
+            Console(),
+            self.temp_dir,
+            headless=True,
+            render_backend="batch",
+        )
+
+        self.assertFalse(success)
+        self.assertEqual(successful_scenes, ["FirstScene", "ThirdScene"])
+        self.assertIn("Batch render process exited while rendering SecondScene", logs)
+        rendered = [call.args[0] for call in mock_run_scene.call_args_list]
+        self.assertEqual(rendered, ["<batch>", "ThirdScene"])
+
+
 class TestExtractFramesFromVideo(unittest.TestCase):
     """Test cases for extract_frames_from_video function."""
 
@@ -79,7 +424,8 @@ class TestExtractFramesFromVideo(unittest.TestCase):
         mock_cap = MagicMock()
         mock_cap.isOpened.return_value = True
         mock_cap.get.return_value = 30
-        mock_cap.read.return_value = (True, np.zeros((100, 100, 3), dtype=np.uint8))
+        mock_cap.grab.return_value = True
+        mock_cap.retrieve.return_value = (True, np.zeros((100, 100, 3), dtype=np.uint8))
         mock_capture.return_value = mock_cap
 
         frames = extract_frames_from_video("test_video.mp4", mode="fixed_count", frame_count=3)
@@ -87,6 +433,10 @@ class TestExtractFramesFromVideo(unittest.TestCase):
         self.assertIsNotNone(frames)
         if frames is not None:
             self.assertEqual(len(frames), 3)
+        # one forward pass: every frame up to the last sample is grabbed, no seeking
+        self.assertEqual(mock_cap.grab.call_count, 30)
+        self.assertEqual(mock_cap.retrieve.call_count, 3)
+        mock_cap.set.assert_not_called()
         mock_cap.release.assert_called_once()
 
     @patch("manim_generator.utils.rendering.cv2.VideoCapture")
@@ -100,7 +450,8 @@ class TestExtractFramesFromVideo(unittest.TestCase):
         black_frame = np.zeros((100, 100, 3), dtype=np.uint8)
         white_frame = np.ones((100, 100, 3), dtype=np.uint8) * 255
 
-        mock_cap.read.side_effect = [(True, black_frame), (True, white_frame)]
+        mock_cap.grab.return_value = True
+        mock_cap.retrieve.side_effect = [(True, black_frame), (True, white_frame)]
         mock_capture.return_value = mock_cap
 
         frames = extract_frames_from_video("test_video.mp4", mode="highest_density", max_frames=2)
@@ -108,8 +459,31 @@ class TestExtractFramesFromVideo(unittest.TestCase):
         self.assertIsNotNone(frames)
         if frames is not None:
             self.assertEqual(len(frames), 1)
+            self.assertIs(frames[0], white_frame)
         mock_cap.release.assert_called_once()
 
+    def test_highest_density_on_encoded_video(self):
+        """The densest frame of a real encoded clip is found in one decode pass."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        video_path = os.path.join(temp_dir, "clip.mp4")
+        writer = cv2.VideoWriter(video_path, cv2.VideoWriter_fourcc(*"mp4v"), 15, (320, 240))
+        if not writer.isOpened():
+            self.skipTest("no mp4 encoder available")
+        for idx in range(30):
+            frame = np.zeros((240, 320, 3), dtype=np.uint8)
+            # the filled area grows until frame 20 and shrinks afterwards
+            width = 320 * min(idx, 40 - idx) // 20
+            frame[:, :width] = 255
+            writer.write(frame)
+        writer.release()
+
+        frames = extract_frames_from_video(video_path, mode="highest_density", max_frames=30)
+
+        self.assertIsNotNone(frames)
+        if frames is not None:
+            self.assertGreater(np.mean(frames[0] > 128), 0.95)
+
     @patch("manim_generator.utils.rendering.cv2.VideoCapture")
     def test_video_not_opened(self, mock_capture):
         """Test handling when video cannot be opened."""
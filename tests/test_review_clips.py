@@ -0,0 +1,53 @@
+"""Tests for keeping review clips for promotion to the final video."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from manim_generator.utils.review_clips import clip_set_key, find_clips, store_clips
+
+
+class TestReviewClips(unittest.TestCase):
+    """Test cases for storing and finding clip sets."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def _clip(self, name: str) -> str:
+        path = os.path.join(self.temp_dir, name)
+        with open(path, "wb") as f:
+            f.write(name.encode())
+        return path
+
+    def test_clips_are_found_only_for_the_same_code_and_profile(self):
+        """A clip set is keyed by the exact code and render profile."""
+        key = clip_set_key("code", "final")
+        store_clips(self.temp_dir, key, {"Intro": self._clip("intro.mp4")}, {})
+
+        self.assertIsNotNone(find_clips(self.temp_dir, key, ["Intro"]))
+        self.assertIsNone(find_clips(self.temp_dir, key, ["Intro", "Outro"]))
+        self.assertIsNone(find_clips(self.temp_dir, clip_set_key("code ", "final"), ["Intro"]))
+        self.assertIsNone(find_clips(self.temp_dir, clip_set_key("code", "review"), ["Intro"]))
+
+    def test_new_set_replaces_the_previous_one(self):
+        """Fresh clips are moved, clips of the previous set carried over before it is removed."""
+        first = store_clips(self.temp_dir, "first", {"Intro": self._clip("intro.mp4")}, {})
+        fresh = self._clip("outro.mp4")
+
+        second = store_clips(self.temp_dir, "second", {"Outro": fresh}, {"Intro": first["Intro"]})
+
+        self.assertFalse(os.path.exists(fresh))
+        self.assertIsNone(find_clips(self.temp_dir, "first", ["Intro"]))
+        self.assertEqual(find_clips(self.temp_dir, "second", ["Intro", "Outro"]), second)
+        with open(second["Intro"], "rb") as f:
+            self.assertEqual(f.read(), b"intro.mp4")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""Tests for the render sandbox."""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+from manim_generator.utils.rendering import _run_scene_command
+from manim_generator.utils.sandbox import ResourceLimits, is_supported, sandbox_command
+
+
+class TestResourceLimits(unittest.TestCase):
+    """Test cases for ResourceLimits."""
+
+    def test_cli_args_skip_unset_limits(self):
+        """Only limits that are set are passed to the wrapper."""
+        limits = ResourceLimits(max_memory_mb=512, max_open_files=64)
+
+        self.assertEqual(limits.to_cli_args(), ["--max-memory-mb", "512", "--max-open-files", "64"])
+
+    def test_scaled_cpu(self):
+        """The CPU budget is multiplied, other limits are kept."""
+        limits = ResourceLimits(max_memory_mb=512, max_cpu_seconds=10).scaled_cpu(3)
+
+        self.assertEqual(limits, ResourceLimits(512, 30, None))
+        self.assertIsNone(ResourceLimits().scaled_cpu(3).max_cpu_seconds)
+
+    def test_sandbox_command_wraps_command(self):
+        """The original command follows the wrapper arguments."""
+        command = sandbox_command(
+            ["manim", "video.py"], ResourceLimits(max_cpu_seconds=5), "u.json"
+        )
+
+        self.assertEqual(command[1:3], ["-m", "manim_generator.utils.sandbox"])
+        self.assertEqual(command[-3:], ["--", "manim", "video.py"])
+        self.assertIn("--max-cpu-seconds", command)
+
+
+@unittest.skipUnless(is_supported(), "resource limits require the resource module")
+class TestSandboxedSceneCommand(unittest.TestCase):
+    """Test cases for running scene commands under the sandbox."""
+
+    def test_usage_is_recorded(self):
+        """A sandboxed command reports its peak RSS and CPU time."""
+        command = [sys.executable, "-c", "print(sum(range(10**6)))"]
+
+        result = _run_scene_command("Intro", command, 30, resource_limits=ResourceLimits())
+
+        self.assertEqual(result.returncode, 0)
+        self.assertIn("499999500000", result.stdout)
+        self.assertGreater(result.usage["peak_rss_mb"], 0)
+        self.assertIn("user_cpu_seconds", result.usage)
+        self.assertIn("system_cpu_seconds", result.usage)
+        self.assertGreaterEqual(result.usage["wall_seconds"], 0)
+
+    def test_unsandboxed_command_has_no_usage(self):
+        """Usage is only measured for sandboxed commands."""
+        result = _run_scene_command("Intro", [sys.executable, "-c", "pass"], 30)
+
+        self.assertEqual(result.returncode, 0)
+        self.assertIsNone(result.usage)
+
+    def test_memory_limit_fails_render(self):
+        """A render allocating past the address space limit fails."""
+        command = [sys.executable, "-c", "data = bytearray(1024 * 1024 * 1024)"]
+
+        result = _run_scene_command(
+            "Intro", command, 30, resource_limits=ResourceLimits(max_memory_mb=256)
+        )
+
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn("MemoryError", result.stderr)
+
+    def test_timeout_kills_sandboxed_render(self):
+        """A timeout kills the render, not only the wrapper."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            marker = os.path.join(temp_dir, "finished")
+            command = [
+                sys.executable,
+                "-c",
+                f"import time; time.sleep(1); open({marker!r}, 'w').close()",
+            ]
+
+            result = _run_scene_command("Intro", command, 0.3, resource_limits=ResourceLimits())
+
+            self.assertTrue(result.timed_out)
+            time.sleep(1.5)
+            self.assertFalse(os.path.exists(marker))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+"""Tests for the scene dependency analysis utilities."""
+
+import ast
+import unittest
+
+from manim_generator.utils.scene_analysis import (
+    changed_scenes,
+    get_scene_dependencies,
+    scene_fingerprints,
+    scene_statements,
+)
+
+CODE = """from manim import *
+
+TITLE_SIZE = 48
+ACCENT = BLUE
+
+
+def make_title(text):
+    return Text(text, font_size=TITLE_SIZE)
+
+
+class Card(VGroup):
+    def __init__(self):
+        super().__init__(Square(color=ACCENT))
+
+
+class IntroScene(Scene):
+    def construct(self):
+        self.play(Write(make_title("Intro")))
+
+
+class CardScene(Scene):
+    def construct(self):
+        self.play(Create(Card()))
+"""
+
+
+class TestGetSceneDependencies(unittest.TestCase):
+    """Test cases for get_scene_dependencies."""
+
+    def test_transitive_dependencies(self):
+        """Scenes map to the helpers and constants they use, transitively."""
+        dependencies = get_scene_dependencies(CODE)
+
+        self.assertEqual(dependencies["IntroScene"], {"make_title", "TITLE_SIZE"})
+        self.assertEqual(dependencies["CardScene"], {"Card", "ACCENT"})
+
+    def test_syntax_error(self):
+        """Parsing errors are returned instead of raised."""
+        self.assertIsInstance(get_scene_dependencies("class Broken(Scene"), Exception)
+
+
+class TestSceneStatements(unittest.TestCase):
+    """Test cases for scene_statements."""
+
+    def test_shared_statements_and_dependencies_in_source_order(self):
+        """Only the statements the scenes need are returned, in the order of the script."""
+        tree = ast.parse(CODE)
+
+        statements = scene_statements(tree, ["IntroScene"])
+
+        self.assertEqual([node.lineno for node in statements], [1, 3, 7, 16])
+        self.assertEqual(scene_statements(tree, []), [tree.body[0]])
+
+
+class TestSceneFingerprints(unittest.TestCase):
+    """Test cases for scene_fingerprints."""
+
+    def test_formatting_changes_keep_fingerprints(self):
+        """Comments and whitespace do not change fingerprints."""
+        reformatted = CODE.replace("TITLE_SIZE = 48", "TITLE_SIZE   =   48  # heading size")
+
+        self.assertEqual(scene_fingerprints(CODE), scene_fingerprints(reformatted))
+
+    def test_unrelated_edit_only_changes_affected_scene(self):
+        """Editing a helper changes only the scenes depending on it."""
+        before = scene_fingerprints(CODE)
+        after = scene_fingerprints(CODE.replace("color=ACCENT", "color=RED"))
+
+        self.assertEqual(before["IntroScene"], after["IntroScene"])
+        self.assertNotEqual(before["CardScene"], after["CardScene"])
+
+    def test_shared_statement_changes_every_scene(self):
+        """Side-effecting module-level statements affect every scene."""
+        before = scene_fingerprints(CODE)
+        after = scene_fingerprints(CODE + "\nconfig.background_color = WHITE\n")
+
+        self.assertNotEqual(before["IntroScene"], after["IntroScene"])
+        self.assertNotEqual(before["CardScene"], after["CardScene"])
+
+
+class TestChangedScenes(unittest.TestCase):
+    """Test cases for changed_scenes."""
+
+    def test_only_affected_and_new_scenes_change(self):
+        """A helper edit and a new scene are reported; untouched scenes are not."""
+        revision = CODE.replace('"Intro"', '"Welcome"') + (
+            "\n\nclass OutroScene(Scene):\n    def construct(self):\n        pass\n"
+        )
+
+        self.assertEqual(changed_scenes(CODE, revision), ["IntroScene", "OutroScene"])
+
+    def test_unparseable_revision(self):
+        """Parsing failures return None so every scene is re-rendered."""
+        self.assertIsNone(changed_scenes(CODE, "class Broken(Scene"))
+
+
+if __name__ == "__main__":
+    unittest.main()
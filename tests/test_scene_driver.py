@@ -0,0 +1,157 @@
+"""Tests for the single-process scene driver."""
+
+import contextlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import types
+import unittest
+from unittest.mock import patch
+
+from manim_generator.utils import rendering, scene_driver
+from manim_generator.utils.profiles import RENDER_PROFILES
+from manim_generator.utils.rendering import SceneRenderResult
+from manim_generator.utils.scene_driver import render_scenes
+
+SCRIPT = """import sys
+import time
+import types
+
+
+class GoodScene:
+    def render(self):
+        self.renderer = types.SimpleNamespace(num_plays=2)
+        print("rendered good")
+
+
+class BrokenScene:
+    def render(self):
+        raise ValueError("broken construct")
+
+
+class SlowScene:
+    def render(self):
+        time.sleep(30)
+"""
+
+
+def _fake_manim() -> types.ModuleType:
+    """Build a stand-in for the manim module exposing config and tempconfig."""
+    module = types.ModuleType("manim")
+    module.config = types.SimpleNamespace()
+    module.tempconfig = lambda overrides: contextlib.nullcontext()
+    return module
+
+
+class TestRenderScenes(unittest.TestCase):
+    """Test cases for render_scenes."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.script = os.path.join(self.temp_dir, "driver_video.py")
+        with open(self.script, "w", encoding="utf-8") as f:
+            f.write(SCRIPT)
+        self.results = os.path.join(self.temp_dir, "results.jsonl")
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        sys.modules.pop("driver_video", None)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _read_results(self) -> dict[str, dict]:
+        with open(self.results, encoding="utf-8") as f:
+            return {entry["scene"]: entry for entry in map(json.loads, f)}
+
+    @patch.dict(sys.modules, {"manim": _fake_manim()})
+    def test_results_are_attributed_per_scene(self):
+        """Each scene gets its own output, exit status and timing."""
+        exit_code = render_scenes(
+            self.script, ["GoodScene", "BrokenScene"], "-ql", self.temp_dir, self.results
+        )
+
+        results = self._read_results()
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(results["GoodScene"]["returncode"], 0)
+        self.assertIn("rendered good", results["GoodScene"]["stdout"])
+        self.assertNotIn("broken construct", results["GoodScene"]["stderr"])
+        self.assertEqual(results["BrokenScene"]["returncode"], 1)
+        self.assertIn("broken construct", results["BrokenScene"]["stderr"])
+        self.assertGreaterEqual(results["GoodScene"]["elapsed"], 0.0)
+        self.assertEqual(results["GoodScene"]["animations"], 2)
+        self.assertIsNone(results["BrokenScene"]["animations"])
+
+    def test_batch_render_command_is_accepted_by_the_driver(self):
+        """The argv built by _render_batch parses and renders every scene in one driver run."""
+        manim = _fake_manim()
+        commands = []
+
+        def run_driver_in_process(scene, command, scene_timeout, **_):
+            # command is [python, "-m", "manim_generator.utils.scene_driver", *argv]
+            commands.append(command)
+            returncode = scene_driver.main(command[3:])
+            return SceneRenderResult(scene, "", "", returncode, False, 0.0)
+
+        with (
+            patch.dict(sys.modules, {"manim": manim}),
+            patch.object(rendering, "_run_scene_command", run_driver_in_process),
+        ):
+            results = rendering._render_batch(
+                self.script,
+                ["GoodScene", "BrokenScene"],
+                self.temp_dir,
+                {},
+                None,
+                1,
+                [],
+                profile=RENDER_PROFILES["draft"],
+            )
+
+        self.assertEqual(len(commands), 1)
+        self.assertEqual([result.returncode for result in results], [0, 1])
+        self.assertIn("broken construct", results[1].stderr)
+        self.assertNotIn("Batch render process exited", results[1].stderr)
+        self.assertEqual(manim.config.quality, "low_quality")
+        self.assertEqual(manim.config.frame_rate, 10)
+
+    def test_resolution_and_fps_override_quality(self):
+        """Profile overrides are applied on top of the quality preset."""
+        manim = _fake_manim()
+        with patch.dict(sys.modules, {"manim": manim}):
+            render_scenes(
+                self.script,
+                ["GoodScene"],
+                "-ql",
+                self.temp_dir,
+                self.results,
+                resolution=(426, 240),
+                fps=10,
+            )
+
+        self.assertEqual(manim.config.quality, "low_quality")
+        self.assertEqual((manim.config.pixel_width, manim.config.pixel_height), (426, 240))
+        self.assertEqual(manim.config.frame_rate, 10)
+
+    @unittest.skipUnless(hasattr(__import__("signal"), "setitimer"), "requires SIGALRM")
+    @patch.dict(sys.modules, {"manim": _fake_manim()})
+    def test_scene_timeout(self):
+        """A scene exceeding the timeout is stopped and later scenes still render."""
+        render_scenes(
+            self.script,
+            ["SlowScene", "GoodScene"],
+            "-ql",
+            self.temp_dir,
+            self.results,
+            timeout=0.2,
+        )
+
+        results = self._read_results()
+        self.assertTrue(results["SlowScene"]["timed_out"])
+        self.assertEqual(results["SlowScene"]["returncode"], 1)
+        self.assertEqual(results["GoodScene"]["returncode"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
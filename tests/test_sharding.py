@@ -0,0 +1,124 @@
+"""Tests for splitting long scenes into animation ranges."""
+
+import contextlib
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import types
+import unittest
+from unittest.mock import patch
+
+from manim_generator.utils import scene_driver
+from manim_generator.utils.sharding import count_scene_animations, plan_shards, shard_args
+
+SCRIPT = """import types
+
+
+class GoodScene:
+    def render(self):
+        self.renderer = types.SimpleNamespace(num_plays=2)
+
+
+class BrokenScene:
+    def render(self):
+        raise ValueError("broken construct")
+"""
+
+
+def _fake_manim() -> types.ModuleType:
+    """Build a stand-in for the manim module exposing config and tempconfig."""
+    module = types.ModuleType("manim")
+    module.config = types.SimpleNamespace()
+    module.tempconfig = lambda overrides: contextlib.nullcontext()
+    return module
+
+
+class TestPlanShards(unittest.TestCase):
+    """Test cases for plan_shards."""
+
+    def test_dominant_scene_is_split_across_workers(self):
+        """A scene holding most animations is split into contiguous ranges."""
+        plans = plan_shards({"Intro": 4, "Long": 60, "Outro": 4}, workers=4)
+
+        self.assertEqual(list(plans), ["Long"])
+        self.assertEqual(plans["Long"], [(0, 14), (15, 29), (30, 44), (45, None)])
+
+    def test_ranges_cover_every_animation_once(self):
+        """Ranges are contiguous and the last one runs to the end of the scene."""
+        ranges = plan_shards({"Long": 53}, workers=3)["Long"]
+
+        self.assertEqual(ranges[0][0], 0)
+        for (_, last), (first, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(first, last + 1)
+        self.assertIsNone(ranges[-1][1])
+
+    def test_short_scenes_are_not_split(self):
+        """Scenes are never cut below the minimum shard size."""
+        self.assertEqual(plan_shards({"A": 10, "B": 6}, workers=8), {})
+        self.assertEqual(len(plan_shards({"A": 24}, workers=8)["A"]), 3)
+
+    def test_single_worker_disables_sharding(self):
+        """Without parallelism there is nothing to gain from shards."""
+        self.assertEqual(plan_shards({"Long": 100}, workers=1), {})
+        self.assertEqual(plan_shards({}, workers=4), {})
+
+
+class TestShardArgs(unittest.TestCase):
+    """Test cases for shard_args."""
+
+    def test_bounded_and_open_ranges(self):
+        """Bounded ranges pass both ends, the last range only its start."""
+        self.assertEqual(shard_args(0, 14), ["-n", "0,14"])
+        self.assertEqual(shard_args(45, None), ["-n", "45"])
+
+
+def _run_driver_in_process(command: list[str], **_) -> subprocess.CompletedProcess:
+    """Run a scene driver command line through the real driver parser, in this process."""
+    stderr = io.StringIO()
+    with contextlib.redirect_stderr(stderr):
+        try:
+            returncode = scene_driver.main(command[3:])
+        except SystemExit as e:
+            returncode = e.code
+    return subprocess.CompletedProcess(command, returncode, "", stderr.getvalue())
+
+
+@patch.dict(sys.modules, {"manim": _fake_manim()})
+@patch("manim_generator.utils.sharding.subprocess.run", side_effect=_run_driver_in_process)
+class TestCountSceneAnimations(unittest.TestCase):
+    """Test cases for count_scene_animations."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.script = os.path.join(self.temp_dir, "count_video.py")
+        with open(self.script, "w", encoding="utf-8") as f:
+            f.write(SCRIPT)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        sys.modules.pop("count_video", None)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_counts_come_from_the_driver(self, _run):
+        """The count pass command is accepted by the driver and yields each scene's count."""
+        counts = count_scene_animations(self.script, ["GoodScene"], self.temp_dir)
+
+        self.assertEqual(counts, {"GoodScene": 2})
+
+    def test_failed_scenes_are_reported(self, _run):
+        """Scenes the pass could not count are logged rather than dropped silently."""
+        with self.assertLogs("manim_generator.utils.sharding", level="WARNING") as logs:
+            counts = count_scene_animations(
+                self.script, ["GoodScene", "BrokenScene"], self.temp_dir
+            )
+
+        self.assertEqual(counts, {"GoodScene": 2})
+        self.assertIn("BrokenScene", logs.output[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,203 @@
+"""Tests for speculative final renders."""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from rich.console import Console
+
+from manim_generator.utils import speculative
+from manim_generator.utils.speculative import SpeculativeRender
+from manim_generator.workflow import ManimWorkflow
+
+# stands in for the render: sleeps for argv[2] seconds, then writes the final video
+FAKE_RENDER = (
+    "import os, sys, time; time.sleep(float(sys.argv[2])); "
+    "open(os.path.join(sys.argv[1], 'final_video.mp4'), 'wb').write(b'video')"
+)
+
+
+class TestSpeculativeRender(unittest.TestCase):
+    """Test cases for starting, superseding and collecting background renders."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.delays = {}
+        patcher = patch.object(SpeculativeRender, "_command", self._fake_command)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        speculative._stop_all()
+        shutil.rmtree(self.temp_dir)
+
+    def _fake_command(self, job_dir):
+        """Fake render command; the delay is looked up by the script in job_dir."""
+        with open(os.path.join(job_dir, speculative.SCRIPT_NAME), encoding="utf-8") as f:
+            delay = self.delays[f.read()]
+        return [sys.executable, "-c", FAKE_RENDER, job_dir, str(delay)]
+
+    def test_result_waits_for_the_render_of_the_same_code(self):
+        """The finished video of the working code is picked up."""
+        self.delays["code"] = 0.2
+        render = SpeculativeRender(self.temp_dir)
+
+        self.assertTrue(render.start("code"))
+        self.assertFalse(render.start("code"))
+        video_path = render.result("code")
+
+        with open(video_path, "rb") as f:
+            self.assertEqual(f.read(), b"video")
+        render.cancel()
+        self.assertFalse(os.path.exists(os.path.dirname(video_path)))
+
+    def test_newer_code_cancels_the_running_render(self):
+        """A superseded render is killed and its directory removed."""
+        self.delays.update(old=60, new=0)
+        render = SpeculativeRender(self.temp_dir)
+
+        render.start("old")
+        old_job = render._job
+        render.start("new")
+
+        self.assertIsNotNone(old_job.process.poll())
+        self.assertFalse(os.path.exists(old_job.directory))
+        self.assertIsNone(render.result("old"))
+        self.assertIsNone(render._job)
+
+    def test_failed_render_gives_no_video(self):
+        """A render that exits without a video falls back to rendering again."""
+        render = SpeculativeRender(self.temp_dir)
+        with patch.object(
+            SpeculativeRender, "_command", lambda _, job_dir: [sys.executable, "-c", "exit(1)"]
+        ):
+            render.start("code")
+
+        self.assertIsNone(render.result("code"))
+
+    @unittest.skipUnless(hasattr(os, "killpg"), "process groups are POSIX only")
+    def test_cancel_stops_sandboxed_renders(self):
+        """Sandboxed renders run in sessions of their own and are stopped as well."""
+        pid_file = os.path.join(self.temp_dir, "scene.pid")
+        scene = (
+            "import os, sys, time; "
+            "open(sys.argv[1] + '.tmp', 'w').write(str(os.getpid())); "
+            "os.replace(sys.argv[1] + '.tmp', sys.argv[1]); time.sleep(60)"
+        )
+        # stands in for speculative.main rendering one scene in the sandbox
+        background_render = (
+            "import signal, sys; "
+            "from manim_generator.utils import rendering, speculative; "
+            "from manim_generator.utils.sandbox import ResourceLimits; "
+            "signal.signal(signal.SIGTERM, speculative._handle_sigterm); "
+            "rendering._run_scene_command("
+            f"'A', [sys.executable, '-c', {scene!r}, {pid_file!r}], None, ResourceLimits())"
+        )
+        package_dir = os.path.dirname(os.path.dirname(speculative.__file__))
+        render = SpeculativeRender(self.temp_dir)
+        with (
+            patch.object(
+                SpeculativeRender,
+                "_command",
+                lambda _, job_dir: [sys.executable, "-c", background_render],
+            ),
+            patch.dict(os.environ, {"PYTHONPATH": os.path.dirname(package_dir)}),
+        ):
+            render.start("code")
+
+        deadline = time.monotonic() + 30
+        while not os.path.exists(pid_file) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        with open(pid_file, encoding="utf-8") as f:
+            scene_pid = int(f.read())
+        render.cancel()
+
+        deadline = time.monotonic() + 10
+        while _is_running(scene_pid) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertFalse(_is_running(scene_pid))
+
+
+def _is_running(pid: int) -> bool:
+    """Whether a process exists and has not exited (zombies count as exited)."""
+    try:
+        with open(f"/proc/{pid}/stat", encoding="utf-8") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+    except OSError:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        return True
+
+
+class TestWorkflowSpeculativeRender(unittest.TestCase):
+    """Test cases for the workflow side of speculative renders."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config = {
+            "manim_model": "gpt-4",
+            "review_model": "gpt-4",
+            "output_dir": self.temp_dir,
+            "review_cycles": 1,
+            "success_threshold": 80.0,
+            "headless": False,
+            "manim_logs": False,
+            "speculative_render": True,
+        }
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    @patch("manim_generator.workflow.check_and_register_models")
+    @patch("manim_generator.workflow.run_manim_multiscene")
+    def test_successful_executions_start_the_final_render(self, mock_run, mock_check):
+        """Only fully successful executions start a background render."""
+        code = "from manim import *\n\nclass A(Scene):\n    pass\n"
+        workflow = ManimWorkflow(config=self.config, console=Console())
+
+        with patch.object(workflow.speculative_render, "start") as mock_start:
+            mock_run.return_value = (False, [], "error", [])
+            workflow.execute_code(code, "Initial")
+            mock_start.assert_not_called()
+
+            mock_run.return_value = (True, [], "", ["A"])
+            workflow.execute_code(code, "Revision 1")
+            mock_start.assert_called_once_with(code)
+
+            # promoted review clips make the final render unnecessary
+            workflow.config["review_profile"] = workflow.config["final_profile"] = "final"
+            workflow.execute_code(code, "Revision 2")
+            mock_start.assert_called_once()
+
+    @patch("manim_generator.workflow.check_and_register_models")
+    def test_speculative_video_becomes_the_final_video(self, mock_check):
+        """The rendered video is moved to the usual final video path."""
+        workflow = ManimWorkflow(config=self.config, console=Console())
+        rendered = os.path.join(self.temp_dir, "rendered.mp4")
+        with open(rendered, "wb") as f:
+            f.write(b"video")
+
+        with patch.object(workflow.speculative_render, "result", return_value=rendered):
+            video_path = workflow.speculative_video("code")
+
+        self.assertEqual(
+            video_path, os.path.join(os.path.abspath(self.temp_dir), "final_video.mp4")
+        )
+        self.assertTrue(os.path.exists(video_path))
+        self.assertFalse(os.path.exists(rendered))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""Tests for parallel LaTeX pre-compilation."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from manim_generator.utils.asset_cache import AssetCache
+from manim_generator.utils.tex_precompile import (
+    PrecompileReport,
+    TexJob,
+    find_tex_jobs,
+    precompile_scenes,
+    precompile_tex,
+)
+
+SCRIPT = r"""from manim import *
+
+TITLE = Tex("Euler")
+
+
+def formula():
+    return MathTex(r"e^{i\pi}", "+", "1", "=", "0", tex_to_color_map={"e": BLUE})
+
+
+class Intro(Scene):
+    def construct(self):
+        self.add(TITLE, formula())
+        self.add(Tex("Hello", tex_template=TexTemplateLibrary.ctex))
+
+
+class Outro(Scene):
+    def construct(self):
+        for n in range(3):
+            self.add(MathTex(f"x^{n}"))
+        self.add(MathTex(r"\sum", substrings_to_isolate=["x"]), Tex("Euler"))
+"""
+
+
+class TestTexPrecompile(unittest.TestCase):
+    """Test cases for finding and scheduling Tex strings."""
+
+    def test_literal_tex_calls_of_the_scenes_are_collected(self):
+        """Computed strings are skipped and arguments that change LaTeX are kept."""
+        intro = find_tex_jobs(SCRIPT, ["Intro"])
+        outro = find_tex_jobs(SCRIPT, ["Outro"])
+
+        self.assertEqual(
+            intro,
+            [
+                TexJob("Tex", ("Euler",)),
+                TexJob(
+                    "MathTex",
+                    (r"e^{i\pi}", "+", "1", "=", "0"),
+                    (("tex_to_color_map", ("e",)),),
+                ),
+                TexJob("Tex", ("Hello",), (), "ctex"),
+            ],
+        )
+        self.assertEqual(
+            outro,
+            [
+                TexJob("MathTex", (r"\sum",), (("substrings_to_isolate", ("x",)),)),
+                TexJob("Tex", ("Euler",)),
+            ],
+        )
+        self.assertEqual(len(find_tex_jobs(SCRIPT)), 4)
+        self.assertEqual(find_tex_jobs("class Broken(Scene"), [])
+
+    @patch("manim_generator.utils.tex_precompile.precompile_tex")
+    def test_jobs_are_compiled_once_per_cache(self, mock_precompile):
+        """Later executions only pre-compile Tex strings that are new."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        cache = AssetCache(os.path.join(temp_dir, "cache"), 1024 * 1024)
+        run = cache.start_run()
+        mock_precompile.side_effect = lambda jobs, *_: PrecompileReport(3, 3, 1.5, 0.8, jobs)
+
+        report = precompile_scenes(SCRIPT, ["Intro"], cache, run, 4, temp_dir)
+        self.assertEqual(report.latex_seconds, 1.5)
+        precompile_scenes(SCRIPT, ["Intro", "Outro"], cache, run, 4, temp_dir)
+
+        self.assertEqual(len(mock_precompile.call_args_list[0].args[0]), 3)
+        self.assertEqual(
+            mock_precompile.call_args_list[1].args[0],
+            [TexJob("MathTex", (r"\sum",), (("substrings_to_isolate", ("x",)),))],
+        )
+        self.assertIsNone(precompile_scenes(SCRIPT, ["Outro"], cache, run, 4, temp_dir))
+
+    @patch("manim_generator.utils.tex_precompile.precompile_tex")
+    def test_failed_jobs_are_compiled_again(self, mock_precompile):
+        """Tex strings that did not build are not recorded as pre-compiled."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        cache = AssetCache(os.path.join(temp_dir, "cache"), 1024 * 1024)
+        run = cache.start_run()
+        mock_precompile.side_effect = lambda jobs, *_: PrecompileReport(3, 2, 1.0, 0.8, jobs[1:])
+
+        precompile_scenes(SCRIPT, ["Intro"], cache, run, 4, temp_dir)
+        precompile_scenes(SCRIPT, ["Intro"], cache, run, 4, temp_dir)
+
+        first_jobs = mock_precompile.call_args_list[0].args[0]
+        self.assertEqual(mock_precompile.call_args_list[1].args[0], first_jobs[:1])
+
+    @patch(
+        "manim_generator.utils.tex_precompile.ProcessPoolExecutor",
+        side_effect=OSError("no processes"),
+    )
+    def test_pool_failure_builds_nothing(self, _executor):
+        """A pass whose pool failed reports no built jobs."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        run = AssetCache(os.path.join(temp_dir, "cache"), 1024 * 1024).start_run()
+
+        with self.assertLogs("manim_generator.utils.tex_precompile", level="WARNING"):
+            report = precompile_tex(find_tex_jobs(SCRIPT, ["Intro"]), run, 4, temp_dir)
+
+        self.assertEqual(report.jobs, 3)
+        self.assertEqual(report.built, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
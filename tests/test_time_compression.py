@@ -0,0 +1,68 @@
+"""Tests for time-compressed review renders."""
+
+import sys
+import types
+import unittest
+from unittest.mock import patch
+
+from manim_generator.utils import time_compression
+from manim_generator.utils.time_compression import compress_code, strip_compression
+
+SCRIPT = """from manim import *
+
+class Intro(Scene):
+    def construct(self):
+        self.played = self.compile_animations(2.0, 0.1)
+"""
+
+
+class _FakeAnimation:
+    def __init__(self, run_time):
+        self.run_time = run_time
+
+
+class _FakeScene:
+    def compile_animations(self, *run_times, **kwargs):
+        return [_FakeAnimation(run_time) for run_time in run_times]
+
+
+def _fake_manim() -> types.ModuleType:
+    """Build a stand-in for the manim module exposing Scene and config."""
+    module = types.ModuleType("manim")
+    module.Scene = type("Scene", (_FakeScene,), {})
+    module.config = types.SimpleNamespace(frame_rate=15)
+    module.__all__ = ["Scene", "config"]
+    return module
+
+
+class TestTimeCompression(unittest.TestCase):
+    """Test cases for compress_code and the installed shim."""
+
+    def test_shim_is_appended_after_the_original_lines(self):
+        """Line numbers of the reviewed code are unchanged and scale 1 is a no-op."""
+        compressed = compress_code(SCRIPT, 0.25)
+
+        self.assertTrue(compressed.startswith(SCRIPT.rstrip()))
+        self.assertIn("install(0.25)", compressed.splitlines()[-1])
+        compile(compressed, "video.py", "exec")
+        self.assertEqual(compress_code(SCRIPT, 1.0), SCRIPT)
+        self.assertEqual(strip_compression(compressed), SCRIPT)
+
+    @patch.object(time_compression, "_installed", False)
+    @patch.object(time_compression, "_time_scale", 1.0)
+    def test_run_times_are_scaled_down_to_one_frame(self):
+        """Importing the compressed script scales every animation it plays."""
+        manim = _fake_manim()
+        namespace: dict = {}
+        with patch.dict(sys.modules, {"manim": manim}):
+            exec(compile(compress_code(SCRIPT, 0.25), "video.py", "exec"), namespace)
+            scene = namespace["Intro"]()
+            scene.construct()
+
+        run_times = [animation.run_time for animation in scene.played]
+        self.assertEqual(run_times[0], 0.5)
+        self.assertAlmostEqual(run_times[1], 1 / 15)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -64,6 +64,17 @@ class TestTokenUsageTracker(unittest.TestCase):
         self.assertIn("total_tokens", data)
         self.assertIn("total_cost", data)
 
+    def test_cached_prompt_tokens_are_totalled(self):
+        """Prompt tokens read from the provider's prompt cache add up across steps."""
+        usage_info = {"prompt_tokens": 2000, "total_tokens": 2100, "cached_prompt_tokens": 1500}
+
+        self.tracker.add_step("Code Revision 1", "claude", usage_info)
+        self.tracker.add_step("Initial Code Generation", "claude", {"prompt_tokens": 2000})
+
+        data = self.tracker.get_tracking_data()
+        self.assertEqual(data["total_cached_prompt_tokens"], 1500)
+        self.assertEqual(data["steps"][1]["cached_prompt_tokens"], 0)
+
 
 class TestFormatDuration(unittest.TestCase):
     """Test cases for format_duration function."""
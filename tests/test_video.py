@@ -0,0 +1,271 @@
+"""Tests for the final video rendering utilities."""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from manim_generator.utils.media_info import VideoInfo
+from manim_generator.utils.rendering import SceneRenderResult
+from manim_generator.utils.video import (
+    DurationPlan,
+    _concat_videos,
+    adjust_video_duration,
+    build_duration_command,
+    plan_duration_adjustment,
+    render_and_concat,
+)
+
+SCRIPT = """from manim import *
+
+class FirstScene(Scene):
+    def construct(self):
+        pass
+
+class SecondScene(Scene):
+    def construct(self):
+        pass
+
+class ThirdScene(Scene):
+    def construct(self):
+        pass
+"""
+
+
+class TestRenderAndConcat(unittest.TestCase):
+    """Test cases for the parallel final render."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.script_file = os.path.join(self.temp_dir, "video.py")
+        with open(self.script_file, "w", encoding="utf-8") as f:
+            f.write(SCRIPT)
+        self.videos_dir = os.path.join(self.temp_dir, "videos", "video", "1080p60")
+        os.makedirs(self.videos_dir)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def _fake_render(self, failing=(), delays=None):
+        """Build a fake scene render writing the scene's 1080p60 video."""
+        concurrent = {"now": 0, "max": 0}
+        lock = threading.Lock()
+
+        def fake_run(scene, command, scene_timeout, **_):
+            with lock:
+                concurrent["now"] += 1
+                concurrent["max"] = max(concurrent["max"], concurrent["now"])
+            time.sleep((delays or {}).get(scene, 0.05))
+            with lock:
+                concurrent["now"] -= 1
+            self.assertIn("-qh", command)
+            self.assertEqual(command[-1], scene)
+            if scene in failing:
+                return SceneRenderResult(scene, "", f"{scene} exploded", 1, False, 0.1)
+            media_dir = command[command.index("--media_dir") + 1]
+            videos_dir = os.path.join(media_dir, "videos", "video", "1080p60")
+            os.makedirs(videos_dir, exist_ok=True)
+            with open(os.path.join(videos_dir, f"{scene}.mp4"), "wb") as f:
+                f.write(" ".join(command).encode())
+            return SceneRenderResult(scene, "ok", "", 0, False, 0.1)
+
+        return fake_run, concurrent
+
+    @patch("manim_generator.utils.video.subprocess.run")
+    @patch("manim_generator.utils.video.subprocess.Popen")
+    @patch("manim_generator.utils.video._run_scene_command")
+    def test_scenes_render_in_parallel_and_concat_in_order(
+        self, mock_run_scene, mock_popen, mock_run
+    ):
+        """Scenes render concurrently and are concatenated in script order."""
+        fake_run, concurrent = self._fake_render(
+            delays={"FirstScene": 0.3, "SecondScene": 0.1, "ThirdScene": 0.1}
+        )
+        mock_run_scene.side_effect = fake_run
+        concat_lists = []
+
+        def fake_ffmpeg(command, **kwargs):
+            with open(command[command.index("-i") + 1], encoding="utf-8") as f:
+                concat_lists.append(f.read())
+            process = MagicMock()
+            process.stdout.readline.return_value = ""
+            process.poll.return_value = 0
+            process.returncode = 0
+            return process
+
+        mock_popen.side_effect = fake_ffmpeg
+
+        output = render_and_concat(self.script_file, self.temp_dir, "final.mp4", render_workers=3)
+
+        self.assertEqual(output, os.path.abspath(os.path.join(self.temp_dir, "final.mp4")))
+        self.assertEqual(concurrent["max"], 3)
+        scenes = [line.split("/")[-1].rstrip("'") for line in concat_lists[0].splitlines()]
+        self.assertEqual(scenes, ["FirstScene.mp4", "SecondScene.mp4", "ThirdScene.mp4"])
+
+    @patch("manim_generator.utils.video.subprocess.Popen")
+    @patch("manim_generator.utils.video._run_scene_command")
+    def test_worker_bound_is_respected(self, mock_run_scene, mock_popen):
+        """No more scenes than render_workers render at once."""
+        fake_run, concurrent = self._fake_render(failing={"ThirdScene"})
+        mock_run_scene.side_effect = fake_run
+
+        render_and_concat(self.script_file, self.temp_dir, "final.mp4", render_workers=1)
+
+        self.assertEqual(concurrent["max"], 1)
+        self.assertEqual(mock_run_scene.call_count, 3)
+
+    @patch("manim_generator.utils.video.subprocess.Popen")
+    @patch("manim_generator.utils.video._run_scene_command")
+    def test_failed_scenes_are_reported_and_skip_concat(self, mock_run_scene, mock_popen):
+        """A failed scene aborts the concat and is reported with its error output."""
+        fake_run, _ = self._fake_render(failing={"SecondScene"})
+        mock_run_scene.side_effect = fake_run
+
+        with self.assertLogs("manim_generator.utils.video", level="ERROR") as logs:
+            output = render_and_concat(self.script_file, self.temp_dir, "final.mp4")
+
+        self.assertIsNone(output)
+        mock_popen.assert_not_called()
+        report = "\n".join(logs.output)
+        self.assertIn("SecondScene exploded", report)
+        self.assertIn("1 of 3 scene(s): SecondScene", report)
+
+    @patch("manim_generator.utils.video.subprocess.run")
+    @patch("manim_generator.utils.video.subprocess.Popen")
+    @patch("manim_generator.utils.video._run_scene_command")
+    @patch("manim_generator.utils.video.count_scene_animations")
+    def test_long_scene_is_sharded_and_stitched(
+        self, mock_count, mock_run_scene, mock_popen, mock_run
+    ):
+        """A dominant scene renders as animation ranges that are stitched in order."""
+        mock_count.return_value = {"FirstScene": 2, "SecondScene": 40, "ThirdScene": 2}
+        fake_run, _ = self._fake_render()
+        mock_run_scene.side_effect = fake_run
+        concat_lists = {}
+
+        def fake_ffmpeg(command, **kwargs):
+            with open(command[command.index("-i") + 1], encoding="utf-8") as f:
+                concat_lists[os.path.basename(command[-1])] = f.read().splitlines()
+            with open(command[-1], "wb") as f:
+                f.write(b"stitched")
+            process = MagicMock()
+            process.stdout.readline.return_value = ""
+            process.returncode = 0
+            return process
+
+        mock_popen.side_effect = fake_ffmpeg
+
+        output = render_and_concat(
+            self.script_file, self.temp_dir, "final.mp4", render_workers=4, shard_scenes=True
+        )
+
+        self.assertIsNotNone(output)
+        shard_commands = [
+            call.args[1] for call in mock_run_scene.call_args_list if "-n" in call.args[1]
+        ]
+        ranges = sorted(command[command.index("-n") + 1] for command in shard_commands)
+        self.assertEqual(ranges, ["0,9", "10,19", "20,29", "30"])
+        shard_list = concat_lists["SecondScene.mp4"]
+        self.assertEqual(len(shard_list), 4)
+        for index, line in enumerate(shard_list):
+            self.assertIn(f"SecondScene_{index}", line)
+        self.assertEqual(len(concat_lists["final.mp4"]), 3)
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, "shards")))
+
+    @patch("manim_generator.utils.video.subprocess.run")
+    @patch("manim_generator.utils.video.subprocess.Popen")
+    @patch("manim_generator.utils.video._run_scene_command")
+    def test_promoted_clips_skip_rendering(self, mock_run_scene, mock_popen, mock_run):
+        """When every scene has a promoted clip, the clips are concatenated as they are."""
+        clips = {
+            scene: os.path.join(self.temp_dir, f"kept_{scene}.mp4")
+            for scene in ["FirstScene", "SecondScene", "ThirdScene"]
+        }
+        concat_lists = []
+
+        def fake_ffmpeg(command, **kwargs):
+            with open(command[command.index("-i") + 1], encoding="utf-8") as f:
+                concat_lists.append(f.read().splitlines())
+            process = MagicMock()
+            process.stdout.readline.return_value = ""
+            process.returncode = 0
+            return process
+
+        mock_popen.side_effect = fake_ffmpeg
+
+        output = render_and_concat(self.script_file, self.temp_dir, "final.mp4", clips=clips)
+
+        self.assertIsNotNone(output)
+        mock_run_scene.assert_not_called()
+        self.assertEqual(concat_lists[0], [f"file '{clip}'" for clip in clips.values()])
+
+    @patch("manim_generator.utils.video.subprocess.Popen")
+    @patch("manim_generator.utils.video.probe_video")
+    def test_concat_refuses_mismatched_streams(self, mock_probe, mock_popen):
+        """Videos whose streams differ are not stream-copied into a broken file."""
+        mock_probe.side_effect = [
+            VideoInfo(2.0, 1920, 1080, 60.0, 120),
+            VideoInfo(2.0, 1280, 720, 60.0, 120),
+        ]
+        concat_list = os.path.join(self.temp_dir, "list.txt")
+
+        with self.assertLogs("manim_generator.utils.video", level="ERROR"):
+            ok = _concat_videos(["a.mp4", "b.mp4"], "out.mp4", concat_list)
+
+        self.assertFalse(ok)
+        mock_popen.assert_not_called()
+
+
+class TestDurationAdjustment(unittest.TestCase):
+    """Test cases for the single-pass duration adjustment."""
+
+    def test_plan_extend_trim_keep(self):
+        """Short videos are extended (capped at max), long ones trimmed, others kept."""
+        self.assertEqual(
+            plan_duration_adjustment(12.0, 60.0, 180.0), DurationPlan("extend", 60.0, 12.0)
+        )
+        self.assertEqual(plan_duration_adjustment(12.0, 60.0, 30.0).target_duration, 30.0)
+        self.assertEqual(plan_duration_adjustment(200.0, 60.0, 180.0).action, "trim")
+        self.assertEqual(plan_duration_adjustment(90.0, 60.0, 180.0).action, "keep")
+        self.assertEqual(plan_duration_adjustment(90.0, None, 180.0).action, "keep")
+
+    def test_loop_command_reaches_target_in_one_pass(self):
+        """Looping repeats the input just enough times and cuts at the target."""
+        command = build_duration_command("in.mp4", "out.mp4", DurationPlan("extend", 60.0, 12.5))
+
+        self.assertEqual(command[command.index("-stream_loop") + 1], "4")
+        self.assertEqual(command[command.index("-t") + 1], "60.000")
+        self.assertIn("copy", command)
+        self.assertEqual(command[-1], "out.mp4")
+
+    def test_freeze_command_pads_last_frame(self):
+        """Freezing holds the last frame for the missing duration."""
+        plan = DurationPlan("extend", 60.0, 12.0)
+        command = build_duration_command("in.mp4", "out.mp4", plan, extend_mode="freeze")
+
+        self.assertNotIn("-stream_loop", command)
+        self.assertIn("tpad=stop_mode=clone:stop_duration=48.000", command)
+
+    @patch("manim_generator.utils.video.get_video_duration", return_value=12.0)
+    @patch("manim_generator.utils.video.subprocess.run")
+    def test_failed_adjustment_leaves_no_files(self, mock_run, mock_duration):
+        """A failed ffmpeg run removes its temporary output and keeps the input."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        video_path = os.path.join(temp_dir, "video.mp4")
+        with open(video_path, "wb") as f:
+            f.write(b"video")
+        mock_run.return_value = MagicMock(returncode=1, stderr="boom")
+
+        self.assertIsNone(adjust_video_duration(video_path, 60.0, 180.0))
+        self.assertEqual(os.listdir(temp_dir), ["video.mp4"])
+        mock_duration.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
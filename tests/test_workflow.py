@@ -4,13 +4,13 @@ import os
 import shutil
 import tempfile
 import unittest
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from rich.console import Console
 
 from manim_generator.artifacts import ArtifactManager
 from manim_generator.utils.usage import TokenUsageTracker
-from manim_generator.workflow import ManimWorkflow
+from manim_generator.workflow import AsyncManimWorkflow, ManimWorkflow
 
 
 class TestManimWorkflow(unittest.TestCase):
@@ -78,6 +78,100 @@ class TestManimWorkflow(unittest.TestCase):
         self.assertIsInstance(conversation, list)
         mock_get_response.assert_called_once()
 
+    @patch("manim_generator.workflow.check_and_register_models")
+    def test_requests_start_with_a_cacheable_prefix(self, mock_check):
+        """Revisions reuse the initial system message, reviews keep the code out of theirs."""
+        workflow = ManimWorkflow(config=self.config, console=self.console)
+        code = "from manim import *\n\nclass A(Scene):\n    pass\n"
+
+        initial = workflow._initial_code_request("Test video prompt")
+        revision, _ = workflow._code_revision_request(code, "Add a title", "Test video prompt", 1)
+        first_review, _ = workflow._review_request(code, "logs", [], [], 1, ["A"])
+        second_review, _ = workflow._review_request(code, "logs", [], ["Fine"], 2, ["A"])
+
+        self.assertEqual(revision["messages"][0], initial["messages"][0])
+        self.assertEqual(first_review["messages"][0], second_review["messages"][0])
+        for request in (initial, revision, first_review):
+            system_block = request["messages"][0]["content"][0]
+            self.assertEqual(system_block["cache_control"], {"type": "ephemeral"})
+        self.assertNotIn("class A(Scene)", first_review["messages"][0]["content"][0]["text"])
+        self.assertIn("class A(Scene)", first_review["messages"][1]["content"][0]["text"])
+
+    @patch("manim_generator.workflow.check_and_register_models")
+    @patch("manim_generator.workflow.run_manim_multiscene")
+    def test_auto_execution_mode_switches_to_full_renders(self, mock_run, mock_check):
+        """Auto mode validates first and renders videos once the threshold is met."""
+        code = "from manim import *\n\nclass A(Scene):\n    pass\n\nclass B(Scene):\n    pass\n"
+        modes = []
+
+        def fake_run(*args, execution_mode, **kwargs):
+            modes.append(execution_mode)
+            scenes = ["A", "B"] if len(modes) > 1 else ["A"]
+            return len(scenes) == 2, [], "", scenes
+
+        mock_run.side_effect = fake_run
+        self.config.update(execution_mode="auto", success_threshold=50.0)
+        workflow = ManimWorkflow(config=self.config, console=self.console)
+
+        workflow.execute_code(code, "Initial Execution")
+
+        self.assertEqual(modes, ["validate", "full"])
+        self.assertEqual(workflow.execution_history[-1]["execution_mode"], "full")
+        self.assertEqual(workflow.execution_count, 1)
+
+
+class TestAsyncManimWorkflow(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the async workflow used by the API."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config = {
+            "manim_model": "gpt-4",
+            "review_model": "gpt-4",
+            "temperature": 0.4,
+            "review_cycles": 1,
+            "output_dir": self.temp_dir,
+            "streaming": False,
+            "manim_logs": False,
+            "vision_enabled": False,
+            "success_threshold": 80.0,
+            "reasoning": None,
+            "provider": None,
+            "headless": False,
+        }
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    @patch("manim_generator.workflow.check_and_register_models")
+    @patch("manim_generator.workflow.run_manim_multiscene")
+    @patch("manim_generator.workflow.get_response_with_status_async", new_callable=AsyncMock)
+    async def test_review_cycle_awaits_llm_and_executions(self, mock_response, mock_run, _):
+        """A review cycle awaits the review, the revision and its execution."""
+        code = "from manim import *\n\nclass A(Scene):\n    pass\n"
+        usage = {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15, "cost": 0.0}
+        mock_response.side_effect = [
+            ("Looks good", usage, None),
+            (f"```python\n{code}```", usage, None),
+        ]
+        mock_run.return_value = (True, [], "", ["A"])
+        workflow = AsyncManimWorkflow(config=self.config, console=Console())
+
+        final_code, working_code, _ = await workflow.review_and_update_code(
+            code, "", [], "A video", ["A"]
+        )
+
+        self.assertEqual(final_code.strip(), code.strip())
+        self.assertEqual(working_code, final_code)
+        self.assertEqual(mock_response.await_count, 2)
+        self.assertEqual(workflow.execution_count, 1)
+        self.assertEqual(
+            [step["step"] for step in workflow.usage_tracker.get_tracking_data()["steps"]],
+            ["Review Cycle 1", "Code Revision 1"],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()